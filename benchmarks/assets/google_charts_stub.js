@@ -0,0 +1,301 @@
+/**
+ * A minimal stand-in for the Google Charts loader used by the benchmarks.
+ *
+ * Defining window.google before the charts mount stops the real loader being
+ * fetched, so the benchmarks run offline and measure the time spent in
+ * dash-google-charts rather than in Google Charts or on the network. Drawing
+ * walks every cell of the DataTable, which is the minimum any real chart has
+ * to do, and records a timestamp in window.benchmarkDraws.
+ */
+(function() {
+  function DataTable(data) {
+    this.cols = [];
+    this.rows = [];
+    if (typeof data === 'string') {
+      data = JSON.parse(data);
+    }
+    if (data) {
+      data.cols.forEach(col => this.addColumn(col));
+      this.rows = (data.rows || []).map(row =>
+        row.c.map(cell => (cell ? {v: cell.v, f: cell.f} : {v: null}))
+      );
+    }
+  }
+
+  DataTable.prototype = {
+    addColumn: function(column, label, id) {
+      if (typeof column === 'string') {
+        column = {type: column, label: label, id: id};
+      }
+      this.cols.push(Object.assign({label: '', id: ''}, column));
+      this.rows.forEach(row => row.push({v: null}));
+      return this.cols.length - 1;
+    },
+    addRows: function(rows) {
+      if (typeof rows === 'number') {
+        rows = Array.from(Array(rows), () => []);
+      }
+      rows.forEach(row => this.addRow(row));
+      return this.rows.length - 1;
+    },
+    addRow: function(row = []) {
+      this.rows.push(this.cols.map((col, j) => ({v: cellValue(row[j])})));
+      return this.rows.length - 1;
+    },
+    insertRows: function(index, rows) {
+      const newRows = rows.map(row =>
+        this.cols.map((col, j) => ({v: cellValue(row[j])}))
+      );
+      this.rows.splice(index, 0, ...newRows);
+    },
+    removeRows: function(index, count) {
+      this.rows.splice(index, count);
+    },
+    getNumberOfRows: function() {
+      return this.rows.length;
+    },
+    getNumberOfColumns: function() {
+      return this.cols.length;
+    },
+    getColumnId: function(column) {
+      return this.cols[column].id;
+    },
+    getColumnLabel: function(column) {
+      return this.cols[column].label;
+    },
+    getColumnType: function(column) {
+      return this.cols[column].type;
+    },
+    getValue: function(row, column) {
+      return this.rows[row][column].v;
+    },
+    setValue: function(row, column, value) {
+      this.rows[row][column] = {v: value};
+    },
+    setCell: function(row, column, value, formattedValue) {
+      this.rows[row][column] = {v: value, f: formattedValue};
+    },
+    setFormattedValue: function(row, column, formattedValue) {
+      this.rows[row][column].f = formattedValue;
+    },
+    setProperty: function(row, column, name, value) {
+      const cell = this.rows[row][column];
+      cell.p = Object.assign({}, cell.p, {[name]: value});
+    },
+    getFilteredRows: function(filters) {
+      return this.rows
+        .map((row, index) => index)
+        .filter(index =>
+          filters.every(({column, value, minValue, maxValue}) => {
+            const cell = this.getValue(index, column);
+            return (
+              (value === undefined || cell === value) &&
+              (minValue === undefined || cell >= minValue) &&
+              (maxValue === undefined || cell <= maxValue)
+            );
+          })
+        );
+    },
+    clone: function() {
+      const copy = new DataTable();
+      copy.cols = this.cols.map(col => Object.assign({}, col));
+      copy.rows = this.rows.map(row =>
+        row.map(cell => Object.assign({}, cell))
+      );
+      return copy;
+    },
+    toJSON: function() {
+      return JSON.stringify({
+        cols: this.cols,
+        rows: this.rows.map(row => ({c: row}))
+      });
+    }
+  };
+
+  function cellValue(value) {
+    if (value && typeof value === 'object' && !(value instanceof Date)) {
+      return value.v;
+    }
+    return value === undefined ? null : value;
+  }
+
+  function DataView(dataTable) {
+    this.table = dataTable;
+    this.rowIndices = null;
+    this.columns = null;
+  }
+
+  DataView.prototype = {
+    setRows: function(rows) {
+      this.rowIndices = rows;
+    },
+    setColumns: function(columns) {
+      this.columns = columns;
+    },
+    getNumberOfRows: function() {
+      return this.rowIndices
+        ? this.rowIndices.length
+        : this.table.getNumberOfRows();
+    },
+    getNumberOfColumns: function() {
+      return this.columns
+        ? this.columns.length
+        : this.table.getNumberOfColumns();
+    },
+    getValue: function(row, column) {
+      const tableRow = this.rowIndices ? this.rowIndices[row] : row;
+      const source = this.columns ? this.columns[column] : column;
+      if (typeof source === 'number') {
+        return this.table.getValue(tableRow, source);
+      }
+      if (source.calc === 'stringify') {
+        return String(this.table.getValue(tableRow, source.sourceColumn));
+      }
+      return source.calc(this.table, tableRow);
+    },
+    getColumnType: function(column) {
+      const source = this.columns ? this.columns[column] : column;
+      return typeof source === 'number'
+        ? this.table.getColumnType(source)
+        : source.type || 'string';
+    },
+    toDataTable: function() {
+      const dataTable = new DataTable();
+      for (let j = 0; j < this.getNumberOfColumns(); j++) {
+        dataTable.addColumn(this.getColumnType(j));
+      }
+      for (let i = 0; i < this.getNumberOfRows(); i++) {
+        const row = [];
+        for (let j = 0; j < this.getNumberOfColumns(); j++) {
+          row.push(this.getValue(i, j));
+        }
+        dataTable.addRow(row);
+      }
+      return dataTable;
+    }
+  };
+
+  const listeners = new Map();
+
+  const events = {
+    addListener: function(target, name, handler) {
+      if (!listeners.has(target)) {
+        listeners.set(target, []);
+      }
+      listeners.get(target).push({name: name, handler: handler});
+    },
+    removeAllListeners: function(target) {
+      listeners.delete(target);
+    },
+    trigger: function(target, name, args) {
+      (listeners.get(target) || [])
+        .filter(listener => listener.name === name)
+        .forEach(listener => listener.handler(args));
+    }
+  };
+
+  function Chart() {}
+
+  Chart.prototype = {
+    getSelection: function() {
+      return [];
+    },
+    clearChart: function() {},
+    computeDiff: function(oldData, newData) {
+      return newData;
+    }
+  };
+
+  function ChartWrapper() {
+    this.chart = new Chart();
+  }
+
+  ChartWrapper.prototype = {
+    setChartType: function(chartType) {
+      this.chartType = chartType;
+    },
+    setOptions: function(options) {
+      this.options = options;
+    },
+    setDataTable: function(dataTable) {
+      this.dataTable = dataTable;
+    },
+    getDataTable: function() {
+      return this.dataTable;
+    },
+    getChart: function() {
+      return this.chart;
+    },
+    draw: function(container) {
+      const dataTable = this.dataTable;
+      let cells = 0;
+      for (let i = 0; i < dataTable.getNumberOfRows(); i++) {
+        for (let j = 0; j < dataTable.getNumberOfColumns(); j++) {
+          if (dataTable.getValue(i, j) !== null) {
+            cells++;
+          }
+        }
+      }
+      container.setAttribute('data-cells', cells);
+      window.benchmarkDraws.push({
+        id: container.id,
+        time: window.performance.now()
+      });
+      setTimeout(() => events.trigger(this, 'ready'), 0);
+    }
+  };
+
+  const visualization = {
+    DataTable: DataTable,
+    DataView: DataView,
+    ChartWrapper: ChartWrapper,
+    events: events,
+    arrayToDataTable: function(rows) {
+      const dataTable = new DataTable();
+      rows[0].forEach(label =>
+        dataTable.addColumn(
+          typeof label === 'object' ? label : {type: 'number', label: label}
+        )
+      );
+      dataTable.addRows(rows.slice(1));
+      return dataTable;
+    }
+  };
+
+  [
+    'AreaChart',
+    'BarChart',
+    'BubbleChart',
+    'Calendar',
+    'CandlestickChart',
+    'ColumnChart',
+    'ComboChart',
+    'GanttChart',
+    'Gauge',
+    'GeoChart',
+    'Histogram',
+    'LineChart',
+    'OrgChart',
+    'PieChart',
+    'Sankey',
+    'ScatterChart',
+    'SteppedAreaChart',
+    'Table',
+    'Timeline',
+    'TreeMap',
+    'WordTree'
+  ].forEach(chartType => {
+    visualization[chartType] = Chart;
+  });
+
+  window.benchmarkDraws = [];
+  window.google = {
+    charts: {
+      load: function() {},
+      setOnLoadCallback: function(callback) {
+        setTimeout(callback, 0);
+      }
+    },
+    visualization: visualization
+  };
+})();
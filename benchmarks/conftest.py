@@ -0,0 +1,151 @@
+"""
+Shared configuration for the benchmarks.
+
+Every benchmark is parametrized over the chart components and a number of
+rows. Use --rows to choose the sizes, e.g. `--rows 1000,10000`, since the
+largest sizes take a long time in the browser benchmarks.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+ROWS = [1_000, 10_000, 100_000, 1_000_000]
+
+COMPONENTS = [
+    "AreaChart",
+    "BarChart",
+    "BubbleChart",
+    "Calendar",
+    "CandlestickChart",
+    "ColumnChart",
+    "ComboChart",
+    "GanttChart",
+    "Gauge",
+    "GeoChart",
+    "Histogram",
+    "LineChart",
+    "OrgChart",
+    "PieChart",
+    "Sankey",
+    "ScatterChart",
+    "SteppedAreaChart",
+    "Table",
+    "Timeline",
+    "TreeMap",
+    "WordTree",
+]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--rows",
+        default=",".join(str(rows) for rows in ROWS),
+        help="Comma separated numbers of rows to benchmark with.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "rows" in metafunc.fixturenames:
+        rows = [
+            int(value)
+            for value in metafunc.config.getoption("rows").split(",")
+        ]
+        metafunc.parametrize("rows", rows)
+    if "component" in metafunc.fixturenames:
+        metafunc.parametrize("component", COMPONENTS)
+
+
+def sample_data(component, rows, seed=0):
+    """
+    A DataFrame of the given length with the columns the component expects.
+    """
+    rng = np.random.default_rng(seed)
+    index = np.arange(rows)
+    values = rng.normal(size=rows).cumsum()
+    labels = pd.Categorical.from_codes(
+        index % 100, ["item {}".format(i) for i in range(100)]
+    )
+    dates = pd.Timestamp("2000-01-01") + pd.to_timedelta(index, unit="h")
+
+    if component in ("Calendar",):
+        return pd.DataFrame({"date": dates, "value": values})
+    if component == "CandlestickChart":
+        low = values - rng.random(rows)
+        high = values + rng.random(rows)
+        return pd.DataFrame(
+            {
+                "x": index,
+                "low": low,
+                "open": values,
+                "close": np.roll(values, -1),
+                "high": high,
+            }
+        )
+    if component == "BubbleChart":
+        return pd.DataFrame(
+            {
+                "id": labels,
+                "x": index,
+                "y": values,
+                "size": rng.random(rows),
+            }
+        )
+    if component == "GanttChart":
+        return pd.DataFrame(
+            {
+                "id": index.astype(str),
+                "name": labels,
+                "start": dates,
+                "end": dates + pd.Timedelta(days=1),
+                "duration": np.full(rows, np.nan),
+                "complete": rng.random(rows) * 100,
+                "dependencies": np.full(rows, None),
+            }
+        )
+    if component == "Timeline":
+        return pd.DataFrame(
+            {
+                "name": labels,
+                "start": dates,
+                "end": dates + pd.Timedelta(hours=12),
+            }
+        )
+    if component in ("OrgChart", "TreeMap"):
+        parents = (index - 1) // 2
+        frame = pd.DataFrame(
+            {
+                "id": index.astype(str),
+                "parent": np.where(index > 0, parents.astype(str), None),
+            }
+        )
+        if component == "TreeMap":
+            frame["size"] = rng.random(rows)
+        return frame
+    if component == "Sankey":
+        return pd.DataFrame(
+            {
+                "from": labels,
+                "to": pd.Categorical.from_codes(
+                    (index + 1) % 100, labels.categories
+                ),
+                "weight": rng.random(rows),
+            }
+        )
+    if component == "WordTree":
+        return pd.DataFrame(
+            {"phrase": ["the quick brown fox {}".format(i) for i in index]}
+        )
+    if component in ("GeoChart", "PieChart", "Gauge"):
+        return pd.DataFrame({"label": labels, "value": np.abs(values)})
+    if component == "Table":
+        return pd.DataFrame(
+            {"name": labels, "date": dates, "value": values, "flag": index % 2}
+        )
+    return pd.DataFrame(
+        {"x": index, "a": values, "b": values * 2, "c": values[::-1]}
+    )
+
+
+@pytest.fixture
+def data(component, rows):
+    return sample_data(component, rows)
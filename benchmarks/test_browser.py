@@ -0,0 +1,112 @@
+"""
+End-to-end benchmarks in headless Chrome using Dash's testing tools.
+
+The Google Charts loader is replaced by the stub in assets/, so the timings
+cover fetching and decoding the data, building the DataTable and handing it
+to the chart, but not Google's own rendering. Alongside the wall clock time of
+each round, the time measured in the browser is recorded in the report as
+`browser_ms`: for the first draw this is the time since navigation started,
+and for updates the time from clicking the update button to the redraw.
+"""
+import os
+
+import dash
+import dash_google_charts as dgc
+import dash_html_components as html
+import pytest
+from dash.dependencies import Input, Output
+from test_serialization import ENCODINGS
+
+ASSETS = os.path.join(os.path.dirname(__file__), "assets")
+
+ROUNDS = 5
+
+SCRIPT_TIMEOUT = 600
+
+# resolves with the time of the first draw after the given number of draws
+WAIT_FOR_DRAW = """
+const [count, done] = arguments;
+(function poll() {
+  if (window.benchmarkDraws && window.benchmarkDraws.length > count) {
+    done(window.benchmarkDraws[count].time);
+  } else {
+    setTimeout(poll, 0);
+  }
+})();
+"""
+
+# clicks the update button and resolves with the time taken to redraw
+CLICK_AND_WAIT_FOR_DRAW = """
+const done = arguments[0];
+const count = window.benchmarkDraws.length;
+const start = window.performance.now();
+document.getElementById('update').click();
+(function poll() {
+  if (window.benchmarkDraws.length > count) {
+    done(window.benchmarkDraws[count].time - start);
+  } else {
+    setTimeout(poll, 0);
+  }
+})();
+"""
+
+
+def make_app(component, data, encoding):
+    convert = ENCODINGS[encoding]
+    # alternate between two versions of the data so that every update
+    # changes the data and can't be skipped as a no-op
+    payloads = [convert(data), convert(data.iloc[::-1])]
+
+    app = dash.Dash(__name__, assets_folder=ASSETS)
+    app.layout = html.Div(
+        [
+            html.Button("Update", id="update"),
+            getattr(dgc, component)(id="chart", data=payloads[0]),
+        ]
+    )
+
+    @app.callback(Output("chart", "data"), [Input("update", "n_clicks")])
+    def update(n_clicks):
+        if not n_clicks:
+            raise dash.exceptions.PreventUpdate
+        return payloads[n_clicks % 2]
+
+    return app
+
+
+@pytest.fixture
+def browser(dash_duo):
+    dash_duo.driver.set_script_timeout(SCRIPT_TIMEOUT)
+    return dash_duo
+
+
+@pytest.mark.parametrize("encoding", list(ENCODINGS))
+def test_first_draw(benchmark, browser, component, rows, data, encoding):
+    browser.start_server(make_app(component, data, encoding))
+    driver = browser.driver
+    times = []
+
+    def load():
+        driver.get(browser.server_url)
+        times.append(driver.execute_async_script(WAIT_FOR_DRAW, 0))
+
+    benchmark.pedantic(load, rounds=ROUNDS, iterations=1)
+
+    benchmark.group = "first-draw-{}".format(rows)
+    benchmark.extra_info["browser_ms"] = times
+
+
+@pytest.mark.parametrize("encoding", list(ENCODINGS))
+def test_update(benchmark, browser, component, rows, data, encoding):
+    browser.start_server(make_app(component, data, encoding))
+    driver = browser.driver
+    driver.execute_async_script(WAIT_FOR_DRAW, 0)
+    times = []
+
+    def update():
+        times.append(driver.execute_async_script(CLICK_AND_WAIT_FOR_DRAW))
+
+    benchmark.pedantic(update, rounds=ROUNDS, iterations=1)
+
+    benchmark.group = "update-{}".format(rows)
+    benchmark.extra_info["browser_ms"] = times
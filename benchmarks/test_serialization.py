@@ -0,0 +1,28 @@
+"""
+Benchmarks of the Python side of an update: converting the data and encoding
+the component the way Dash does before sending it to the browser. The size of
+the encoded payload is recorded in the report as `payload_bytes`.
+"""
+import dash_google_charts as dgc
+import pytest
+from dash_google_charts import dataframe_to_columnar, dataframe_to_datatable
+from plotly.io.json import to_json_plotly
+
+ENCODINGS = {
+    "datatable": dataframe_to_datatable,
+    "columnar": dataframe_to_columnar,
+}
+
+
+@pytest.mark.parametrize("encoding", list(ENCODINGS))
+def test_serialization(benchmark, component, rows, data, encoding):
+    convert = ENCODINGS[encoding]
+    Component = getattr(dgc, component)
+
+    def serialise():
+        return to_json_plotly(Component(id="chart", data=convert(data)))
+
+    payload = benchmark(serialise)
+
+    benchmark.group = "serialization-{}".format(rows)
+    benchmark.extra_info["payload_bytes"] = len(payload.encode("utf-8"))
@@ -1,7 +1,15 @@
+import functools
 import os
 
 from . import _components
 from ._components import *  # noqa
+from ._data import (  # noqa
+    RawJSON,
+    dataframe_to_columnar,
+    dataframe_to_datatable,
+    prepare_data,
+)
+from ._patch import compute_patch  # noqa
 from ._version import __version__  # noqa
 
 _current_path = os.path.dirname(os.path.abspath(__file__))
@@ -15,10 +23,108 @@ _js_dist = [
     }
 ]
 
+# code-split chunks, only fetched by the browser when they are needed. Dash
+# adds a fingerprint to the URL and serves them with long-lived caching
+_async_chunks = ["dash_google_charts-chart.js"]
+
+_js_dist.extend(
+    {
+        "relative_package_path": "_components/{}".format(chunk),
+        "namespace": "dash_google_charts",
+        "async": True,
+    }
+    for chunk in _async_chunks
+)
+
 _css_dist = []
 
+# directory a pinned copy of the Google Charts library is downloaded to by
+# `python -m dash_google_charts.vendor`
+_LIBRARY_PATH = "_library"
+
+
+def use_local_library():
+    """
+    Serve the copy of the Google Charts library downloaded with
+    `python -m dash_google_charts.vendor` from the Dash app, instead of
+    fetching it from gstatic. Call before the app's first request.
+
+    The loader is included in the page with a fingerprinted URL, so that it
+    is cached by the browser until the package is updated. The packages are
+    fetched by the loader when they are needed.
+    """
+    library = os.path.join(_current_path, _LIBRARY_PATH)
+    if not os.path.isfile(os.path.join(library, "loader.js")):
+        raise IOError(
+            "No copy of the Google Charts library found in {}, download one "
+            "with `python -m dash_google_charts.vendor VERSION`".format(
+                library
+            )
+        )
+    loader_path = "{}/loader.js".format(_LIBRARY_PATH)
+    if any(
+        resource["relative_package_path"] == loader_path
+        for resource in _js_dist
+    ):
+        return
+
+    # the loader is included before the components, which then find
+    # google.charts already defined rather than injecting the gstatic loader
+    _js_dist.insert(
+        0,
+        {
+            "relative_package_path": loader_path,
+            "namespace": "dash_google_charts",
+        },
+    )
+    for directory, _, filenames in sorted(os.walk(library)):
+        for filename in sorted(filenames):
+            path = os.path.relpath(
+                os.path.join(directory, filename), _current_path
+            ).replace(os.sep, "/")
+            if path != loader_path:
+                # dynamic resources are served by Dash but not put in the page
+                _js_dist.append(
+                    {
+                        "relative_package_path": path,
+                        "namespace": "dash_google_charts",
+                        "dynamic": True,
+                    }
+                )
+
+
+# components that accept the max_points and downsample keyword arguments
+_DOWNSAMPLED_COMPONENTS = ["AreaChart", "LineChart", "ScatterChart"]
+
+
+def _wrap_init(init, downsampled=False):
+    """
+    Wrap a component's __init__ so that props such as `data` can be passed
+    values (e.g. DataFrames) that need converting before Dash serialises them.
+    If downsampled is True the wrapped __init__ also accepts max_points and
+    downsample keyword arguments, which are used to reduce the data on the
+    server before it is sent to the browser.
+    """
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        options = {}
+        if downsampled:
+            options["max_points"] = kwargs.pop("max_points", None)
+            options["downsample"] = kwargs.pop("downsample", "lttb")
+            options["width"] = kwargs.get("width")
+        if "data" in kwargs:
+            kwargs["data"] = prepare_data(kwargs["data"], **options)
+        init(self, *args, **kwargs)
+
+    return __init__
+
 
 for _component_name in _components.__all__:
     _component = getattr(_components, _component_name)
     _component._js_dist = _js_dist
     _component._css_dist = _css_dist
+    _component.__init__ = _wrap_init(
+        _component.__init__,
+        downsampled=_component_name in _DOWNSAMPLED_COMPONENTS,
+    )
@@ -0,0 +1,419 @@
+"""
+Helpers for converting tabular data into the formats accepted by the `data`
+prop of the chart components.
+"""
+import base64
+import json
+import sys
+from itertools import repeat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# translation table escaping the characters that are not allowed to appear
+# unescaped inside a JSON string
+_JSON_ESCAPES = {i: "\\u{:04x}".format(i) for i in range(32)}
+_JSON_ESCAPES.update({ord('"'): '\\"', ord("\\"): "\\\\"})
+
+
+class RawJSON(str):
+    """
+    Data that has already been serialised to JSON, e.g. by
+    `gviz_api.DataTable.ToJSon` or `orjson.dumps`.
+
+    Dash sends it to the browser as a single string rather than encoding a
+    Python object for every row and cell, and the chart parses it once when
+    building the DataTable. Accepts either str or UTF-8 encoded bytes, and can
+    be passed to `data` both in the layout and from callbacks. The JSON can be
+    a DataTable literal, a list of rows or the columnar encoding.
+    """
+
+    def __new__(cls, value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = bytes(value).decode("utf-8")
+        return super(RawJSON, cls).__new__(cls, value)
+
+
+def is_dataframe(obj):
+    """
+    Check whether obj is a pandas DataFrame without importing pandas. If pandas
+    has not been imported then obj can't be a DataFrame.
+    """
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+def dataframe_to_datatable(df, index=False, formatters=None):
+    """
+    Convert a pandas DataFrame into a Google Charts DataTable literal.
+
+    Each column is serialised in one vectorized pass according to its dtype.
+    Numeric and boolean columns become "number" and "boolean" columns,
+    datetime64 columns become "datetime" columns with "Date(...)" values,
+    timedelta64 columns become "number" columns in milliseconds, and
+    everything else (including categoricals) becomes a "string" column. Missing
+    values are mapped to null. Timezone aware datetimes are drawn at their wall
+    clock time in their own timezone, whatever the browser's timezone is.
+
+    The literal is returned already serialised as a JSON string, which Google
+    Charts parses directly when constructing the DataTable. This avoids
+    building a Python object for every cell and having Dash encode them all
+    again.
+
+    :param df: The DataFrame to convert.
+    :param index: If True, the index is included as the first column.
+    :param formatters: Formatter specifications, in the format accepted by
+        the `formatters` prop, to apply on the server. See
+        `dash_google_charts.formatting`.
+    :returns: A `RawJSON` string with "cols" and "rows" keys that can be
+        passed directly to the `data` prop of any chart.
+    """
+    if index:
+        df = df.reset_index()
+    formatted = _format_dataframe(df, formatters)
+
+    cols = []
+    columns = []
+    templates = []
+    for position, (name, series) in enumerate(df.items()):
+        column_type, values = _serialise_series(series)
+        cols.append({"id": str(name), "label": str(name), "type": column_type})
+        if position in formatted:
+            columns.append(_formatted_cells(values, **formatted[position]))
+            templates.append("{{{}}}")
+        else:
+            columns.append(values)
+            templates.append('{{"v":{}}}')
+
+    if len(df) and columns:
+        row_template = ",".join(templates)
+        rows = '{{"c":[{}]}}'.format(
+            ']},{"c":['.join(map(row_template.format, *columns))
+        )
+    else:
+        rows = ""
+    return RawJSON('{{"cols":{},"rows":[{}]}}'.format(json.dumps(cols), rows))
+
+
+def dataframe_to_columnar(df, index=False, formatters=None):
+    """
+    Convert a pandas DataFrame into the compact columnar encoding understood
+    by the chart components.
+
+    Rather than repeating structure for every cell, each column is sent as a
+    single block. Numeric, datetime64 and timedelta64 columns are packed into
+    base64 encoded little-endian Float64 (or Int32) buffers, while string and
+    categorical columns are dictionary encoded as a list of distinct values
+    plus a packed Int32 buffer of codes. The browser decodes the buffers
+    straight into a DataTable without building intermediate row arrays.
+    Datetimes are drawn the same way as by `dataframe_to_datatable`.
+
+    Formatted values and cell styles computed from formatters are dictionary
+    encoded in the same way, so each distinct string is only sent once.
+
+    :param df: The DataFrame to convert.
+    :param index: If True, the index is included as the first column.
+    :param formatters: Formatter specifications, in the format accepted by
+        the `formatters` prop, to apply on the server. See
+        `dash_google_charts.formatting`.
+    :returns: A dictionary that can be passed to the `data` prop of any chart.
+    """
+    if index:
+        df = df.reset_index()
+    formatted = _format_dataframe(df, formatters)
+
+    cols = [_encode_series(name, series) for name, series in df.items()]
+    for position, result in formatted.items():
+        for key in ("formatted", "style"):
+            if result[key] is not None:
+                cols[position][key] = _dictionary_strings(result[key])
+    return {"format": "columnar", "length": len(df), "cols": cols}
+
+
+def prepare_data(data, max_points=None, downsample="lttb", width=None):
+    """
+    Convert the value of a `data` prop into something Dash can serialise,
+    optionally downsampling it first.
+
+    :param data: The value of the `data` prop.
+    :param max_points: If set, a DataFrame is downsampled to at most this many
+        points per series. Can be set to "auto" to choose the number of points
+        from the width of the chart.
+    :param downsample: The downsampling method, either "lttb" or "minmax".
+    :param width: The width of the chart, used when max_points is "auto".
+    """
+    if max_points is not None:
+        if not is_dataframe(data):
+            raise TypeError("max_points can only be used with a DataFrame.")
+        from .downsample import (
+            DEFAULT_MAX_POINTS,
+            downsample_dataframe,
+            max_points_for_width,
+        )
+
+        if max_points == "auto":
+            max_points = max_points_for_width(width) or DEFAULT_MAX_POINTS
+        data = downsample_dataframe(data, max_points, method=downsample)
+    if is_dataframe(data):
+        return dataframe_to_datatable(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return RawJSON(data)
+    return data
+
+
+def _format_dataframe(df, formatters):
+    if not formatters:
+        return {}
+    from .formatting import format_dataframe
+
+    return format_dataframe(df, formatters)
+
+
+def _formatted_cells(values, formatted, style):
+    """
+    Combine JSON encoded values with formatted values and styles into the
+    contents of DataTable literal cells.
+    """
+    import numpy as np
+
+    cells = '"v":' + values
+    for key, strings in (("f", formatted), ("p", style)):
+        if strings is None:
+            continue
+        mask = np.array([value is not None for value in strings], dtype=bool)
+        encoded = _json_strings(strings[mask])
+        if key == "p":
+            encoded = '{"style":' + encoded + "}"
+        cells[mask] = cells[mask] + ',"{}":'.format(key) + encoded
+    return cells
+
+
+def _dictionary_strings(strings):
+    """
+    Dictionary encode an object array of strings, with None encoded as -1.
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(strings)
+    return {"dictionary": uniques.tolist(), "data": _pack(codes, "<i4")}
+
+
+def _serialise_series(series):
+    """
+    Convert a Series to a Google Charts column type and an object array of
+    JSON encoded values, with missing values encoded as null.
+    """
+    import numpy as np
+    import pandas as pd
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = _json_strings(series.cat.categories.astype(str))
+        codes = series.cat.codes.to_numpy()
+        return "string", _with_nulls(codes == -1, categories.take(codes))
+    if pd.api.types.is_bool_dtype(dtype):
+        values = series.to_numpy(dtype=bool, na_value=False)
+        strings = np.where(values, "true", "false").astype(object)
+        return "boolean", _with_nulls(series.isna().to_numpy(), strings)
+    if pd.api.types.is_numeric_dtype(dtype):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        if pd.api.types.is_integer_dtype(dtype) and _fits_int64(series):
+            strings = _to_strings(series.fillna(0).to_numpy(dtype=np.int64))
+        else:
+            strings = _to_strings(values)
+        return "number", _with_nulls(~np.isfinite(values), strings)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        strings = _date_strings(series)
+        strings = np.array(list(map('"{}"'.format, strings)), dtype=object)
+        return "datetime", _with_nulls(series.isna().to_numpy(), strings)
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        millis = series.dt.total_seconds().to_numpy() * 1000
+        return "number", _with_nulls(~np.isfinite(millis), _to_strings(millis))
+    mask = series.isna().to_numpy()
+    values = series.to_numpy(dtype=object, copy=True)
+    values[mask] = ""
+    return "string", _with_nulls(mask, _json_strings(values))
+
+
+def python_values(series):
+    """
+    Convert a Series to an object array of JSON serialisable Python values
+    using the same conversions as `dataframe_to_datatable`. Missing values
+    are mapped to None.
+    """
+    import numpy as np
+    import pandas as pd
+
+    dtype = series.dtype
+    mask = series.isna().to_numpy(copy=True)
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = series.astype(object).to_numpy(copy=True)
+        values[~mask] = [str(v) for v in values[~mask]]
+    elif pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(
+        dtype
+    ):
+        values = np.array(series.to_numpy(dtype=object).tolist(), dtype=object)
+        if pd.api.types.is_float_dtype(dtype):
+            mask |= ~np.isfinite(series.to_numpy(dtype=float))
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        values = _date_strings(series)
+    elif pd.api.types.is_timedelta64_dtype(dtype):
+        millis = series.dt.total_seconds().to_numpy() * 1000
+        values = np.array(millis.tolist(), dtype=object)
+    else:
+        values = series.to_numpy(dtype=object, copy=True)
+    values[mask] = None
+    return values
+
+
+def _to_strings(values):
+    """
+    Convert a numeric array to an object array of JSON numbers. Non-finite
+    values are not valid JSON and must be masked by the caller.
+    """
+    import numpy as np
+
+    if orjson is not None:
+        # orjson formats numeric arrays much faster than repr, and numbers
+        # never contain commas so the encoded array can be split safely
+        encoded = orjson.dumps(values, option=orjson.OPT_SERIALIZE_NUMPY)
+        strings = encoded.decode()[1:-1].split(",") if len(values) else []
+    else:
+        # repr gives the shortest representation that round-trips
+        strings = list(map(repr, values.tolist()))
+    return np.array(strings, dtype=object)
+
+
+def _json_strings(values):
+    """
+    JSON encode an array-like of strings.
+    """
+    import numpy as np
+
+    strings = map(str, values)
+    escaped = map(str.translate, strings, repeat(_JSON_ESCAPES))
+    return np.array(list(map('"{}"'.format, escaped)), dtype=object)
+
+
+def _with_nulls(mask, values):
+    if mask.any():
+        values[mask] = "null"
+    return values
+
+
+def _date_strings(series):
+    """
+    Format a datetime Series as "Date(y, m, d, h, m, s, ms)" strings. Months
+    are zero-indexed as they are in JavaScript.
+    """
+    import numpy as np
+
+    dt = series.dt
+    parts = [
+        dt.year,
+        dt.month - 1,
+        dt.day,
+        dt.hour,
+        dt.minute,
+        dt.second,
+        dt.microsecond // 1000,
+    ]
+    parts = [
+        part.fillna(0).to_numpy(dtype=np.int64).tolist() for part in parts
+    ]
+    template = "Date({}, {}, {}, {}, {}, {}, {})"
+    return np.array(list(map(template.format, *parts)), dtype=object)
+
+
+def _encode_series(name, series):
+    """
+    Encode a Series as a column of the columnar data format.
+    """
+    import numpy as np
+    import pandas as pd
+
+    col = {"id": str(name), "label": str(name)}
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        dictionary = series.cat.categories.astype(str).tolist()
+        col.update(_dictionary_column(codes, dictionary))
+    elif pd.api.types.is_bool_dtype(dtype):
+        values = series.to_numpy(dtype=object, copy=True)
+        values[series.isna().to_numpy()] = None
+        col.update(type="boolean", encoding="values", data=values.tolist())
+    elif pd.api.types.is_integer_dtype(dtype) and _fits_int32(series):
+        col.update(type="number", encoding="int32", data=_pack(series, "<i4"))
+    elif pd.api.types.is_numeric_dtype(dtype):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        col.update(
+            type="number", encoding="float64", data=_pack(values, "<f8")
+        )
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        mask = series.isna().to_numpy()
+        if getattr(dtype, "tz", None) is not None:
+            # wall clock times in the series' own timezone, as in the
+            # "Date(...)" values of dataframe_to_datatable
+            series = series.dt.tz_localize(None)
+        millis = series.to_numpy(dtype="datetime64[ms]").astype(np.int64)
+        millis = millis.astype(float)
+        millis[mask] = np.nan
+        col.update(
+            type="datetime", encoding="float64", data=_pack(millis, "<f8")
+        )
+    elif pd.api.types.is_timedelta64_dtype(dtype):
+        millis = series.dt.total_seconds().to_numpy() * 1000
+        col.update(
+            type="number", encoding="float64", data=_pack(millis, "<f8")
+        )
+    else:
+        codes, uniques = pd.factorize(series)
+        dictionary = [str(value) for value in uniques]
+        col.update(_dictionary_column(codes, dictionary))
+    return col
+
+
+def _dictionary_column(codes, dictionary):
+    return {
+        "type": "string",
+        "encoding": "dictionary",
+        "dictionary": dictionary,
+        "data": _pack(codes, "<i4"),
+    }
+
+
+def _fits_int64(series):
+    """
+    Whether the values of an integer Series fit in an int64, which unsigned
+    values of 2**63 and above don't. Those are sent as floats instead, which
+    is what JavaScript turns them into anyway.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not pd.api.types.is_unsigned_integer_dtype(series.dtype):
+        return True
+    return len(series) == 0 or series.max() <= np.iinfo(np.int64).max
+
+
+def _fits_int32(series):
+    import numpy as np
+
+    if series.hasnans:
+        return False
+    info = np.iinfo(np.int32)
+    return len(series) == 0 or (
+        series.min() >= info.min and series.max() <= info.max
+    )
+
+
+def _pack(values, dtype):
+    """
+    Pack an array into a base64 encoded buffer with the given dtype.
+    """
+    import numpy as np
+
+    buffer = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    return base64.b64encode(buffer).decode("ascii")
@@ -0,0 +1,106 @@
+"""
+Computing `data_patch` updates from the previous and next state of a table.
+"""
+from ._data import is_dataframe, python_values
+
+
+def compute_patch(previous, current, replace_threshold=0.5):
+    """
+    Compute the list of operations for the `data_patch` prop that turns the
+    previous state of a table into the current one.
+
+    Rows are matched by position. Changed cells become
+    `[row, column, value]` operations, rows in which more than
+    `replace_threshold` of the cells changed are replaced in one
+    `{"op": "replace"}` operation, additional rows are appended with
+    `{"op": "insert"}` and missing rows are removed with `{"op": "delete"}`.
+
+    :param previous: The table the browser currently holds, either a pandas
+        DataFrame or a sequence of rows (without a header row).
+    :param current: The new state of the table, in the same format.
+    :param replace_threshold: Fraction of changed cells above which a whole
+        row is replaced instead of patched cell by cell.
+    :returns: A list of operations for the `data_patch` prop.
+    """
+    if is_dataframe(current):
+        previous_columns = _dataframe_columns(previous)
+        current_columns = _dataframe_columns(current)
+    else:
+        previous_columns = _row_columns(previous)
+        current_columns = _row_columns(current)
+
+    if (
+        previous_columns
+        and current_columns
+        and len(previous_columns) != len(current_columns)
+    ):
+        raise ValueError(
+            "Can't compute a patch between tables with a different number "
+            "of columns."
+        )
+
+    n_previous = len(previous_columns[0]) if previous_columns else 0
+    n_current = len(current_columns[0]) if current_columns else 0
+    n_common = min(n_previous, n_current)
+
+    patch = []
+    if n_common:
+        import numpy as np
+
+        changed = np.column_stack(
+            [
+                np.asarray(
+                    previous[:n_common] != current[:n_common], dtype=bool
+                )
+                for previous, current in zip(previous_columns, current_columns)
+            ]
+        )
+        n_changed = changed.sum(axis=1)
+        replace = n_changed > replace_threshold * changed.shape[1]
+        for row in np.flatnonzero(replace).tolist():
+            patch.append(
+                {
+                    "op": "replace",
+                    "row": row,
+                    "values": _row(current_columns, row),
+                }
+            )
+        changed[replace] = False
+        for row, column in zip(*(idx.tolist() for idx in np.nonzero(changed))):
+            patch.append([row, column, current_columns[column][row]])
+
+    if n_current > n_previous:
+        patch.append(
+            {
+                "op": "insert",
+                "row": n_previous,
+                "rows": [
+                    _row(current_columns, row)
+                    for row in range(n_previous, n_current)
+                ],
+            }
+        )
+    elif n_previous > n_current:
+        patch.append(
+            {"op": "delete", "row": n_current, "count": n_previous - n_current}
+        )
+    return patch
+
+
+def _dataframe_columns(df):
+    return [python_values(series) for _, series in df.items()]
+
+
+def _row_columns(rows):
+    import numpy as np
+
+    rows = list(rows)
+    if not rows:
+        return []
+    columns = np.empty((len(rows), len(rows[0])), dtype=object)
+    columns[:] = rows
+    return list(columns.T)
+
+
+def _row(columns, row):
+    return [column[row] for column in columns]
@@ -0,0 +1,216 @@
+"""
+Aggregation of large datasets on the server before they are sent to the
+browser.
+
+Charts such as Histogram, PieChart and TreeMap summarise their data, so
+sending every observation and letting Google Charts do the summarising means
+the payload grows with the number of observations. The functions in this
+module compute the summary with vectorized numpy and pandas operations and
+return a DataFrame, which can be passed straight to the `data` prop of the
+matching chart, with one row per bin, group or node.
+
+Requires numpy and pandas.
+"""
+import numpy as np
+import pandas as pd
+
+LABELS = ("range", "start")
+
+
+def histogram(values, bins=10, range=None, weights=None, labels="range"):
+    """
+    Bin values into a histogram, for drawing with a ColumnChart or BarChart.
+
+    Missing and infinite values are ignored. If values is a DataFrame each
+    column is binned separately using the same bins, giving one series per
+    column.
+
+    :param values: A Series, array or DataFrame of values to bin.
+    :param bins: The number of equal width bins, or a sequence of bin edges.
+    :param range: The (min, max) range of the bins, defaults to the range of
+        the values.
+    :param weights: Optional weights for each value, the bins then hold the
+        sum of the weights rather than the number of values.
+    :param labels: How to label the bins, either "range", a string such as
+        "0 - 10", or "start", the lower edge of each bin as a number.
+    :returns: A DataFrame with a "bin" column and a count column for each
+        series.
+    """
+    if labels not in LABELS:
+        raise ValueError(
+            "Unknown labels {!r}, expected one of {}".format(
+                labels, ", ".join(LABELS)
+            )
+        )
+    if isinstance(values, pd.DataFrame):
+        columns = {name: _as_float(series) for name, series in values.items()}
+    else:
+        name = getattr(values, "name", None)
+        columns = {"count" if name is None else name: _as_float(values)}
+    if weights is not None:
+        weights = _as_float(weights)
+
+    finite = {name: np.isfinite(column) for name, column in columns.items()}
+    if range is None and np.ndim(bins) == 0:
+        range = _finite_range(columns, finite)
+    edges = np.histogram_bin_edges([], bins=bins, range=range)
+
+    counts = {}
+    for name, column in columns.items():
+        mask = finite[name]
+        counts[name], _ = np.histogram(
+            column[mask],
+            bins=edges,
+            weights=None if weights is None else weights[mask],
+        )
+
+    if labels == "start":
+        bin_labels = edges[:-1]
+    else:
+        bin_labels = [
+            "{:g} - {:g}".format(start, end)
+            for start, end in zip(edges[:-1].tolist(), edges[1:].tolist())
+        ]
+    df = pd.DataFrame(counts)
+    df.insert(0, "bin", bin_labels)
+    return df
+
+
+def group_sum(df, by, value=None, top=None, other="Other"):
+    """
+    Sum a column within each group, for drawing with a PieChart.
+
+    :param df: The DataFrame to aggregate.
+    :param by: The column to group by.
+    :param value: The column to sum. If None the rows in each group are
+        counted instead.
+    :param top: If set, only the top largest groups are kept and the rest are
+        combined into a single group.
+    :param other: The label of the combined group when top is set.
+    :returns: A DataFrame with the group and value columns, largest first.
+    """
+    grouped = df.groupby(by, observed=True, sort=False)
+    if value is None:
+        sums = grouped.size().rename("count")
+    else:
+        sums = grouped[value].sum()
+    sums = sums.sort_values(ascending=False, kind="stable")
+    if top is not None and len(sums) > top:
+        rest = sums.iloc[top:].sum()
+        sums = sums.iloc[:top]
+        sums.index = sums.index.astype(object)
+        sums.loc[other] = rest
+    return sums.reset_index()
+
+
+def treemap(df, path, value=None, color=None, root="All", separator=None):
+    """
+    Roll up a DataFrame into the nodes of a TreeMap.
+
+    Every distinct combination of values in the path columns becomes a node,
+    with the columns ordered from the top of the hierarchy down, and a single
+    root node is added at the top. Each node's size is the sum of value over
+    the rows beneath it, and its color is the mean of color over those rows.
+
+    TreeMap identifies nodes by their label, so labels must be unique across
+    the whole tree. If they are not, set separator to use the full path of
+    each node joined with separator as its id, e.g. "All/Europe/France".
+
+    :param df: The DataFrame to roll up.
+    :param path: List of column names, from the top level down.
+    :param value: The column that determines the size of the nodes. If None
+        the number of rows is used.
+    :param color: Optional column that determines the color of the nodes.
+    :param root: The label of the root node.
+    :param separator: If set, node ids are their full paths joined with
+        separator.
+    :returns: A DataFrame with "id", "parent" and "size" columns, and a
+        "color" column if color is set, in the format TreeMap expects.
+    """
+    path = list(path)
+    levels = [_root_node(df, root, value, color)]
+    for depth in range(1, len(path) + 1):
+        keys = path[:depth]
+        grouped = df.groupby(keys, observed=True, sort=False)
+        if value is None:
+            nodes = grouped.size().rename("size").to_frame()
+        else:
+            nodes = grouped[value].sum().rename("size").to_frame()
+        if color is not None:
+            nodes["color"] = grouped[color].mean()
+        nodes = nodes.reset_index()
+
+        labels = [nodes[key].astype(str) for key in keys]
+        if separator is None:
+            ids = labels[-1]
+            parents = labels[-2] if depth > 1 else root
+        else:
+            parents = pd.Series(root, index=nodes.index)
+            for label in labels[:-1]:
+                parents = parents + separator + label
+            ids = parents + separator + labels[-1]
+        nodes.insert(0, "id", ids.to_numpy(dtype=object))
+        nodes.insert(1, "parent", parents)
+        levels.append(nodes.drop(columns=keys))
+
+    result = pd.concat(levels, ignore_index=True)
+    if separator is None and result["id"].duplicated().any():
+        duplicates = result["id"][result["id"].duplicated()].unique()
+        raise ValueError(
+            "TreeMap labels must be unique, found duplicates {}. Set "
+            "separator to use full paths as ids.".format(
+                ", ".join(duplicates[:5])
+            )
+        )
+    return result
+
+
+def ohlc(df, time, value, freq):
+    """
+    Resample a series of observations into open, high, low and close values,
+    for drawing with a CandlestickChart. Periods without any observations
+    are dropped.
+
+    :param df: The DataFrame to resample.
+    :param time: The datetime column to resample by.
+    :param value: The column of observed values.
+    :param freq: The length of each period as a pandas offset alias, e.g.
+        "1h" or "1D".
+    :returns: A DataFrame with time, "low", "open", "close" and "high"
+        columns, the order CandlestickChart expects.
+    """
+    resampled = df.set_index(time)[value].resample(freq).ohlc().dropna()
+    return resampled[["low", "open", "close", "high"]].reset_index()
+
+
+def _as_float(values):
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(values, dtype=float)
+
+
+def _finite_range(columns, finite):
+    """
+    The range of the finite values across all columns, (0, 1) if there are
+    none so that the bins are still well defined.
+    """
+    lows, highs = [], []
+    for name, column in columns.items():
+        values = column[finite[name]]
+        if len(values):
+            lows.append(values.min())
+            highs.append(values.max())
+    if not lows:
+        return 0.0, 1.0
+    return min(lows), max(highs)
+
+
+def _root_node(df, root, value, color):
+    node = {
+        "id": root,
+        "parent": None,
+        "size": len(df) if value is None else df[value].sum(),
+    }
+    if color is not None:
+        node["color"] = df[color].mean()
+    return pd.DataFrame([node])
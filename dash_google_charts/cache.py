@@ -0,0 +1,239 @@
+"""
+Caching of chart data computed in callbacks.
+
+Callbacks often compute the same chart data for the same inputs, e.g. when
+the user switches a dropdown back and forth, or several users look at the
+same filters. Decorating the function that computes the data with `memoize`
+caches the result by a hash of its arguments, so repeated requests skip the
+computation.
+
+Each cached result is stored together with a hash of its contents. Setting
+the chart's `data_hash` prop to that hash lets the chart skip rebuilding its
+DataTable when the data hasn't changed, and `skip_unchanged` avoids sending
+the data at all when the browser already has it::
+
+    @memoize(MemoryBackend(max_bytes=100 * 2 ** 20))
+    def chart_data(region):
+        return dataframe_to_datatable(load(region))
+
+    @app.callback(
+        [Output("chart", "data"), Output("chart", "data_hash")],
+        [Input("region", "value")],
+        [State("chart", "data_hash")],
+    )
+    def update(region, current_hash):
+        data, data_hash = chart_data.with_hash(region)
+        return skip_unchanged(data, data_hash, current_hash)
+"""
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+class MemoryBackend(object):
+    """
+    An in-memory least recently used cache, bounded by the total size of the
+    serialised values it holds.
+
+    :param max_bytes: The maximum total size of the cached values.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, size):
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskBackend(object):
+    """
+    A least recently used cache stored as files in a directory, bounded by
+    the total size of the files. The cache can be shared by several
+    processes, e.g. the workers of a gunicorn server.
+
+    :param directory: The directory to store the cache in, created if it
+        doesn't exist.
+    :param max_bytes: The maximum total size of the cache files.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return None
+        try:
+            # the modification time records when an entry was last used
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value, size):
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self._path(key))
+        self._evict()
+
+    def clear(self):
+        for entry in self._entries():
+            _remove(entry.path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _entries(self):
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".pkl")
+        ]
+
+    def _evict(self):
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def memoize(backend=None):
+    """
+    Decorator that caches the results of a function by a hash of its
+    arguments. The arguments must be JSON serialisable, as callback inputs
+    are.
+
+    The decorated function has a `with_hash` method that returns the result
+    together with the hash of its contents, for use with the `data_hash`
+    prop, and a `cache` attribute holding the backend.
+
+    :param backend: Where to store the results, defaults to a new
+        `MemoryBackend`.
+    """
+    if backend is None:
+        backend = MemoryBackend()
+
+    def decorator(func):
+        name = "{}.{}".format(func.__module__, func.__qualname__)
+
+        def with_hash(*args, **kwargs):
+            key = _hash(_serialise([name, args, kwargs]))
+            entry = backend.get(key)
+            if entry is None:
+                data = func(*args, **kwargs)
+                serialised = _serialise(data)
+                entry = (data, _hash(serialised))
+                backend.set(key, entry, len(serialised))
+            return entry
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return with_hash(*args, **kwargs)[0]
+
+        wrapper.with_hash = with_hash
+        wrapper.cache = backend
+        return wrapper
+
+    return decorator
+
+
+def data_hash(data):
+    """
+    A hash of the contents of chart data, matching the hashes computed by
+    `memoize`.
+    """
+    return _hash(_serialise(data))
+
+
+def skip_unchanged(data, data_hash, current_hash):
+    """
+    Outputs for a callback that sets a chart's `data` and `data_hash` props,
+    which don't update either prop if the browser already has the data.
+
+    :param data: The new data.
+    :param data_hash: The hash of data, e.g. from `memoize`'s with_hash.
+    :param current_hash: The chart's current `data_hash`, passed to the
+        callback as State.
+    :returns: A (data, data_hash) tuple.
+    """
+    if data_hash == current_hash:
+        from dash import no_update
+
+        return no_update, no_update
+    return data, data_hash
+
+
+def _serialise(value):
+    """
+    Serialise a value as compact JSON with sorted keys, so that equal values
+    always serialise the same way. Strings, e.g. from
+    `dataframe_to_datatable`, are already serialised.
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    from plotly.utils import PlotlyJSONEncoder
+
+    return json.dumps(
+        value, cls=PlotlyJSONEncoder, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _hash(serialised):
+    return hashlib.sha256(serialised).hexdigest()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
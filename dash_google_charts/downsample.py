@@ -0,0 +1,307 @@
+"""
+Downsampling of large series before they are sent to the browser.
+
+Google Charts slows down considerably once a chart holds more than a few tens
+of thousands of points, far more than can be distinguished on screen. The
+reducers in this module pick a representative subset of the points, so that
+render time and payload size depend on the size of the chart rather than the
+amount of data.
+
+Requires numpy and pandas.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 2000
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    The points are split into n_out - 2 buckets of equal size, and from each
+    bucket the point forming the largest triangle with the point selected from
+    the previous bucket and the average of the next bucket is kept. The first
+    and last points are always kept. Work within each bucket is vectorized.
+
+    :param x: Sorted array of x values.
+    :param y: Array of y values.
+    :param n_out: Number of points to keep.
+    :returns: Sorted array of the indices of the points to keep.
+    """
+    x, y = _as_float(x), _as_float(y)
+    n = len(x)
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        raise ValueError("n_out must be at least 3")
+
+    edges = _bucket_edges(1, n - 1, n_out - 2)
+    starts, ends = edges[:-1], edges[1:]
+    # the average of each bucket, with the last point standing in for the
+    # average of the bucket after the final one
+    counts = ends - starts
+    x_means = np.append(np.add.reduceat(x[: ends[-1]], starts) / counts, x[-1])
+    y_means = np.append(np.add.reduceat(y[: ends[-1]], starts) / counts, y[-1])
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        x_bucket, y_bucket = x[start:end], y[start:end]
+        # twice the area of the triangles (previous, candidate, next mean)
+        area = np.abs(
+            (x[previous] - x_means[i + 1]) * (y_bucket - y[previous])
+            - (x[previous] - x_bucket) * (y_means[i + 1] - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        indices[i + 1] = previous
+    return indices
+
+
+def min_max(x, y, n_out):
+    """
+    Min/max-per-bucket downsampling.
+
+    The points are split into n_out // 2 buckets of equal size, and the
+    points with the smallest and largest y value in each bucket are kept.
+    This preserves the envelope of the series, including any spikes.
+
+    :param x: Sorted array of x values.
+    :param y: Array of y values.
+    :param n_out: Number of points to keep.
+    :returns: Sorted array of the indices of the points to keep.
+    """
+    y = _as_float(y)
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 2:
+        raise ValueError("n_out must be at least 2")
+
+    starts = _bucket_edges(0, n, n_out // 2)[:-1]
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    indices = np.concatenate(
+        [
+            _first_in_bucket(
+                y == np.minimum.reduceat(y, starts)[bucket], bucket
+            ),
+            _first_in_bucket(
+                y == np.maximum.reduceat(y, starts)[bucket], bucket
+            ),
+        ]
+    )
+    return np.unique(indices)
+
+
+def downsample_dataframe(
+    df, max_points=DEFAULT_MAX_POINTS, method="lttb", x=None
+):
+    """
+    Downsample each series in a DataFrame.
+
+    The first column (or the column named by x) is used as the x axis and
+    every other numeric column is treated as a series. Each series is reduced
+    to at most max_points points and the union of the selected rows is
+    returned, so every column of the result stays aligned. Missing values are
+    ignored when selecting points. If there are no numeric series with
+    values, max_points evenly spaced rows are returned.
+
+    :param df: The DataFrame to downsample.
+    :param max_points: The maximum number of points to keep per series.
+    :param method: Either "lttb" or "minmax".
+    :param x: The name of the x column, defaults to the first column.
+    :returns: A DataFrame containing a subset of the rows of df.
+    """
+    if method not in METHODS:
+        raise ValueError(
+            "Unknown downsampling method {!r}, expected one of {}".format(
+                method, ", ".join(METHODS)
+            )
+        )
+    if len(df) <= max_points:
+        return df
+
+    reducer = lttb if method == "lttb" else min_max
+    x = df.columns[0] if x is None else x
+    x_values = _x_values(df[x])
+    if not np.all(np.diff(x_values) >= 0):
+        order = np.argsort(x_values, kind="stable")
+        df, x_values = df.iloc[order], x_values[order]
+
+    keep = np.zeros(len(df), dtype=bool)
+    for name, series in df.items():
+        if name == x or not pd.api.types.is_numeric_dtype(series.dtype):
+            continue
+        y_values = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = np.flatnonzero(np.isfinite(y_values))
+        selected = reducer(x_values[valid], y_values[valid], max_points)
+        keep[valid[selected]] = True
+    if not keep.any():
+        # no series with values to select points for, e.g. only string
+        # columns besides x, so keep evenly spaced rows
+        keep[
+            np.linspace(0, len(df) - 1, max_points).round().astype(int)
+        ] = True
+    return df[keep]
+
+
+def max_points_for_width(width, points_per_pixel=2):
+    """
+    Choose the number of points to keep for a chart of the given width, which
+    may be a number of pixels or a CSS pixel length such as "800px". Returns
+    None if the width is not in pixels, e.g. a percentage.
+    """
+    if isinstance(width, (int, float)):
+        return int(width * points_per_pixel)
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*(px)?\s*$", str(width or ""))
+    if match is None:
+        return None
+    return int(float(match.group(1)) * points_per_pixel)
+
+
+def _as_float(values):
+    return np.asarray(values, dtype=float)
+
+
+def _x_values(series):
+    """
+    Numeric x values for computing triangle areas. Datetimes are converted to
+    nanoseconds and non-numeric x values are replaced by their position.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series.to_numpy(dtype="datetime64[ns]").astype(np.int64) * 1.0
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    return np.arange(len(series), dtype=float)
+
+
+def _n_series(df, x):
+    """
+    The number of series downsample_dataframe selects points for.
+    """
+    return sum(
+        1
+        for name, series in df.items()
+        if name != x and pd.api.types.is_numeric_dtype(series.dtype)
+    )
+
+
+def _bucket_edges(start, stop, n_buckets):
+    """
+    Split the range start..stop into n_buckets non-empty buckets of (almost)
+    equal size, returning the n_buckets + 1 bucket edges.
+    """
+    n_buckets = max(1, min(n_buckets, stop - start))
+    return np.linspace(start, stop, n_buckets + 1).astype(np.int64)
+
+
+def _first_in_bucket(mask, bucket):
+    indices = np.flatnonzero(mask)
+    _, first = np.unique(bucket[indices], return_index=True)
+    return indices[first]
+
+
+class Pyramid(object):
+    """
+    A tiered cache of downsampled levels of a DataFrame, for serving
+    level-of-detail data to charts that the user can zoom.
+
+    Level 0 is the full data, and each subsequent level is downsampled by
+    `factor` from the one before it, until a level has at most max_points
+    rows per series. The levels are computed once up front, so answering a
+    zoom only requires finding the finest level that has few enough points in
+    the visible window, and slicing it.
+
+    Example::
+
+        pyramid = Pyramid(df, max_points=2000)
+
+        @app.callback(
+            Output("chart", "data"), [Input("chart", "view_window")]
+        )
+        def zoom(view_window):
+            return dataframe_to_datatable(pyramid.query(view_window))
+
+    :param df: The DataFrame to cache.
+    :param max_points: The maximum number of points per series to return.
+    :param method: The downsampling method, either "lttb" or "minmax".
+    :param x: The name of the x column, defaults to the first column.
+    :param factor: How much each level is reduced by relative to the last.
+    """
+
+    def __init__(
+        self,
+        df,
+        max_points=DEFAULT_MAX_POINTS,
+        method="lttb",
+        x=None,
+        factor=4,
+    ):
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+        self.max_points = max_points
+        self.method = method
+        self.x = df.columns[0] if x is None else x
+
+        x_values = _x_values(df[self.x])
+        if not np.all(np.diff(x_values) >= 0):
+            df = df.iloc[np.argsort(x_values, kind="stable")]
+
+        # the rows selected for each series are kept, so a level can have up
+        # to max_points rows for every series
+        self._n_series = max(1, _n_series(df, self.x))
+        self.levels = [df]
+        while len(self.levels[-1]) > max_points * self._n_series:
+            previous = self.levels[-1]
+            n_points = max(
+                max_points, len(previous) // (factor * self._n_series)
+            )
+            level = downsample_dataframe(previous, n_points, method, x=self.x)
+            if len(level) >= len(previous):
+                break
+            self.levels.append(level)
+        self._x_levels = [_x_values(level[self.x]) for level in self.levels]
+
+    def query(self, view_window=None, max_points=None):
+        """
+        Get the rows to draw for a view window.
+
+        :param view_window: The visible range of the x axis, as reported by
+            the `view_window` prop of a chart, i.e. a dictionary with "min"
+            and "max" keys. If None, e.g. after the user resets the zoom,
+            the whole range is returned.
+        :param max_points: Override the max_points set on the pyramid.
+        :returns: A DataFrame with at most max_points rows per series in the
+            window.
+        """
+        max_points = max_points or self.max_points
+        max_rows = max_points * self._n_series
+        if view_window is None:
+            return self.levels[-1]
+
+        start, end = self._bounds(view_window)
+        for level, x_values in zip(self.levels, self._x_levels):
+            lo = np.searchsorted(x_values, start, side="left")
+            hi = np.searchsorted(x_values, end, side="right")
+            if hi - lo <= max_rows or level is self.levels[-1]:
+                window = level.iloc[lo:hi]
+                if len(window) > max_rows:
+                    window = downsample_dataframe(
+                        window, max_points, self.method, x=self.x
+                    )
+                return window
+
+    def _bounds(self, view_window):
+        x = self.levels[0][self.x]
+        bounds = view_window.get("min"), view_window.get("max")
+        if pd.api.types.is_datetime64_any_dtype(x.dtype):
+            bounds = [
+                _x_values(pd.Series(pd.to_datetime([bound])))[0]
+                for bound in bounds
+            ]
+        return bounds
@@ -0,0 +1,466 @@
+"""
+Formatting of DataFrame columns on the server, as an alternative to the
+`formatters` prop.
+
+The `formatters` prop runs Google's formatters over every cell in the browser
+each time the DataTable is built. The functions in this module produce the
+same formatted values in Python, so they can be sent along with the data
+using the `formatters` argument of `dataframe_to_datatable` or
+`dataframe_to_columnar` and the browser doesn't have to format anything.
+Each distinct value is only formatted once, and the columnar encoding sends
+each distinct formatted string once.
+
+The formatter specifications are the same as those of the `formatters` prop,
+e.g. `{"type": "NumberFormat", "column": "price", "options": {"prefix": "$"}}`,
+with NumberFormat, DateFormat, PatternFormat and ColorFormat supported.
+Formatting follows the "en" locale.
+
+Requires numpy and pandas.
+"""
+import datetime
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pandas as pd
+
+MONTHS = np.array(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ],
+    dtype=object,
+)
+
+WEEKDAYS = np.array(
+    [
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    ],
+    dtype=object,
+)
+
+# the patterns used for each of DateFormat's formatTypes
+DATE_FORMAT_TYPES = {
+    "short": "M/d/yy",
+    "medium": "MMM d, y",
+    "long": "MMMM d, y",
+}
+
+# pattern letters followed by any repeats of the same letter, quoted literals,
+# or any other single character
+_DATE_TOKEN = re.compile(r"([A-Za-z])\1*|'(?:[^']|'')*'|.")
+
+
+def format_dataframe(df, formatters):
+    """
+    Apply a list of formatter specifications to a DataFrame.
+
+    :param df: The DataFrame to format.
+    :param formatters: A formatter specification or list of specifications,
+        in the format accepted by the `formatters` prop.
+    :returns: A dictionary mapping the position of each formatted column to a
+        dictionary with "formatted" and "style" keys. Each is either None or an
+        object array with a string or None for every row.
+    """
+    if isinstance(formatters, dict):
+        formatters = [formatters]
+    results = {}
+    for formatter in formatters:
+        kind = formatter.get("type")
+        options = formatter.get("options") or {}
+        if kind == "PatternFormat":
+            sources, position = _pattern_columns(df, formatter)
+            values = [
+                _formatted_or_str(df.iloc[:, source], results.get(source))
+                for source in sources
+            ]
+            # PatternFormat is constructed with the pattern as its options
+            _result(results, position)["formatted"] = pattern_format(
+                values, formatter["options"]
+            )
+            continue
+
+        position = _column_position(df, formatter["column"])
+        series = df.iloc[:, position]
+        result = _result(results, position)
+        if kind == "NumberFormat":
+            result["formatted"] = number_format(series, **options)
+            if options.get("negativeColor"):
+                negative = series.to_numpy(dtype=float, na_value=np.nan) < 0
+                style = np.where(
+                    negative,
+                    "color:{};".format(options["negativeColor"]),
+                    None,
+                )
+                result["style"] = _combine_styles(result["style"], style)
+        elif kind == "DateFormat":
+            result["formatted"] = date_format(series, **options)
+        elif kind == "ColorFormat":
+            result["style"] = _combine_styles(
+                result["style"],
+                color_format(series, formatter.get("ranges", [])),
+            )
+        else:
+            raise ValueError(
+                "{} can't be applied on the server, use the formatters prop "
+                "instead.".format(kind)
+            )
+    return results
+
+
+def number_format(
+    series,
+    decimalSymbol=".",
+    fractionDigits=2,
+    groupingSymbol=",",
+    negativeParens=False,
+    pattern=None,
+    prefix="",
+    suffix="",
+    negativeColor=None,
+):
+    """
+    Format a numeric Series like google.visualization.NumberFormat. The
+    options have the same names and defaults as NumberFormat's options.
+    negativeColor doesn't affect the formatted values, see `color_format`.
+
+    pattern can be an ICU decimal pattern such as "#,##0.00", "0.#%" or
+    "$#,##0;($#,##0)". Scientific notation is not supported.
+
+    :returns: An object array of formatted strings, None for missing values.
+    """
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    if pattern is not None:
+        positive, negative = _parse_decimal_pattern(pattern)
+    else:
+        number = {
+            "min_integer": 1,
+            "min_fraction": fractionDigits,
+            "max_fraction": fractionDigits,
+            "grouping": bool(groupingSymbol),
+            "multiplier": 1,
+        }
+        positive = dict(number, prefix=prefix, suffix=suffix)
+        if negativeParens:
+            negative = dict(number, prefix="(" + prefix, suffix=suffix + ")")
+        else:
+            negative = dict(number, prefix="-" + prefix, suffix=suffix)
+
+    symbols = str.maketrans({",": groupingSymbol, ".": decimalSymbol})
+
+    def format_value(value):
+        spec = negative if value < 0 else positive
+        digits = _format_digits(abs(value) * spec["multiplier"], spec)
+        return spec["prefix"] + digits.translate(symbols) + spec["suffix"]
+
+    return _map_unique(values, np.isfinite(values), format_value)
+
+
+def date_format(series, formatType="short", pattern=None, timeZone=None):
+    """
+    Format a datetime Series like google.visualization.DateFormat.
+
+    pattern is an ICU date pattern such as "MMM d, y h:mm a", otherwise
+    formatType chooses a predefined pattern. timeZone is an offset from UTC
+    in hours, and only applies to timezone-aware Series. Naive datetimes are
+    formatted as they are, which matches how they are drawn.
+
+    :returns: An object array of formatted strings, None for missing values.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        series = pd.to_datetime(series)
+    if timeZone is not None and series.dt.tz is not None:
+        offset = datetime.timezone(datetime.timedelta(hours=timeZone))
+        series = series.dt.tz_convert(offset)
+    if pattern is None:
+        pattern = DATE_FORMAT_TYPES[formatType]
+
+    dt = series.dt
+    formatted = pd.Series("", index=series.index, dtype=object)
+    for match in _DATE_TOKEN.finditer(pattern):
+        formatted = formatted + _date_field(dt, match.group(0))
+    result = formatted.to_numpy(dtype=object)
+    result[series.isna().to_numpy()] = None
+    return result
+
+
+def pattern_format(values, pattern):
+    """
+    Combine columns like google.visualization.PatternFormat, replacing {0},
+    {1}, ... in pattern with the values of each column.
+
+    :param values: A list of object arrays of strings, one for each source
+        column.
+    :returns: An object array of formatted strings.
+    """
+    parts = re.split(r"\{(\d+)\}", pattern)
+    formatted = np.full(len(values[0]), parts[0], dtype=object)
+    for i in range(1, len(parts), 2):
+        formatted = formatted + values[int(parts[i])] + parts[i + 1]
+    return formatted
+
+
+def color_format(series, ranges):
+    """
+    Compute cell styles like google.visualization.ColorFormat.
+
+    :param ranges: A list of [from, to, color, bgcolor] ranges, as passed to
+        ColorFormat.addRange. from is inclusive, to is exclusive and either
+        can be None to leave that end of the range open. Later ranges take
+        precedence.
+    :returns: An object array of CSS styles, None for cells without a color.
+    """
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    styles = np.full(len(values), None, dtype=object)
+    for start, end, color, bgcolor in ranges:
+        in_range = np.isfinite(values)
+        if start is not None:
+            in_range &= values >= start
+        if end is not None:
+            in_range &= values < end
+        style = ""
+        if color:
+            style += "color:{};".format(color)
+        if bgcolor:
+            style += "background-color:{};".format(bgcolor)
+        styles[in_range] = style
+    return styles
+
+
+def _result(results, position):
+    return results.setdefault(position, {"formatted": None, "style": None})
+
+
+def _pattern_columns(df, formatter):
+    """
+    The positions of the source columns of a PatternFormat and the column it
+    writes to. Without sourceColumns, column is the list of source columns
+    and the first of them is written to, as the `formatters` prop allows.
+    """
+    column = formatter.get("column")
+    sources = formatter.get("sourceColumns")
+    if sources is None:
+        sources = column if isinstance(column, (list, tuple)) else [column]
+        column = None
+    sources = [_column_position(df, source) for source in sources]
+    if column is None:
+        return sources, sources[0]
+    return sources, _column_position(df, column)
+
+
+def _column_position(df, column):
+    """
+    The position of a column given its position or name, matching how the
+    `formatters` prop refers to columns by index, id or label.
+    """
+    if isinstance(column, int) and not isinstance(column, bool):
+        return column
+    return df.columns.get_loc(column)
+
+
+def _formatted_or_str(series, result):
+    """
+    The formatted values of a column if it has been formatted, otherwise its
+    values converted to strings.
+    """
+    if result is not None and result["formatted"] is not None:
+        formatted = result["formatted"].copy()
+        formatted[pd.isna(formatted)] = ""
+        return formatted
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        # match JavaScript's String(), which drops the fraction of integers
+        return _map_unique(values, np.isfinite(values), _js_number, "")
+    strings = series.astype(object).to_numpy(dtype=object, copy=True)
+    mask = series.isna().to_numpy()
+    strings[~mask] = [str(value) for value in strings[~mask]]
+    strings[mask] = ""
+    return strings
+
+
+def _js_number(value):
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _map_unique(values, mask, func, missing=None):
+    """
+    Apply func to each distinct value in values where mask is set, returning
+    an object array with missing in the other positions.
+    """
+    result = np.full(len(values), missing, dtype=object)
+    if mask.any():
+        uniques, inverse = np.unique(values[mask], return_inverse=True)
+        formatted = np.array([func(value) for value in uniques.tolist()])
+        result[mask] = formatted.astype(object)[inverse]
+    return result
+
+
+def _combine_styles(styles, new_styles):
+    if styles is None:
+        return new_styles
+    combined = styles.copy()
+    has_new = pd.notna(new_styles)
+    has_old = pd.notna(combined)
+    combined[has_new & has_old] = (
+        combined[has_new & has_old] + new_styles[has_new & has_old]
+    )
+    combined[has_new & ~has_old] = new_styles[has_new & ~has_old]
+    return combined
+
+
+def _format_digits(value, spec):
+    """
+    Format a non-negative number with "," grouping and "." as the decimal
+    symbol, which are translated to the configured symbols afterwards.
+    Halves are rounded up, as they are in the browser.
+    """
+    grouping = "," if spec["grouping"] else ""
+    places = spec["max_fraction"]
+    rounded = Decimal(value).quantize(
+        Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP
+    )
+    digits = "{:{}.{}f}".format(rounded, grouping, places)
+    if spec["max_fraction"] > spec["min_fraction"]:
+        integer, _, fraction = digits.partition(".")
+        fraction = fraction.rstrip("0").ljust(spec["min_fraction"], "0")
+        digits = integer + ("." + fraction if fraction else "")
+    integer, dot, fraction = digits.partition(".")
+    if spec["min_integer"] == 0 and integer == "0" and fraction:
+        integer = ""
+    elif len(integer.replace(",", "")) < spec["min_integer"]:
+        integer = integer.zfill(spec["min_integer"])
+    return integer + dot + fraction
+
+
+def _parse_decimal_pattern(pattern):
+    """
+    Parse an ICU decimal pattern into the specs of its positive and negative
+    subpatterns.
+    """
+    subpatterns = _split_unquoted(pattern, ";")
+    positive = _parse_subpattern(subpatterns[0])
+    if len(subpatterns) > 1:
+        negative = _parse_subpattern(subpatterns[1])
+        # the negative subpattern only provides its prefix and suffix
+        negative = dict(
+            positive, prefix=negative["prefix"], suffix=negative["suffix"]
+        )
+    else:
+        negative = dict(positive, prefix="-" + positive["prefix"])
+    return positive, negative
+
+
+def _parse_subpattern(pattern):
+    match = re.match(r"^((?:'[^']*'|[^#0,.])*)([#0,.]+)(.*)$", pattern)
+    if match is None or "E" in match.group(2):
+        raise ValueError("Unsupported number pattern {!r}".format(pattern))
+    prefix, number, suffix = match.groups()
+    if "E" in suffix.replace("'E'", ""):
+        raise ValueError("Scientific notation is not supported")
+    integer, _, fraction = number.partition(".")
+    multiplier = 1
+    if "%" in prefix + suffix:
+        multiplier = 100
+    elif "‰" in prefix + suffix:
+        multiplier = 1000
+    return {
+        "prefix": _unquote(prefix),
+        "suffix": _unquote(suffix),
+        "min_integer": integer.count("0"),
+        "min_fraction": fraction.count("0"),
+        "max_fraction": len(fraction),
+        "grouping": "," in integer,
+        "multiplier": multiplier,
+    }
+
+
+def _split_unquoted(pattern, separator):
+    parts, current, quoted = [], "", False
+    for char in pattern:
+        if char == "'":
+            quoted = not quoted
+        if char == separator and not quoted:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+
+def _unquote(text):
+    return re.sub(r"'([^']*)'", lambda m: m.group(1) or "'", text)
+
+
+def _date_field(dt, token):
+    """
+    The strings for a single token of an ICU date pattern.
+    """
+    if token.startswith("'"):
+        return token[1:-1].replace("''", "'") if len(token) > 2 else "'"
+    letter, width = token[0], len(token)
+    if not letter.isalpha():
+        return token
+    if letter == "y":
+        year = dt.year.fillna(0).astype(int)
+        if width == 2:
+            return _numbers(year % 100, 2)
+        return _numbers(year, width)
+    if letter in "ML":
+        if width >= 3:
+            names = _names(MONTHS, dt.month - 1)
+            return names if width >= 4 else names.str[:3]
+        return _numbers(dt.month, width)
+    if letter == "d":
+        return _numbers(dt.day, width)
+    if letter == "E":
+        names = _names(WEEKDAYS, dt.weekday)
+        return names if width >= 4 else names.str[:3]
+    if letter == "a":
+        return pd.Series(
+            np.where(dt.hour.fillna(0) < 12, "AM", "PM"), index=dt.hour.index
+        )
+    if letter == "H":
+        return _numbers(dt.hour, width)
+    if letter == "h":
+        return _numbers((dt.hour + 11) % 12 + 1, width)
+    if letter == "K":
+        return _numbers(dt.hour % 12, width)
+    if letter == "k":
+        return _numbers((dt.hour + 23) % 24 + 1, width)
+    if letter == "m":
+        return _numbers(dt.minute, width)
+    if letter == "s":
+        return _numbers(dt.second, width)
+    if letter == "S":
+        millis = dt.microsecond // 1000
+        return _numbers(millis, 3).str[:width]
+    if letter == "G":
+        return "AD"
+    raise ValueError("Unsupported date pattern field {!r}".format(token))
+
+
+def _numbers(values, width):
+    return values.fillna(0).astype(int).astype(str).str.zfill(width)
+
+
+def _names(names, index):
+    return pd.Series(
+        names.take(index.fillna(0).to_numpy(dtype=int)), index=index.index
+    )
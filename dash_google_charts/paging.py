@@ -0,0 +1,218 @@
+"""
+Paging and sorting on the server for Tables with `server_side=True`.
+
+A Table in server side mode only receives the rows of the page it is
+showing, and reports the page and sort order the user asks for in its `page`
+and `sort` props. The pagers in this module turn those props into the rows
+to send back.
+
+`DataFramePager` keeps the sorted order of the DataFrame for each sort order
+it has been asked for, so that flipping through the pages of a sorted table
+only has to slice the data rather than sort it again. `SQLPager` pushes the
+sorting and paging down to a database with ORDER BY, LIMIT and OFFSET.
+
+Requires numpy and pandas.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PAGE_SIZE = 10
+
+
+class DataFramePager(object):
+    """
+    Serve pages of a DataFrame.
+
+    Example::
+
+        pager = DataFramePager(df)
+
+        @app.callback(
+            [Output("table", "data"), Output("table", "total_rows")],
+            [Input("table", "page"), Input("table", "sort")],
+        )
+        def update_page(page, sort):
+            rows = pager.page(page, sort=sort)
+            return dataframe_to_datatable(rows), len(pager)
+
+    :param df: The DataFrame to page through.
+    :param max_sorts: The number of sort orders to keep the sorted order of.
+        The least recently used order is dropped when there are more.
+    """
+
+    def __init__(self, df, max_sorts=8):
+        self.df = df
+        self.max_sorts = max_sorts
+        self._orders = OrderedDict()
+
+    def __len__(self):
+        return len(self.df)
+
+    def page(self, page=0, page_size=DEFAULT_PAGE_SIZE, sort=None):
+        """
+        The rows of one page of the data.
+
+        :param page: The page number, starting at 0, as in the `page` prop.
+            None is treated as 0.
+        :param page_size: The number of rows per page, as in the `page_size`
+            prop. None is treated as the default of 10.
+        :param sort: The sort order, as in the `sort` prop. If None the rows
+            are in their original order.
+        :returns: A DataFrame with at most page_size rows.
+        """
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        start = (page or 0) * page_size
+        stop = start + page_size
+        if not sort:
+            return self.df.iloc[start:stop]
+        return self.df.iloc[self.order(sort)[start:stop]]
+
+    def order(self, sort):
+        """
+        The positions of the rows of the DataFrame in the given sort order.
+        Missing values are sorted last. Computed orders are cached.
+        """
+        column = self._column_name(sort["column"])
+        ascending = sort.get("ascending", True) is not False
+        key = (column, ascending)
+        if key in self._orders:
+            self._orders.move_to_end(key)
+            return self._orders[key]
+
+        order = self._sorted_positions(self.df[column], ascending)
+        self._orders[key] = order
+        while len(self._orders) > self.max_sorts:
+            self._orders.popitem(last=False)
+        return order
+
+    def clear(self):
+        """
+        Forget the cached sort orders, e.g. after modifying the DataFrame.
+        """
+        self._orders.clear()
+
+    def _column_name(self, column):
+        if column in self.df.columns:
+            return column
+        if isinstance(column, int) and 0 <= column < len(self.df.columns):
+            return self.df.columns[column]
+        # columns are reported by their id, which is the string of the name
+        for name in self.df.columns:
+            if str(name) == str(column):
+                return name
+        raise KeyError("Unknown sort column {!r}".format(column))
+
+    @staticmethod
+    def _sorted_positions(series, ascending):
+        # stable so that equal values keep their order, and missing values
+        # are placed last in both directions
+        missing = series.isna().to_numpy()
+        valid = np.flatnonzero(~missing)
+        order = (
+            series.iloc[valid]
+            .reset_index(drop=True)
+            .argsort(kind="stable")
+            .to_numpy()
+        )
+        if not ascending:
+            order = _reverse_stable(series.iloc[valid].to_numpy(), order)
+        return np.concatenate([valid[order], np.flatnonzero(missing)])
+
+
+class SQLPager(object):
+    """
+    Serve pages of the results of a SQL query, sorting and paging in the
+    database.
+
+    :param con: A SQLAlchemy connectable or DBAPI connection, as accepted by
+        `pandas.read_sql`.
+    :param query: The query to page through. It is used as a subquery, so it
+        must not end in a semicolon.
+    :param params: Parameters of the query, passed to `pandas.read_sql`.
+    """
+
+    def __init__(self, con, query, params=None):
+        self.con = con
+        self.query = query
+        self.params = params
+        self._columns = None
+        self._length = None
+
+    def __len__(self):
+        if self._length is None:
+            count = self._read(
+                "SELECT COUNT(*) AS count FROM ({}) AS paged".format(
+                    self.query
+                )
+            )
+            self._length = int(count.iloc[0, 0])
+        return self._length
+
+    @property
+    def columns(self):
+        """
+        The columns of the query's results.
+        """
+        if self._columns is None:
+            empty = self._read(
+                "SELECT * FROM ({}) AS paged LIMIT 0".format(self.query)
+            )
+            self._columns = list(empty.columns)
+        return self._columns
+
+    def page(self, page=0, page_size=DEFAULT_PAGE_SIZE, sort=None):
+        """
+        The rows of one page of the results, with the same arguments as
+        `DataFramePager.page`.
+        """
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        order_by = ""
+        if sort:
+            column = sort["column"]
+            if isinstance(column, int):
+                column = self.columns[column]
+            elif column not in self.columns:
+                # only known column names are put into the query
+                raise KeyError("Unknown sort column {!r}".format(column))
+            ascending = sort.get("ascending", True) is not False
+            direction = "ASC" if ascending else "DESC"
+            order_by = " ORDER BY {} {}".format(_quote(column), direction)
+        return self._read(
+            "SELECT * FROM ({}) AS paged{} LIMIT {:d} OFFSET {:d}".format(
+                self.query, order_by, page_size, (page or 0) * page_size
+            )
+        )
+
+    def clear(self):
+        """
+        Forget the cached number of rows and columns, e.g. after the data in
+        the database changes.
+        """
+        self._columns = None
+        self._length = None
+
+    def _read(self, sql):
+        return pd.read_sql(sql, self.con, params=self.params)
+
+
+def _reverse_stable(values, order):
+    """
+    Turn a stable ascending order into a stable descending one, reversing the
+    order of the distinct values but keeping equal values in their original
+    order.
+    """
+    reversed_order = order[::-1]
+    sorted_values = values[reversed_order]
+    # start of each run of equal values in the reversed order
+    starts = np.flatnonzero(
+        np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    )
+    lengths = np.diff(np.r_[starts, len(order)])
+    run = np.repeat(np.arange(len(starts)), lengths)
+    return reversed_order[np.lexsort((reversed_order, run))]
+
+
+def _quote(name):
+    return '"{}"'.format(str(name).replace('"', '""'))
@@ -0,0 +1,186 @@
+"""
+Download a pinned copy of the Google Charts library, so that it can be served
+by the Dash app itself rather than fetched from gstatic. See
+`dash_google_charts.use_local_library`.
+
+Usage::
+
+    python -m dash_google_charts.vendor 51 corechart table
+
+downloads version 51 of the loader and the corechart and table packages into
+the `_library` directory of the installed package. Pin a numbered version
+rather than "current", so that the copy doesn't change under the charts.
+
+Files a package needs that aren't listed in PACKAGE_FILES can be downloaded
+with --file, giving their path relative to the version's directory on
+gstatic, e.g. ``--file js/jsapi_compiled_controls_module.js``.
+"""
+import argparse
+import os
+import re
+import sys
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+GSTATIC_URL = "https://www.gstatic.com/charts/"
+
+LIBRARY_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "_library"
+)
+
+# global set by the downloaded loader, read by src/private/loader.js
+LIBRARY_GLOBAL = "dash_google_charts_library"
+
+# files every package needs, relative to the version's directory
+COMMON_FILES = [
+    "js/jsapi_compiled_default_module.js",
+    "js/jsapi_compiled_graphics_module.js",
+    "js/jsapi_compiled_ui_module.js",
+    "css/core/tooltip.css",
+    "css/util/util.css",
+]
+
+# the Google Charts packages used by the components and their own files
+PACKAGE_FILES = {
+    "calendar": ["js/jsapi_compiled_calendar_module.js"],
+    "corechart": ["js/jsapi_compiled_corechart_module.js"],
+    "gantt": ["js/jsapi_compiled_gantt_module.js"],
+    "gauge": ["js/jsapi_compiled_gauge_module.js"],
+    "geochart": ["js/jsapi_compiled_geochart_module.js"],
+    "orgchart": [
+        "js/jsapi_compiled_orgchart_module.js",
+        "css/orgchart/orgchart.css",
+    ],
+    "sankey": ["js/jsapi_compiled_sankey_module.js"],
+    "table": [
+        "js/jsapi_compiled_format_module.js",
+        "js/jsapi_compiled_table_module.js",
+        "css/table/table.css",
+    ],
+    "timeline": ["js/jsapi_compiled_timeline_module.js"],
+    "treemap": ["js/jsapi_compiled_treemap_module.js"],
+    "wordtree": ["js/jsapi_compiled_wordtree_module.js"],
+}
+
+# string literals in the loader that start with the gstatic base URL
+_BASE_URL_LITERAL = re.compile(
+    r"""(["'])https://www\.gstatic\.com/charts/((?:\\.|(?!\1)[^\\])*)\1"""
+)
+
+
+def vendor(version, packages=None, files=(), directory=LIBRARY_DIR):
+    """
+    Download a version of the Google Charts loader and packages.
+
+    :param version: The version of Google Charts, e.g. "51".
+    :param packages: The packages to download, defaults to all of the
+        packages used by the components.
+    :param files: Paths of any other files to download, relative to the
+        version's directory.
+    :param directory: Where to save the library, defaults to the `_library`
+        directory that `use_local_library` serves.
+    :returns: The paths of the downloaded files, relative to directory.
+    """
+    if packages is None:
+        packages = sorted(PACKAGE_FILES)
+    unknown = [package for package in packages if package not in PACKAGE_FILES]
+    if unknown:
+        raise ValueError(
+            "Unknown packages {}, expected some of {}".format(
+                ", ".join(unknown), ", ".join(sorted(PACKAGE_FILES))
+            )
+        )
+
+    paths = list(COMMON_FILES)
+    for package in packages:
+        paths.extend(PACKAGE_FILES[package])
+    paths.extend(files)
+
+    loader = _download("{}{}/loader.js".format(GSTATIC_URL, version))
+    _write(directory, "loader.js", rewrite_loader(loader, version))
+    downloaded = ["loader.js"]
+    for path in paths:
+        relative = "{}/{}".format(version, path)
+        try:
+            content = _download(GSTATIC_URL + relative)
+        except HTTPError as e:
+            if e.code != 404:
+                raise
+            sys.stderr.write("Skipping {}, not found\n".format(relative))
+            continue
+        _write(directory, relative, content)
+        downloaded.append(relative)
+    return downloaded
+
+
+def rewrite_loader(source, version):
+    """
+    Point a Google Charts loader at the directory it is served from instead
+    of gstatic, and record the version it was downloaded for.
+    """
+    source = source.decode("utf-8")
+    rewritten, count = _BASE_URL_LITERAL.subn(
+        r"(window.{}.url+\1\2\1)".format(LIBRARY_GLOBAL), source
+    )
+    if not count:
+        raise ValueError(
+            "The gstatic URL wasn't found in the loader, it can't be served "
+            "locally"
+        )
+    header = (
+        "window.{name}={{url:document.currentScript.src.replace(/[^/]*$/,''),"
+        "version:'{version}'}};\n"
+    ).format(name=LIBRARY_GLOBAL, version=version)
+    return (header + rewritten).encode("utf-8")
+
+
+def _download(url):
+    response = urlopen(url)
+    try:
+        return response.read()
+    finally:
+        response.close()
+
+
+def _write(directory, path, content):
+    path = os.path.join(directory, *path.split("/"))
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Download a pinned copy of the Google Charts library."
+    )
+    parser.add_argument("version", help='The version to download, e.g. "51"')
+    parser.add_argument(
+        "packages",
+        nargs="*",
+        help="The packages to download, defaults to all of them",
+    )
+    parser.add_argument(
+        "--file",
+        action="append",
+        default=[],
+        dest="files",
+        help="Another file to download, relative to the version directory",
+    )
+    parser.add_argument(
+        "--directory",
+        default=LIBRARY_DIR,
+        help="Where to save the library, defaults to the package's _library",
+    )
+    args = parser.parse_args(argv)
+    downloaded = vendor(
+        args.version,
+        packages=args.packages or None,
+        files=args.files,
+        directory=args.directory,
+    )
+    print("Downloaded {} files to {}".format(len(downloaded), args.directory))
+
+
+if __name__ == "__main__":
+    main()
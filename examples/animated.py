@@ -7,7 +7,7 @@ import dash_html_components as html
 import numpy as np
 import pandas as pd
 from dash.dependencies import Input, Output
-from dash_google_charts import ScatterChart
+from dash_google_charts import ScatterChart, dataframe_to_datatable
 
 app = dash.Dash()
 
@@ -39,7 +39,7 @@ def generate_data(n):
             "y": np.random.uniform(-10, 10, 20),
         }
     )
-    return data.T.reset_index().T.values.tolist()
+    return dataframe_to_datatable(data)
 
 
 if __name__ == "__main__":
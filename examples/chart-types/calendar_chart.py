@@ -2,7 +2,7 @@ from datetime import date
 
 import dash
 import gviz_api
-from dash_google_charts import Calendar
+from dash_google_charts import Calendar, RawJSON
 
 data = gviz_api.DataTable(
     [("Date", "date"), ("Attendance", "number")],
@@ -46,7 +46,7 @@ data = gviz_api.DataTable(
 app = dash.Dash()
 
 app.layout = Calendar(
-    data=data.ToJSon(),
+    data=RawJSON(data.ToJSon()),
     options={"title": "Manchester United Attendance: 2018/19 season"},
     height="500px",
 )
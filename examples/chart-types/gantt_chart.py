@@ -2,7 +2,7 @@ from datetime import date
 
 import dash
 import gviz_api
-from dash_google_charts import GanttChart
+from dash_google_charts import GanttChart, RawJSON
 
 data = gviz_api.DataTable(
     [
@@ -65,7 +65,9 @@ data = gviz_api.DataTable(
 
 app = dash.Dash()
 
-app.layout = GanttChart(data=data.ToJSon(), width="1000px", height="300px")
+app.layout = GanttChart(
+    data=RawJSON(data.ToJSon()), width="1000px", height="300px"
+)
 
 if __name__ == "__main__":
     app.run_server(debug=True)
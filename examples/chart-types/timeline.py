@@ -2,7 +2,7 @@ from datetime import date
 
 import dash
 import gviz_api
-from dash_google_charts import Timeline
+from dash_google_charts import RawJSON, Timeline
 
 data = gviz_api.DataTable(
     [("President", "string"), ("Start", "date"), ("End", "date")],
@@ -15,7 +15,7 @@ data = gviz_api.DataTable(
 
 app = dash.Dash()
 
-app.layout = Timeline(data=data.ToJSon())
+app.layout = Timeline(data=RawJSON(data.ToJSon()))
 
 if __name__ == "__main__":
     app.run_server(debug=True)
@@ -0,0 +1,49 @@
+"""
+A Table of a million rows that is paged and sorted on the server, only ever
+sending the rows of the current page to the browser.
+"""
+import dash
+import numpy as np
+import pandas as pd
+from dash.dependencies import Input, Output
+from dash_google_charts import Table, dataframe_to_datatable
+from dash_google_charts.paging import DataFramePager
+
+N = 1_000_000
+PAGE_SIZE = 20
+
+rng = np.random.default_rng(0)
+df = pd.DataFrame(
+    {
+        "id": np.arange(N),
+        "account": rng.integers(1000, 9999, N).astype(str),
+        "amount": rng.normal(100, 50, N).round(2),
+        "timestamp": pd.Timestamp("2019-01-01")
+        + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, N), unit="s"),
+    }
+)
+pager = DataFramePager(df)
+
+app = dash.Dash()
+
+app.layout = Table(
+    id="table",
+    server_side=True,
+    page_size=PAGE_SIZE,
+    total_rows=len(pager),
+    data=dataframe_to_datatable(pager.page(0, PAGE_SIZE)),
+    width="100%",
+    height="auto",
+)
+
+
+@app.callback(
+    Output("table", "data"),
+    [Input("table", "page"), Input("table", "sort")],
+)
+def update_page(page, sort):
+    return dataframe_to_datatable(pager.page(page, PAGE_SIZE, sort))
+
+
+if __name__ == "__main__":
+    app.run_server(debug=True)
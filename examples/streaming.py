@@ -0,0 +1,41 @@
+"""
+Streaming example app, appending a few points to a LineChart on every tick of
+an interval rather than resending all of the data.
+"""
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+import numpy as np
+import pandas as pd
+from dash.dependencies import Input, Output
+from dash_google_charts import LineChart, dataframe_to_columnar
+
+app = dash.Dash()
+
+app.layout = html.Div(
+    [
+        dcc.Interval(id="interval", interval=1000),
+        LineChart(
+            id="line",
+            options={"title": "A streaming line chart", "legend": "none"},
+            width="100%",
+            max_rows=500,
+        ),
+    ]
+)
+
+
+@app.callback(
+    Output("line", "extend_data"), [Input("interval", "n_intervals")]
+)
+def extend_data(n):
+    n = n or 0
+    x = np.arange(5 * n, 5 * (n + 1))
+    data = pd.DataFrame(
+        {"x": x, "y": np.sin(x / 20) + np.random.normal(0, 0.1, 5)}
+    )
+    return dataframe_to_columnar(data)
+
+
+if __name__ == "__main__":
+    app.run_server(port=8888, debug=True)
@@ -0,0 +1,44 @@
+"""
+Level-of-detail example app. The chart only ever holds a couple of thousand
+points, but zooming in with the explorer fetches the full resolution data for
+the visible window. Only the window is sent, so right clicking to reset the
+zoom reports a view_window of None, which fetches the whole range again.
+"""
+import dash
+import numpy as np
+import pandas as pd
+from dash.dependencies import Input, Output
+from dash_google_charts import LineChart, dataframe_to_datatable
+from dash_google_charts.downsample import Pyramid
+
+N_POINTS = 1000000
+
+data = pd.DataFrame(
+    {
+        "time": pd.date_range("2020-01-01", periods=N_POINTS, freq="min"),
+        "value": np.cumsum(np.random.normal(size=N_POINTS)),
+    }
+)
+pyramid = Pyramid(data, max_points=2000)
+
+app = dash.Dash()
+
+app.layout = LineChart(
+    id="line",
+    options={
+        "title": "Zoom in to see more detail",
+        "legend": "none",
+        "explorer": {"actions": ["dragToZoom", "rightClickToReset"]},
+    },
+    width="100%",
+    height="500px",
+)
+
+
+@app.callback(Output("line", "data"), [Input("line", "view_window")])
+def zoom(view_window):
+    return dataframe_to_datatable(pyramid.query(view_window))
+
+
+if __name__ == "__main__":
+    app.run_server(port=8888, debug=True)
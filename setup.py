@@ -31,6 +31,7 @@ setup(
     url="https://github.com/tcbegley/dash-google-charts",
     packages=find_packages(),
     install_requires=["dash>=0.32.1", "dash-html-components"],
+    extras_require={"pandas": ["numpy", "pandas"]},
     include_package_data=True,
     classifiers=[
         "Development Status :: 4 - Beta",
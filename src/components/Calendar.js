@@ -40,11 +40,17 @@ Calendar.propTypes = {
   options: PropTypes.object,
 
   /**
-   * The data for the chart
+   * The data for the chart. Either an array of rows, a DataTable literal, or
+   * the columnar encoding produced by `dataframe_to_columnar`, optionally
+   * serialised as a JSON string. From Python a pandas DataFrame can also be
+   * passed, see `dataframe_to_datatable`, and JSON that has already been
+   * serialised, e.g. by `gviz_api`, can be wrapped in `RawJSON` to send it
+   * without encoding it again.
    */
   data: PropTypes.oneOfType([
     PropTypes.arrayOf(PropTypes.object),
-    PropTypes.object
+    PropTypes.object,
+    PropTypes.string
   ]),
 
   /**
@@ -68,7 +74,17 @@ Calendar.propTypes = {
   spreadSheetQueryParameters: PropTypes.object,
 
   /**
-   * Data formatting options.
+   * Formatters to apply to the data, a formatter specification or a list of
+   * them. Each is an object with `type`, one of Google's formatters e.g.
+   * 'NumberFormat', 'DateFormat', 'ColorFormat' or 'PatternFormat', and
+   * `options`, passed to the formatter's constructor. `column` is the
+   * index, id or label of the column to format. ColorFormat also takes the
+   * `ranges` to pass to `addRange`, as `[from, to, color, bgcolor]`.
+   * PatternFormat's options are the pattern, and it combines the
+   * `sourceColumns` into `column`, which defaults to the first source
+   * column. For PatternFormat `column` can also be the list of source
+   * columns, e.g. `{type: 'PatternFormat', column: [0, 1], options:
+   * '{0} ({1})'}`.
    */
   formatters: PropTypes.oneOfType([
     PropTypes.arrayOf(PropTypes.object),
@@ -88,7 +104,189 @@ Calendar.propTypes = {
   /**
    * DataTable object, can be combined with selection data for use in callbacks
    */
-  dataTable: PropTypes.object
+  dataTable: PropTypes.object,
+
+  /**
+   * What to send back to the server when the user makes a selection.
+   * 'full' sends `selection` together with the whole `dataTable`,
+   * 'rows' sends `selection` and the values of the selected rows in
+   * `selected_rows`, 'indices' sends only `selection`. Defaults to 'full'.
+   */
+  selection_payload: PropTypes.oneOf(['indices', 'rows', 'full']),
+
+  /**
+   * Columns (index, id or label) to include in `selected_rows` when
+   * `selection_payload` is 'rows'. All columns are included if not set.
+   */
+  selection_columns: PropTypes.arrayOf(
+    PropTypes.oneOfType([PropTypes.number, PropTypes.string])
+  ),
+
+  /**
+   * Values of the selected rows, populated when `selection_payload` is
+   * 'rows'
+   */
+  selected_rows: PropTypes.arrayOf(PropTypes.array),
+
+  /**
+   * Rows to append to the existing data, either an array of rows or the
+   * columnar encoding produced by `dataframe_to_columnar`. The chart is
+   * updated in place, so only the new rows need to be sent. A columnar
+   * payload also defines the columns if the chart has no data yet. Only the
+   * new rows are formatted with `formatters`. Appended rows and `data_patch`
+   * updates are kept when `formatters`, `view` or `transform` change, and
+   * discarded when `data` changes.
+   */
+  extend_data: PropTypes.oneOfType([
+    PropTypes.arrayOf(PropTypes.array),
+    PropTypes.object
+  ]),
+
+  /**
+   * The maximum number of rows to keep when appending with `extend_data`,
+   * the oldest rows are dropped first.
+   */
+  max_rows: PropTypes.number,
+
+  /**
+   * A list of updates to apply to the existing data in place. Each update is
+   * either a `[row, column, value]` or `[row, column, value, formatted]` cell
+   * update, `{op: 'replace', row, values}`, `{op: 'insert', row, rows}` or
+   * `{op: 'delete', row, count}`. Use `compute_patch` to generate it from
+   * the previous and current state of a table.
+   */
+  data_patch: PropTypes.arrayOf(
+    PropTypes.oneOfType([PropTypes.array, PropTypes.object])
+  ),
+
+  /**
+   * The range of the horizontal axis that is visible, reported as
+   * `{min, max}` whenever the user zooms or pans with `options.explorer`,
+   * but not when the chart is drawn, and as null when the user resets the
+   * zoom with a right click. Dates are reported as ISO 8601 strings in local
+   * time. Use with `dash_google_charts.downsample.Pyramid` to fetch more
+   * detail as the user zooms in.
+   */
+  view_window: PropTypes.object,
+
+  /**
+   * If true, loading Google Charts, building the DataTable and drawing the
+   * chart are deferred until the chart is close to being scrolled into view.
+   */
+  lazy: PropTypes.bool,
+
+  /**
+   * The height of the chart's container before a lazy chart has been drawn,
+   * defaults to `height`. Use to avoid layout shift when `height` is not a
+   * fixed size.
+   */
+  placeholder_height: PropTypes.oneOfType([
+    PropTypes.string,
+    PropTypes.number
+  ]),
+
+  /**
+   * The id of a `DataStore` to take the chart's data from instead of `data`.
+   * Several charts can share the data in a single DataStore.
+   */
+  source: PropTypes.string,
+
+  /**
+   * A view of the data to draw, applied as a DataView in the browser. Use
+   * with `source` to draw different parts of the same data. Accepts the keys
+   * `columns`, a list of column indices, ids or labels, or calculated
+   * columns like `{"calc": "ratio", "sourceColumns": [1, 2], "label": "..."}`
+   * where calc is one of 'stringify', 'sum', 'difference', 'product' or
+   * 'ratio'; `rows`, a list of row indices; and `filters`, a list of filters
+   * like `{"column": 0, "minValue": 10}`. `extend_data` and `data_patch`
+   * are ignored when `source` or `view` is set.
+   */
+  view: PropTypes.object,
+
+  /**
+   * Timings in milliseconds of the most recent time the chart went through
+   * each stage of drawing, also recorded as performance marks and measures.
+   * `load` is loading Google Charts, `build` is building the DataTable
+   * (including `format`, applying the formatters), `draw` is drawing the
+   * chart and `ready` is the time until the chart fired its ready event.
+   * Also includes `build_count`, `draw_count` and `rows`, the number of rows
+   * drawn. Only set if the chart is sampled, see `render_stats_sample_rate`.
+   * This prop is read-only.
+   */
+  render_stats: PropTypes.object,
+
+  /**
+   * The fraction of charts, between 0 and 1, that report `render_stats`
+   * after every draw. Each chart is sampled once when it is created. Defaults
+   * to 0, so that no stats are sent.
+   */
+  render_stats_sample_rate: PropTypes.number,
+
+  /**
+   * A hash of the contents of `data`, e.g. from
+   * `dash_google_charts.cache.memoize`. If set, the chart only rebuilds its
+   * DataTable when the hash changes, so it must be updated whenever `data`
+   * is. Callbacks can compare it with the hash of new data to avoid sending
+   * data the chart already has.
+   */
+  data_hash: PropTypes.string,
+
+  /**
+   * The name of a group of charts that follow each other's hover position,
+   * selection and zoom. Hovering over one chart draws a line at the same
+   * point on the horizontal axis of the others, selecting a point selects
+   * the rows with the same value in the first column in the others, and
+   * zooming or panning with `options.explorer` sets the same
+   * `hAxis.viewWindow` on the others. This all happens in the browser, only
+   * the chart the user interacts with reports its `selection` to Dash, at
+   * most four times a second.
+   */
+  sync_group: PropTypes.string,
+
+  /**
+   * Chart events to report to Dash in `last_event`, in addition to `select`.
+   * Each item is either the name of an event, e.g. "onmouseover", "ready",
+   * "page", "sort", "rangechange" or "animationfinish", or an object with
+   * the name as `event` and optionally `throttle_ms`, to report the event at
+   * most once every throttle_ms milliseconds, or `debounce_ms`, to report it
+   * once it has stopped firing for debounce_ms milliseconds. Events that
+   * fire in between are coalesced into a single report of the most recent
+   * one. onmouseover and onmouseout are throttled to 100ms by default.
+   */
+  events: PropTypes.arrayOf(
+    PropTypes.oneOfType([
+      PropTypes.string,
+      PropTypes.shape({
+        event: PropTypes.string.isRequired,
+        throttle_ms: PropTypes.number,
+        debounce_ms: PropTypes.number
+      })
+    ])
+  ),
+
+  /**
+   * The most recent event listed in `events`, with the event's `name`, its
+   * properties as `data`, e.g. the row and column of an onmouseover event,
+   * `count`, the number of events coalesced into this report, and the
+   * `timestamp` in milliseconds. This prop is read-only.
+   */
+  last_event: PropTypes.object,
+
+  /**
+   * A list of steps that transform the data in the browser before it is
+   * drawn, so that changing the transform doesn't resend the data. Each step
+   * is an object with a `type` of 'filter', with `filters` like
+   * `{"column": "region", "values": ["EU", "US"]}` or
+   * `{"column": 2, "minValue": 10}`; 'columns', with `columns` as in `view`;
+   * 'sort', with `columns` like `{"column": "sales", "desc": true}`;
+   * 'limit', with `limit` and optionally `offset`; or 'group', with `keys`,
+   * the columns to group by, and `columns` like
+   * `{"column": "sales", "aggregation": "sum"}`, where aggregation is one of
+   * 'sum', 'count', 'avg', 'min' or 'max'. Applied after `view` and before
+   * `formatters`. `extend_data` and `data_patch` are ignored when
+   * `transform` is set.
+   */
+  transform: PropTypes.arrayOf(PropTypes.object)
 };
 
 export default Calendar;
@@ -0,0 +1,53 @@
+import React from 'react';
+import PropTypes from 'prop-types';
+import {clearStoreData, setStoreData} from '../private/store';
+
+/**
+ * Holds data in the browser that can be shared by several charts, so that it
+ * only has to be sent once. Charts use the data by setting their `source` to
+ * the id of the DataStore, and can select part of it with `view`.
+ */
+class DataStore extends React.Component {
+  componentDidMount() {
+    setStoreData(this.props.id, this.props.data);
+  }
+
+  componentDidUpdate(prevProps) {
+    if (this.props.id !== prevProps.id) {
+      clearStoreData(prevProps.id);
+      setStoreData(this.props.id, this.props.data);
+    } else if (this.props.data !== prevProps.data) {
+      setStoreData(this.props.id, this.props.data);
+    }
+  }
+
+  componentWillUnmount() {
+    clearStoreData(this.props.id);
+  }
+
+  render() {
+    return null;
+  }
+}
+
+DataStore.propTypes = {
+  /**
+   * The ID of this component, used to identify dash components
+   * in callbacks, and by charts to refer to this DataStore in their
+   * `source`. The ID needs to be unique across all of the
+   * components in an app.
+   */
+  id: PropTypes.string.isRequired,
+
+  /**
+   * The data to share. Accepts the same formats as the `data` prop of the
+   * charts.
+   */
+  data: PropTypes.oneOfType([
+    PropTypes.arrayOf(PropTypes.object),
+    PropTypes.object,
+    PropTypes.string
+  ])
+};
+
+export default DataStore;
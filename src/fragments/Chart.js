@@ -0,0 +1,1336 @@
+import React from 'react';
+import PropTypes from 'prop-types';
+import {loadGoogleCharts} from '../private/loader';
+import {
+  applyFormatters,
+  applyView,
+  columnIndex,
+  copyColumns,
+  copyRows,
+  extendDataTable,
+  loadSpreadSheet,
+  patchDataTable,
+  patchedRows,
+  toDataTable
+} from '../private/data';
+import {deepEqual} from '../private/equality';
+import {getStoreDataTable, subscribe} from '../private/store';
+import {joinGroup, publish} from '../private/sync';
+import {applyTransform} from '../private/transform';
+import {debounce, startSpan, throttle} from '../private/timing';
+import {decodeInWorker, shouldDecodeInWorker} from '../private/worker';
+
+const HIDDEN_SERIES_COLOR = '#CCCCCC';
+
+// props that change the DataTable the chart draws. If only the view or
+// formatters change they are applied to the data the chart already has
+const DATA_PROPS = [
+  'data',
+  'diffdata',
+  'formatters',
+  'spreadSheetUrl',
+  'spreadSheetQueryParameters',
+  'source',
+  'view'
+];
+
+// the DATA_PROPS that the data itself comes from, deltas are applied to the
+// data they were sent for so are discarded when any of these change
+const SOURCE_PROPS = [
+  'data',
+  'diffdata',
+  'spreadSheetUrl',
+  'spreadSheetQueryParameters',
+  'source'
+];
+
+// props that are applied to the existing DataTable as a delta when changed
+const DELTA_PROPS = ['extend_data', 'data_patch'];
+
+// props that are set by the chart itself and never require a redraw
+const OUTPUT_PROPS = [
+  'selection',
+  'dataTable',
+  'selected_rows',
+  'view_window',
+  'last_event',
+  'render_stats',
+  'setProps'
+];
+
+// props that don't affect what is drawn
+const CONFIG_PROPS = [
+  'selection_payload',
+  'selection_columns',
+  'max_rows',
+  'lazy',
+  'placeholder_height',
+  'render_stats_sample_rate',
+  'data_hash',
+  'sync_group',
+  'events'
+];
+
+// props that can be applied by redrawing with the existing DataTable
+const REDRAW_PROPS = [
+  'options',
+  'height',
+  'width',
+  'style',
+  'className',
+  'server_side',
+  'page',
+  'page_size',
+  'sort',
+  'total_rows'
+];
+
+// props that are compared by value rather than identity, since Dash sends a
+// new object whenever a callback returns them, even if nothing changed
+const VALUE_PROPS = [
+  'data',
+  'diffdata',
+  'formatters',
+  'options',
+  'view',
+  'events',
+  'transform'
+];
+
+const VIEW_WINDOW_DEBOUNCE = 250;
+
+const RESIZE_DEBOUNCE = 100;
+
+// how often a chart in a sync_group reports its selection to Dash and sends
+// its view window to the rest of the group while the user interacts with it
+const SYNC_SELECTION_THROTTLE = 250;
+const SYNC_VIEW_WINDOW_THROTTLE = 50;
+
+const CROSSHAIR_COLOR = '#888888';
+
+// throttle_ms of events in `events` that fire as fast as the mouse moves, if
+// neither throttle_ms nor debounce_ms is given
+const DEFAULT_EVENT_THROTTLE = {onmouseover: 100, onmouseout: 100};
+
+// how close to the viewport a lazy chart has to be before it is drawn
+const LAZY_ROOT_MARGIN = '200px';
+
+// prefix of the names of the performance marks and measures of each chart
+const SPAN_PREFIX = 'dash-google-charts';
+
+// number of charts created, used to name the spans of charts without an id
+let chartCount = 0;
+
+// rows per page of a Table with server_side paging if page_size isn't set
+const DEFAULT_PAGE_SIZE = 10;
+
+class Chart extends React.Component {
+  constructor(props) {
+    super(props);
+
+    this.google = null;
+    this.chartWrapper = null;
+    this.dataTable = null;
+    this.hiddenColumns = {};
+    // number of times the DataTable has been built and the chart drawn,
+    // exposed on the container as data-build-count and data-draw-count
+    this.buildCount = 0;
+    this.drawCount = 0;
+    // deltas received before the DataTable has been built
+    this.pendingDeltas = [];
+    // the DataTable built from the data with the deltas applied to it, before
+    // the view, transform and formatters, which are applied to a copy
+    this.sourceTable = null;
+    // incremented on every draw, so that the results of an asynchronous
+    // build can be dropped if the chart has been drawn again since it started
+    this.drawToken = 0;
+    // whether a DataTable is being built asynchronously
+    this.pendingBuild = false;
+    // durations of the most recent spans of each kind, see timeSpan
+    this.renderStats = {};
+    this.spanName = `${SPAN_PREFIX}:${props.id || chartCount}`;
+    chartCount++;
+    // whether this chart reports render_stats, decided once per chart so
+    // that a sampled chart reports every draw
+    this.reportStats = Math.random() < (props.render_stats_sample_rate || 0);
+    this.state = {visible: !props.lazy};
+
+    this.setContainer = this.setContainer.bind(this);
+    this.onSelect = this.onSelect.bind(this);
+    this.onPage = this.onPage.bind(this);
+    this.onSort = this.onSort.bind(this);
+    // listeners for the chart events in the events prop, see listenToEvents
+    this.eventListeners = [];
+    this.onSyncEvent = this.onSyncEvent.bind(this);
+    this.onMouseMove = this.onMouseMove.bind(this);
+    this.onMouseLeave = this.onMouseLeave.bind(this);
+    this.onContextMenu = this.onContextMenu.bind(this);
+    this.onAnimationFinish = this.onAnimationFinish.bind(this);
+    this.syncInteraction = this.syncInteraction.bind(this);
+    this.reportSelectionThrottled = throttle(
+      this.reportSelection.bind(this),
+      SYNC_SELECTION_THROTTLE
+    );
+    this.publishViewWindow = throttle(
+      this.publishViewWindow.bind(this),
+      SYNC_VIEW_WINDOW_THROTTLE
+    );
+    this.reportViewWindow = debounce(
+      this.reportViewWindow.bind(this),
+      VIEW_WINDOW_DEBOUNCE
+    );
+    this.onResize = debounce(this.onResize.bind(this), RESIZE_DEBOUNCE);
+  }
+
+  componentDidMount() {
+    if (this.state.visible || !window.IntersectionObserver) {
+      this.initialise();
+      return;
+    }
+    // defer loading, building the DataTable and drawing until the chart is
+    // close to being scrolled into view
+    this.observer = new window.IntersectionObserver(
+      entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          this.observer.disconnect();
+          this.observer = null;
+          this.setState({visible: true}, () => this.initialise());
+        }
+      },
+      {rootMargin: LAZY_ROOT_MARGIN}
+    );
+    this.observer.observe(this.container);
+  }
+
+  initialise() {
+    const endLoad = this.startSpan('load');
+    loadGoogleCharts(this.props).then(google => {
+      if (this.unmounted) {
+        return;
+      }
+      endLoad();
+      this.google = google;
+      this.chartWrapper = new google.visualization.ChartWrapper();
+      google.visualization.events.addListener(
+        this.chartWrapper,
+        'select',
+        this.onSelect
+      );
+      google.visualization.events.addListener(
+        this.chartWrapper,
+        'ready',
+        this.onReady.bind(this)
+      );
+      // zooming and panning with options.explorer doesn't fire any chart
+      // events, so watch for the interactions on the container instead
+      this.container.addEventListener('wheel', this.reportViewWindow);
+      this.container.addEventListener('mouseup', this.reportViewWindow);
+      this.container.addEventListener('wheel', this.syncInteraction);
+      this.container.addEventListener('mouseup', this.syncInteraction);
+      this.container.addEventListener('mousemove', this.onMouseMove);
+      this.container.addEventListener('mouseleave', this.onMouseLeave);
+      this.container.addEventListener('contextmenu', this.onContextMenu);
+      this.joinSyncGroup();
+      if (window.ResizeObserver) {
+        // charts with a relative size have to be redrawn to fit
+        this.resizeObserver = new window.ResizeObserver(this.onResize);
+        this.resizeObserver.observe(this.container);
+      }
+      this.subscribe();
+      this.draw();
+    });
+  }
+
+  componentDidUpdate(prevProps) {
+    if (this.google && this.props.source !== prevProps.source) {
+      this.subscribe();
+    }
+    if (this.google && this.props.sync_group !== prevProps.sync_group) {
+      this.joinSyncGroup();
+    }
+    if (this.listenedChart && this.propChanged('events', prevProps)) {
+      this.listenToEvents(this.listenedChart);
+    }
+    if (this.props.options !== prevProps.options) {
+      // options from the server take over from a view window set by the
+      // rest of the sync_group
+      this.syncedViewWindow = null;
+    }
+    const changedProps = Object.keys(this.props).filter(prop =>
+      this.propChanged(prop, prevProps)
+    );
+    const dataPropsChanged = changedProps.some(prop =>
+      DATA_PROPS.includes(prop)
+    );
+    const sourceChanged = changedProps.some(prop =>
+      SOURCE_PROPS.includes(prop)
+    );
+    if (sourceChanged) {
+      this.pendingDeltas = [];
+    }
+    if (
+      !this.dataTable ||
+      this.pendingBuild ||
+      sourceChanged ||
+      (dataPropsChanged && !this.sourceTable)
+    ) {
+      const deltas = this.changedDeltas(prevProps);
+      if (Object.keys(deltas).length > 0) {
+        this.pendingDeltas.push(deltas);
+      }
+      if (this.chartWrapper && dataPropsChanged) {
+        this.draw();
+      }
+      return;
+    }
+    if (dataPropsChanged || changedProps.includes('transform')) {
+      if (this.sourceTable) {
+        // apply the view, transform and formatters to the data the chart
+        // already has, including the deltas applied to it
+        this.applyDeltas(this.sourceTable, [this.changedDeltas(prevProps)]);
+        this.drawDataTable(this.viewTable());
+      } else {
+        this.draw();
+      }
+      return;
+    }
+    const dataChanged = this.applyDeltas(this.dataTable, [
+      this.changedDeltas(prevProps)
+    ]);
+    const drawProps = changedProps.filter(
+      prop =>
+        !DELTA_PROPS.includes(prop) &&
+        !OUTPUT_PROPS.includes(prop) &&
+        !CONFIG_PROPS.includes(prop)
+    );
+    if (dataChanged || drawProps.some(prop => !REDRAW_PROPS.includes(prop))) {
+      this.drawDataTable(this.dataTable);
+    } else if (drawProps.length > 0) {
+      this.redraw();
+    }
+  }
+
+  propChanged(prop, prevProps) {
+    const value = this.props[prop];
+    const prevValue = prevProps[prop];
+    if (value === prevValue) {
+      return false;
+    }
+    if (
+      prop === 'data' &&
+      this.props.data_hash &&
+      this.props.data_hash === prevProps.data_hash
+    ) {
+      // the server says the content is the same, skip comparing it
+      return false;
+    }
+    return !(VALUE_PROPS.includes(prop) && deepEqual(value, prevValue));
+  }
+
+  componentWillUnmount() {
+    this.unmounted = true;
+    if (this.unsubscribe) {
+      this.unsubscribe();
+    }
+    if (this.observer) {
+      this.observer.disconnect();
+    }
+    this.reportViewWindow.cancel();
+    this.onResize.cancel();
+    this.reportSelectionThrottled.cancel();
+    this.eventListeners.forEach(({report}) => report.cancel());
+    this.publishViewWindow.cancel();
+    if (this.leaveSyncGroup) {
+      this.leaveSyncGroup();
+    }
+    if (this.hoverFrame) {
+      window.cancelAnimationFrame(this.hoverFrame);
+    }
+    if (this.resizeObserver) {
+      this.resizeObserver.disconnect();
+    }
+    if (this.container) {
+      this.container.removeEventListener('wheel', this.reportViewWindow);
+      this.container.removeEventListener('mouseup', this.reportViewWindow);
+      this.container.removeEventListener('wheel', this.syncInteraction);
+      this.container.removeEventListener('mouseup', this.syncInteraction);
+      this.container.removeEventListener('mousemove', this.onMouseMove);
+      this.container.removeEventListener('mouseleave', this.onMouseLeave);
+      this.container.removeEventListener('contextmenu', this.onContextMenu);
+    }
+    if (this.chartWrapper) {
+      this.google.visualization.events.removeAllListeners(this.chartWrapper);
+      const chart = this.chartWrapper.getChart();
+      if (chart && chart.clearChart) {
+        chart.clearChart();
+      }
+    }
+  }
+
+  /**
+   * Redraw whenever the data in the DataStore used as the source changes.
+   */
+  subscribe() {
+    const {source} = this.props;
+    if (this.unsubscribe) {
+      this.unsubscribe();
+      this.unsubscribe = null;
+    }
+    if (source) {
+      this.unsubscribe = subscribe(source, () => this.draw());
+    }
+  }
+
+  /**
+   * Join the chart's sync_group, leaving the group it was in before.
+   */
+  joinSyncGroup() {
+    const {sync_group} = this.props;
+    if (this.leaveSyncGroup) {
+      this.leaveSyncGroup();
+      this.leaveSyncGroup = null;
+    }
+    this.showCrosshair(null);
+    if (sync_group) {
+      this.leaveSyncGroup = joinGroup(sync_group, this.onSyncEvent);
+    }
+  }
+
+  /**
+   * Send an event to the other charts in the sync_group.
+   */
+  publish(event, payload) {
+    const {sync_group} = this.props;
+    if (sync_group) {
+      publish(sync_group, this.onSyncEvent, event, payload);
+    }
+  }
+
+  onSyncEvent(event, payload) {
+    if (!this.dataTable || this.unmounted) {
+      return;
+    }
+    if (event === 'hover') {
+      this.showCrosshair(payload);
+    } else if (event === 'select') {
+      this.setSyncedSelection(payload);
+    } else if (event === 'viewWindow') {
+      this.setSyncedViewWindow(payload);
+    }
+  }
+
+  /**
+   * Start timing a span, which is recorded in render_stats under name when it
+   * ends.
+   */
+  startSpan(name) {
+    const end = startSpan(`${this.spanName}:${name}`);
+    return () => {
+      this.renderStats[name] = end();
+    };
+  }
+
+  setContainer(container) {
+    this.container = container;
+  }
+
+  draw() {
+    const {
+      data,
+      diffdata,
+      source,
+      spreadSheetUrl,
+      spreadSheetQueryParameters,
+      view
+    } = this.props;
+    const token = ++this.drawToken;
+    this.sourceTable = null;
+    this.baseTable = null;
+    const endBuild = this.startSpan('build');
+    const finish = dataTable => {
+      if (token !== this.drawToken) {
+        return;
+      }
+      this.pendingBuild = false;
+      endBuild();
+      this.drawNewDataTable(dataTable);
+    };
+    if (spreadSheetUrl) {
+      this.pendingBuild = true;
+      loadSpreadSheet(
+        this.google,
+        spreadSheetUrl,
+        spreadSheetQueryParameters
+      ).then(dataTable => {
+        if (token === this.drawToken) {
+          this.sourceTable = dataTable;
+          finish(this.viewTable());
+        }
+      });
+    } else if (!diffdata && !source && !view && shouldDecodeInWorker(data)) {
+      // parse and decode large payloads off the main thread, falling back
+      // to decoding them here if the worker can't be used
+      this.pendingBuild = true;
+      decodeInWorker(data)
+        .catch(() => data)
+        .then(decoded => {
+          if (token === this.drawToken) {
+            finish(this.buildDataTable(decoded));
+          }
+        });
+    } else {
+      this.pendingBuild = false;
+      finish(this.buildDataTable());
+    }
+  }
+
+  drawNewDataTable(dataTable) {
+    this.applyDeltas(dataTable, this.pendingDeltas);
+    this.pendingDeltas = [];
+    this.drawDataTable(dataTable);
+  }
+
+  buildDataTable(data = this.props.data) {
+    const {chartType, diffdata, source, view} = this.props;
+    this.buildCount++;
+    const {google} = this;
+    if (source) {
+      // the DataTable of a DataStore is shared, so it is built once by
+      // whichever chart draws first and only ever read through a DataView
+      this.sourceTable =
+        getStoreDataTable(source, storeData =>
+          toDataTable(google, storeData)
+        ) || new google.visualization.DataTable();
+      return this.viewTable();
+    }
+    if (diffdata && !view) {
+      const oldData = toDataTable(google, diffdata.old);
+      const newData = toDataTable(google, diffdata.new);
+      return google.visualization[chartType].prototype.computeDiff(
+        oldData,
+        newData
+      );
+    }
+    this.sourceTable = toDataTable(google, data || []);
+    return this.viewTable();
+  }
+
+  /**
+   * Apply the view, transform and formatters to the sourceTable.
+   */
+  viewTable() {
+    const {view} = this.props;
+    this.baseTable = view
+      ? applyView(this.google, this.sourceTable, view)
+      : this.sourceTable;
+    return this.transformTable(this.baseTable);
+  }
+
+  /**
+   * Apply the transform and formatters to the DataTable or DataView built
+   * from the data. base is left untouched, so that they can be changed
+   * without rebuilding it.
+   */
+  transformTable(base) {
+    const {formatters, transform} = this.props;
+    const {google} = this;
+    let dataTable = transform ? applyTransform(google, base, transform) : base;
+    if (formatters) {
+      if (dataTable instanceof google.visualization.DataView) {
+        dataTable = dataTable.toDataTable();
+      } else if (dataTable === base) {
+        dataTable = dataTable.clone();
+      }
+      this.applyFormatters(dataTable, formatters);
+    }
+    return dataTable;
+  }
+
+  /**
+   * The delta props that have changed since prevProps.
+   */
+  changedDeltas(prevProps) {
+    const deltas = {};
+    DELTA_PROPS.forEach(prop => {
+      if (this.props[prop] && this.props[prop] !== prevProps[prop]) {
+        deltas[prop] = this.props[prop];
+      }
+    });
+    return deltas;
+  }
+
+  /**
+   * Apply a list of deltas in order to the sourceTable and dataTable, the
+   * formatted copy of it drawn by the chart, formatting only the rows that
+   * changed. Returns true if the data was changed.
+   */
+  applyDeltas(dataTable, deltas) {
+    const {diffdata, max_rows, source, transform, view} = this.props;
+    const base = this.sourceTable;
+    if (diffdata || source || transform || view || !base) {
+      return false;
+    }
+    let changed = false;
+    deltas.forEach(({data_patch, extend_data}) => {
+      if (data_patch && patchDataTable(base, data_patch)) {
+        changed = true;
+        if (dataTable !== base) {
+          patchDataTable(dataTable, data_patch);
+          this.formatRows(dataTable, patchedRows(data_patch));
+        }
+      }
+      if (extend_data) {
+        extendDataTable(base, extend_data, max_rows);
+        changed = true;
+        if (dataTable !== base) {
+          this.formatAppendedRows(dataTable, extend_data.length);
+        }
+      }
+    });
+    return changed;
+  }
+
+  /**
+   * Append the last count rows of the sourceTable to dataTable, dropping
+   * the rows max_rows dropped from it, and format them.
+   */
+  formatAppendedRows(dataTable, count) {
+    const base = this.sourceTable;
+    if (dataTable.getNumberOfColumns() === 0) {
+      // the columns came with the first rows
+      copyColumns(base, dataTable);
+    }
+    const numberOfRows = base.getNumberOfRows();
+    const added = Math.min(count, numberOfRows);
+    dataTable.addRows(added);
+    const excess = dataTable.getNumberOfRows() - numberOfRows;
+    if (excess > 0) {
+      dataTable.removeRows(0, excess);
+    }
+    const rows = [];
+    for (let row = numberOfRows - added; row < numberOfRows; row++) {
+      rows.push(row);
+    }
+    this.formatRows(dataTable, rows);
+  }
+
+  /**
+   * Copy rows of the sourceTable to the same rows of dataTable, formatted
+   * with the formatters. Formatters format whole columns, so the rows are
+   * formatted in a DataTable of their own. Formatters that depend on the
+   * rest of the column, like BarFormat without min and max, are only exact
+   * when the chart is rebuilt.
+   */
+  formatRows(dataTable, rows) {
+    if (rows.length === 0) {
+      return;
+    }
+    const view = new this.google.visualization.DataView(this.sourceTable);
+    view.setRows(rows);
+    const formatted = view.toDataTable();
+    this.applyFormatters(formatted, this.props.formatters);
+    copyRows(formatted, dataTable, rows);
+  }
+
+  applyFormatters(dataTable, formatters) {
+    const endFormat = this.startSpan('format');
+    applyFormatters(this.google, dataTable, formatters);
+    endFormat();
+  }
+
+  drawDataTable(dataTable) {
+    if (this.unmounted) {
+      return;
+    }
+    const {chartType, options} = this.props;
+    this.dataTable = dataTable;
+    this.chartWrapper.setChartType(chartType);
+    this.chartWrapper.setOptions(this.chartOptions(options));
+    this.chartWrapper.setDataTable(this.applyHiddenColumns(dataTable));
+    this.drawChart();
+  }
+
+  /**
+   * Fast path for changes that only affect options or the size of the chart,
+   * which redraws using the DataTable the chart already has.
+   */
+  redraw() {
+    const {options} = this.props;
+    this.chartWrapper.setOptions(this.chartOptions(options));
+    this.drawChart();
+  }
+
+  drawChart() {
+    const endDraw = this.startSpan('draw');
+    this.endReady = this.startSpan('ready');
+    this.chartWrapper.draw(this.container);
+    endDraw();
+    this.drawnSize = this.containerSize();
+    this.drawCount++;
+    this.container.setAttribute('data-build-count', this.buildCount);
+    this.container.setAttribute('data-draw-count', this.drawCount);
+  }
+
+  containerSize() {
+    return [this.container.clientWidth, this.container.clientHeight];
+  }
+
+  onResize() {
+    if (!this.dataTable || this.unmounted) {
+      return;
+    }
+    const [width, height] = this.containerSize();
+    if (width !== this.drawnSize[0] || height !== this.drawnSize[1]) {
+      this.redraw();
+    }
+  }
+
+  applyHiddenColumns(dataTable) {
+    if (!this.props.legend_toggle || !this.anyHiddenColumns()) {
+      return dataTable;
+    }
+    const view = new this.google.visualization.DataView(dataTable);
+    const columns = [];
+    for (let i = 0; i < dataTable.getNumberOfColumns(); i++) {
+      if (this.hiddenColumns[i]) {
+        columns.push({
+          label: dataTable.getColumnLabel(i),
+          type: dataTable.getColumnType(i),
+          calc: () => null
+        });
+      } else {
+        columns.push(i);
+      }
+    }
+    view.setColumns(columns);
+    return view;
+  }
+
+  chartOptions(options) {
+    const chartOptions = this.applySyncedViewWindow(
+      this.applyHiddenColumnOptions(options)
+    );
+    return this.props.server_side
+      ? this.applyServerSideOptions(chartOptions)
+      : chartOptions;
+  }
+
+  /**
+   * Options that make a Table fire page and sort events instead of paging
+   * and sorting itself, so that the server can send each page as requested.
+   * The data only holds the current page, so as far as the Table knows it
+   * is always on its first page, and only has previous and next buttons.
+   */
+  applyServerSideOptions(options = {}) {
+    const {page, page_size, sort, total_rows} = this.props;
+    const pageSize = page_size || DEFAULT_PAGE_SIZE;
+    const serverSideOptions = {
+      page: 'event',
+      sort: 'event',
+      pageSize: pageSize,
+      startPage: 0,
+      pagingButtons: page ? 'both' : 'next'
+    };
+    if (total_rows !== null && total_rows !== undefined) {
+      const lastPage = Math.ceil(total_rows / pageSize) - 1;
+      if (lastPage <= 0) {
+        serverSideOptions.pagingButtons = 'auto';
+      } else if (page >= lastPage) {
+        serverSideOptions.pagingButtons = 'prev';
+      }
+    }
+    const sortColumn = sort && this.sortColumnIndex(sort.column);
+    if (sortColumn !== null && sortColumn !== undefined) {
+      serverSideOptions.sortColumn = sortColumn;
+      serverSideOptions.sortAscending = sort.ascending !== false;
+    }
+    return Object.assign({}, options, serverSideOptions);
+  }
+
+  /**
+   * The index of the column the server sorted by, or null if the data
+   * doesn't have it, e.g. because it was sorted by a column that isn't sent.
+   */
+  sortColumnIndex(column) {
+    if (!this.dataTable) {
+      return null;
+    }
+    try {
+      const index = columnIndex(this.dataTable, column);
+      return index < this.dataTable.getNumberOfColumns() ? index : null;
+    } catch (error) {
+      return null;
+    }
+  }
+
+  applySyncedViewWindow(options = {}) {
+    if (!this.syncedViewWindow) {
+      return options;
+    }
+    return Object.assign({}, options, {
+      hAxis: Object.assign({}, options.hAxis, {
+        viewWindow: this.syncedViewWindow
+      })
+    });
+  }
+
+  applyHiddenColumnOptions(options = {}) {
+    if (!this.props.legend_toggle || !this.anyHiddenColumns()) {
+      return options;
+    }
+    const series = Object.assign({}, options.series);
+    Object.keys(this.hiddenColumns)
+      .filter(column => this.hiddenColumns[column])
+      .forEach(column => {
+        const index = column - 1;
+        series[index] = Object.assign({}, series[index], {
+          color: HIDDEN_SERIES_COLOR
+        });
+      });
+    return Object.assign({}, options, {series: series});
+  }
+
+  anyHiddenColumns() {
+    return Object.keys(this.hiddenColumns).some(
+      column => this.hiddenColumns[column]
+    );
+  }
+
+  onReady() {
+    if (this.endReady) {
+      this.endReady();
+      this.endReady = null;
+      this.reportRenderStats();
+    }
+    const chart = this.chartWrapper.getChart();
+    if (chart && chart !== this.listenedChart) {
+      // the chart object is recreated when the chart type changes
+      this.listenedChart = chart;
+      this.google.visualization.events.addListener(
+        chart,
+        'animationfinish',
+        this.onAnimationFinish
+      );
+      if (this.props.chartType === 'Table') {
+        this.google.visualization.events.addListener(
+          chart,
+          'page',
+          this.onPage
+        );
+        this.google.visualization.events.addListener(
+          chart,
+          'sort',
+          this.onSort
+        );
+      }
+      this.listenToEvents(chart);
+    }
+    // the chart's own ready event fires before the listeners can be added
+    this.eventListeners
+      .filter(({name}) => name === 'ready')
+      .forEach(({report}) => report());
+    this.drawnViewWindow = this.viewWindowBounds();
+    this.readyViewWindow = this.drawnViewWindow;
+  }
+
+  onAnimationFinish() {
+    // the view window is only final once an animated draw has finished
+    this.readyViewWindow = this.viewWindowBounds();
+  }
+
+  /**
+   * Listen to the chart events in the events prop, replacing the listeners
+   * for the previous value of the prop. Each event is reported to Dash in
+   * last_event, throttled or debounced as configured.
+   */
+  listenToEvents(chart) {
+    const {events: chartEvents} = this.google.visualization;
+    this.eventListeners.forEach(({handle, report}) => {
+      if (handle) {
+        chartEvents.removeListener(handle);
+      }
+      report.cancel();
+    });
+    this.eventListeners = (this.props.events || []).map(spec => {
+      const config = typeof spec === 'string' ? {event: spec} : spec;
+      const name = config.event;
+      const report = this.eventReporter(name, config);
+      const handle =
+        name === 'ready' ? null : chartEvents.addListener(chart, name, report);
+      return {name: name, handle: handle, report: report};
+    });
+  }
+
+  /**
+   * A function that reports an event to Dash in last_event. Events that
+   * fire while a report is throttled or debounced are coalesced into one
+   * report of the most recent event, with count the number of events it
+   * stands for.
+   */
+  eventReporter(name, {throttle_ms, debounce_ms}) {
+    let count = 0;
+    const send = data => {
+      const {setProps} = this.props;
+      if (setProps && !this.unmounted) {
+        setProps({
+          last_event: {
+            name: name,
+            data: data,
+            count: count,
+            timestamp: Date.now()
+          }
+        });
+      }
+      count = 0;
+    };
+    let throttleMs = throttle_ms;
+    if (throttleMs === undefined && debounce_ms === undefined) {
+      throttleMs = DEFAULT_EVENT_THROTTLE[name];
+    }
+    let limited = send;
+    if (debounce_ms) {
+      limited = debounce(send, debounce_ms);
+    } else if (throttleMs) {
+      limited = throttle(send, throttleMs);
+    }
+    const report = event => {
+      count++;
+      limited(toJSONValue(event === undefined ? null : event));
+    };
+    report.cancel = () => {
+      if (limited.cancel) {
+        limited.cancel();
+      }
+      count = 0;
+    };
+    return report;
+  }
+
+  /**
+   * Send the durations of the most recent spans to Dash as render_stats, if
+   * this chart was sampled.
+   */
+  reportRenderStats() {
+    const {setProps} = this.props;
+    if (!setProps || !this.reportStats) {
+      return;
+    }
+    setProps({
+      render_stats: Object.assign({}, this.renderStats, {
+        build_count: this.buildCount,
+        draw_count: this.drawCount,
+        rows: this.dataTable ? this.dataTable.getNumberOfRows() : 0
+      })
+    });
+  }
+
+  /**
+   * Report the range of the horizontal axis that is currently visible after
+   * the user zooms or pans with `options.explorer`. Windows that are only
+   * drawn, e.g. because the data changed, aren't reported, so a callback
+   * that sends the data for the window isn't triggered again by the window
+   * that data is drawn with.
+   */
+  reportViewWindow() {
+    const {setProps, view_window} = this.props;
+    const viewWindow = this.viewWindowBounds();
+    if (
+      !setProps ||
+      !viewWindow ||
+      sameBounds(viewWindow, this.readyViewWindow)
+    ) {
+      return;
+    }
+    this.readyViewWindow = viewWindow;
+    const bounds = viewWindow.map(value =>
+      value instanceof Date ? localISOString(value) : value
+    );
+    if (
+      view_window &&
+      view_window.min === bounds[0] &&
+      view_window.max === bounds[1]
+    ) {
+      return;
+    }
+    setProps({view_window: {min: bounds[0], max: bounds[1]}});
+  }
+
+  /**
+   * Report a reset of the zoom with the explorer's rightClickToReset as a
+   * view_window of null, as the data drawn may only cover the window that
+   * was zoomed to and the explorer can't zoom out of it.
+   */
+  onContextMenu() {
+    const {options, setProps, view_window} = this.props;
+    const explorer = options && options.explorer;
+    if (!setProps || !view_window || !explorer) {
+      return;
+    }
+    // rightClickToReset is one of the explorer's default actions
+    const {actions} = explorer;
+    if (!actions || actions.includes('rightClickToReset')) {
+      this.reportViewWindow.cancel();
+      setProps({view_window: null});
+    }
+  }
+
+  /**
+   * The range of the horizontal axis that is currently visible, or null if
+   * the chart doesn't have one.
+   */
+  viewWindowBounds() {
+    const layout = this.layoutInterface();
+    if (!layout) {
+      return null;
+    }
+    const chartArea = layout.getChartAreaBoundingBox();
+    const bounds = [
+      layout.getHAxisValue(chartArea.left),
+      layout.getHAxisValue(chartArea.left + chartArea.width)
+    ];
+    if (bounds.some(value => value === null || value === undefined)) {
+      return null;
+    }
+    return bounds;
+  }
+
+  layoutInterface() {
+    const chart = this.chartWrapper && this.chartWrapper.getChart();
+    if (!chart || !chart.getChartLayoutInterface) {
+      return null;
+    }
+    return chart.getChartLayoutInterface();
+  }
+
+  /**
+   * Send the view window to the rest of the sync_group after the user has
+   * zoomed or panned. Only interactions with this chart are sent, so that
+   * charts redrawn with a view window from the group don't send it back.
+   */
+  syncInteraction() {
+    if (this.props.sync_group) {
+      this.publishViewWindow();
+    }
+  }
+
+  publishViewWindow() {
+    const bounds = this.viewWindowBounds();
+    if (!bounds || sameBounds(bounds, this.drawnViewWindow)) {
+      return;
+    }
+    this.drawnViewWindow = bounds;
+    // keep the window if this chart is redrawn, e.g. when it is resized
+    this.syncedViewWindow = {min: bounds[0], max: bounds[1]};
+    this.publish('viewWindow', this.syncedViewWindow);
+  }
+
+  setSyncedViewWindow(viewWindow) {
+    const bounds = [viewWindow.min, viewWindow.max];
+    if (!this.layoutInterface() || sameBounds(bounds, this.drawnViewWindow)) {
+      return;
+    }
+    this.syncedViewWindow = viewWindow;
+    this.drawnViewWindow = bounds;
+    this.redraw();
+  }
+
+  onMouseMove(event) {
+    if (!this.props.sync_group) {
+      return;
+    }
+    if (event.buttons) {
+      // dragging to pan with options.explorer
+      this.publishViewWindow();
+    }
+    // send the position at most once per frame
+    this.hoverX = event.clientX;
+    if (!this.hoverFrame) {
+      this.hoverFrame = window.requestAnimationFrame(() => {
+        this.hoverFrame = null;
+        this.publish('hover', this.hAxisValueAt(this.hoverX));
+      });
+    }
+  }
+
+  onMouseLeave() {
+    if (!this.props.sync_group) {
+      return;
+    }
+    if (this.hoverFrame) {
+      window.cancelAnimationFrame(this.hoverFrame);
+      this.hoverFrame = null;
+    }
+    this.publish('hover', null);
+  }
+
+  /**
+   * The value on the horizontal axis at clientX, or null if it is outside
+   * the chart area.
+   */
+  hAxisValueAt(clientX) {
+    const layout = this.layoutInterface();
+    if (!layout) {
+      return null;
+    }
+    const chartArea = layout.getChartAreaBoundingBox();
+    const x = clientX - this.chartElement().getBoundingClientRect().left;
+    if (x < chartArea.left || x > chartArea.left + chartArea.width) {
+      return null;
+    }
+    return layout.getHAxisValue(x);
+  }
+
+  /**
+   * Draw a vertical line at value on the horizontal axis, following the
+   * mouse over another chart in the sync_group. Hidden if value is null.
+   */
+  showCrosshair(value) {
+    const layout =
+      value === null || value === undefined ? null : this.layoutInterface();
+    const chartArea = layout && layout.getChartAreaBoundingBox();
+    const x = layout && layout.getXLocation(value);
+    if (
+      !layout ||
+      !Number.isFinite(x) ||
+      x < chartArea.left ||
+      x > chartArea.left + chartArea.width
+    ) {
+      if (this.crosshair) {
+        this.crosshair.style.display = 'none';
+      }
+      return;
+    }
+    const crosshair = this.crosshairElement();
+    crosshair.style.left = `${Math.round(x)}px`;
+    crosshair.style.top = `${chartArea.top}px`;
+    crosshair.style.height = `${chartArea.height}px`;
+    crosshair.style.display = 'block';
+  }
+
+  crosshairElement() {
+    const parent = this.chartElement();
+    if (!this.crosshair || this.crosshair.parentNode !== parent) {
+      // drawing the chart replaces its elements, so the line is added again
+      this.crosshair = document.createElement('div');
+      Object.assign(this.crosshair.style, {
+        position: 'absolute',
+        width: '1px',
+        background: CROSSHAIR_COLOR,
+        pointerEvents: 'none',
+        zIndex: 1
+      });
+      parent.appendChild(this.crosshair);
+    }
+    return this.crosshair;
+  }
+
+  /**
+   * The element Google Charts draws into, which the layout interface's
+   * coordinates are relative to.
+   */
+  chartElement() {
+    return this.container.firstElementChild || this.container;
+  }
+
+  /**
+   * Select the rows with the same values in the first column as the rows
+   * selected in another chart in the sync_group.
+   */
+  setSyncedSelection(values) {
+    const chart = this.chartWrapper.getChart();
+    if (!chart || !chart.setSelection) {
+      return;
+    }
+    const dataTable = this.dataTable;
+    const numberOfColumns = dataTable.getNumberOfColumns();
+    const selection = [];
+    values.forEach(({value, column}) => {
+      dataTable
+        .getFilteredRows([{column: 0, value: value}])
+        .forEach(row =>
+          selection.push({
+            row: row,
+            column: column < numberOfColumns ? column : null
+          })
+        );
+    });
+    // setSelection doesn't fire a select event, so this isn't sent back
+    chart.setSelection(selection);
+  }
+
+  onSelect() {
+    const {legend_toggle, sync_group} = this.props;
+    const chart = this.chartWrapper.getChart();
+    const selection = chart.getSelection();
+    if (
+      legend_toggle &&
+      selection.length > 0 &&
+      selection[0].row === null &&
+      selection[0].column !== null
+    ) {
+      const {column} = selection[0];
+      this.hiddenColumns[column] = !this.hiddenColumns[column];
+      this.drawDataTable(this.dataTable);
+    }
+    if (sync_group) {
+      this.publish(
+        'select',
+        selection
+          .filter(item => item.row !== null && item.row !== undefined)
+          .map(item => ({
+            value: this.dataTable.getValue(item.row, 0),
+            column: item.column
+          }))
+      );
+      // the group is updated straight away, Dash at a throttled rate
+      this.reportSelectionThrottled(selection);
+    } else {
+      this.reportSelection(selection);
+    }
+  }
+
+  reportSelection(selection) {
+    const {selection_payload, setProps} = this.props;
+    const chartWrapper = this.chartWrapper;
+    if (!setProps || this.unmounted) {
+      return;
+    }
+    if (selection_payload === 'indices') {
+      setProps({selection: selection});
+    } else if (selection_payload === 'rows') {
+      setProps({
+        selection: selection,
+        selected_rows: this.selectedRows(this.dataTable, selection)
+      });
+    } else {
+      let dataTable = chartWrapper.getDataTable();
+      if (dataTable instanceof this.google.visualization.DataView) {
+        dataTable = dataTable.toDataTable();
+      }
+      setProps({selection: selection, dataTable: dataTable});
+    }
+  }
+
+  onPage({page}) {
+    const {server_side, setProps} = this.props;
+    if (server_side && setProps) {
+      // the Table is always on its first page, so page is 1 for the next
+      // page and -1 for the previous one
+      setProps({page: Math.max(0, (this.props.page || 0) + page)});
+    }
+  }
+
+  onSort({column, ascending}) {
+    const {server_side, setProps} = this.props;
+    if (!server_side || !setProps) {
+      return;
+    }
+    // report the column by id so the server can sort its own copy of the
+    // data, falling back to the label and then the index
+    const dataTable = this.dataTable;
+    const id =
+      dataTable.getColumnId(column) ||
+      dataTable.getColumnLabel(column) ||
+      column;
+    setProps({sort: {column: id, ascending: ascending}, page: 0});
+  }
+
+  selectedRows(dataTable, selection) {
+    const columns = this.selectedColumns(dataTable);
+    return selection
+      .filter(item => item.row !== null && item.row !== undefined)
+      .map(item =>
+        columns.map(column => dataTable.getValue(item.row, column))
+      );
+  }
+
+  selectedColumns(dataTable) {
+    const {selection_columns} = this.props;
+    if (!selection_columns) {
+      return Array.from(Array(dataTable.getNumberOfColumns()).keys());
+    }
+    return selection_columns.map(column => columnIndex(dataTable, column));
+  }
+
+  render() {
+    const {
+      id,
+      className,
+      style,
+      height,
+      width,
+      placeholder_height
+    } = this.props;
+    return (
+      <div
+        id={id}
+        className={className}
+        style={Object.assign(
+          {
+            height: this.state.visible ? height : placeholder_height || height,
+            width: width
+          },
+          style
+        )}
+        ref={this.setContainer}
+      />
+    );
+  }
+}
+
+/**
+ * Format a Date as an ISO 8601 string in local time without a timezone,
+ * matching how Date(...) values in the data are interpreted.
+ */
+function localISOString(date) {
+  const pad = (value, length = 2) => String(value).padStart(length, '0');
+  return (
+    `${date.getFullYear()}-${pad(date.getMonth() + 1)}-` +
+    `${pad(date.getDate())}T${pad(date.getHours())}:` +
+    `${pad(date.getMinutes())}:${pad(date.getSeconds())}.` +
+    pad(date.getMilliseconds(), 3)
+  );
+}
+
+/**
+ * A copy of the properties of a chart event that can be sent to Dash, with
+ * Dates converted to strings as in view_window.
+ */
+function toJSONValue(value) {
+  if (value instanceof Date) {
+    return localISOString(value);
+  }
+  if (Array.isArray(value)) {
+    return value.map(toJSONValue);
+  }
+  if (value !== null && typeof value === 'object') {
+    const copy = {};
+    Object.keys(value).forEach(key => {
+      copy[key] = toJSONValue(value[key]);
+    });
+    return copy;
+  }
+  return value === undefined ? null : value;
+}
+
+/**
+ * Whether two [min, max] ranges of the horizontal axis are the same.
+ */
+function sameBounds(bounds, other) {
+  if (!other) {
+    return false;
+  }
+  return bounds.every((value, i) =>
+    value instanceof Date && other[i] instanceof Date
+      ? value.getTime() === other[i].getTime()
+      : value === other[i]
+  );
+}
+
+Chart.defaultProps = {
+  height: '300px',
+  width: '400px',
+  selection_payload: 'full'
+};
+
+export default Chart;
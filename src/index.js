@@ -5,6 +5,7 @@ export {default as Calendar} from './components/Calendar';
 export {default as CandlestickChart} from './components/CandlestickChart';
 export {default as ColumnChart} from './components/ColumnChart';
 export {default as ComboChart} from './components/ComboChart';
+export {default as DataStore} from './components/DataStore';
 export {default as GanttChart} from './components/GanttChart';
 export {default as Gauge} from './components/Gauge';
 export {default as GeoChart} from './components/GeoChart';
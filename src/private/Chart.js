@@ -1,34 +1,33 @@
-import React from 'react';
-import PropTypes from 'prop-types';
-import {Chart as GChart} from 'react-google-charts';
+import React, {Suspense} from 'react';
 
-class Chart extends React.Component {
-  constructor(props) {
-    super(props);
+// the chart implementation is split into its own chunk, which is only fetched
+// once a chart is rendered
+const LazyChart = React.lazy(() =>
+  import(/* webpackChunkName: "chart" */ '../fragments/Chart')
+);
 
-    this.onSelect = this.onSelect.bind(this);
-  }
+const Chart = props => {
+  const {id, className, style, height, width, placeholder_height} = props;
+  const fallback = (
+    <div
+      id={id}
+      className={className}
+      style={Object.assign(
+        {height: placeholder_height || height, width: width},
+        style
+      )}
+    />
+  );
+  return (
+    <Suspense fallback={fallback}>
+      <LazyChart {...props} />
+    </Suspense>
+  );
+};
 
-  onSelect(selectData) {
-    const {chartWrapper} = selectData;
-    const chart = chartWrapper.getChart();
-    const dataTable = chartWrapper.getDataTable();
-    const selection = chart.getSelection();
-    if (this.props.setProps) {
-      this.props.setProps({selection: selection, dataTable: dataTable});
-    }
-  }
-
-  render() {
-    const {legend_toggle, ...otherProps} = this.props;
-    return (
-      <GChart
-        legendToggle={legend_toggle}
-        {...otherProps}
-        chartEvents={[{eventName: 'select', callback: this.onSelect}]}
-      />
-    );
-  }
-}
+Chart.defaultProps = {
+  height: '300px',
+  width: '400px'
+};
 
 export default Chart;
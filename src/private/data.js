@@ -0,0 +1,428 @@
+/**
+ * Conversion of the `data` prop into a google.visualization.DataTable.
+ */
+
+export function isColumnar(data) {
+  return Boolean(data) && data.format === 'columnar';
+}
+
+export function toDataTable(google, data) {
+  if (typeof data === 'string') {
+    // data serialised on the server, e.g. with RawJSON, is parsed exactly once
+    data = JSON.parse(data);
+  }
+  if (isColumnar(data)) {
+    return decodeColumnar(google, data);
+  }
+  if (Array.isArray(data)) {
+    return google.visualization.arrayToDataTable(data);
+  }
+  return new google.visualization.DataTable(data);
+}
+
+/**
+ * Build a DataTable from the columnar encoding produced by
+ * `dataframe_to_columnar`. Each column is decoded into a typed array and
+ * written straight into the table without building row arrays.
+ */
+export function decodeColumnar(google, data) {
+  const dataTable = new google.visualization.DataTable();
+  addColumns(dataTable, data.cols);
+  appendColumnar(dataTable, data);
+  return dataTable;
+}
+
+/**
+ * Append rows to an existing DataTable, dropping the oldest rows if there are
+ * more than maxRows. Rows can be an array of row arrays or columnar encoded,
+ * in which case the columns are also added if the table doesn't have any.
+ * Dates in row arrays can be "Date(...)" strings as in DataTable literals.
+ */
+export function extendDataTable(dataTable, rows, maxRows) {
+  if (isColumnar(rows)) {
+    if (dataTable.getNumberOfColumns() === 0) {
+      addColumns(dataTable, rows.cols);
+    }
+    appendColumnar(dataTable, rows);
+  } else {
+    dataTable.addRows(
+      rows.map(row =>
+        row.map((value, index) => coerceValue(dataTable, index, value))
+      )
+    );
+  }
+  if (maxRows !== null && maxRows !== undefined) {
+    const excess = dataTable.getNumberOfRows() - maxRows;
+    if (excess > 0) {
+      dataTable.removeRows(0, excess);
+    }
+  }
+}
+
+/**
+ * Apply a list of patch operations to a DataTable in order. Operations are
+ * either `[row, column, value, formattedValue]` cell updates, or objects with
+ * op set to 'replace', 'insert' or 'delete'. Returns true if the table was
+ * modified.
+ */
+export function patchDataTable(dataTable, patch) {
+  patch.forEach(operation => {
+    if (Array.isArray(operation)) {
+      const [row, column, value, formattedValue] = operation;
+      const index = columnIndex(dataTable, column);
+      setCell(dataTable, row, index, value, formattedValue);
+    } else if (operation.op === 'replace') {
+      operation.values.forEach((value, index) =>
+        setCell(dataTable, operation.row, index, value)
+      );
+    } else if (operation.op === 'insert') {
+      dataTable.insertRows(
+        operation.row,
+        operation.rows.map(row =>
+          row.map((value, index) => coerceValue(dataTable, index, value))
+        )
+      );
+    } else if (operation.op === 'delete') {
+      dataTable.removeRows(operation.row, operation.count || 1);
+    } else {
+      throw new Error(`Unknown data_patch operation: ${operation.op}`);
+    }
+  });
+  return patch.length > 0;
+}
+
+/**
+ * The rows of a DataTable that a patch sets the values of, as they are
+ * numbered once the whole patch has been applied.
+ */
+export function patchedRows(patch) {
+  let rows = [];
+  patch.forEach(operation => {
+    if (Array.isArray(operation)) {
+      rows.push(operation[0]);
+    } else if (operation.op === 'replace') {
+      rows.push(operation.row);
+    } else if (operation.op === 'insert') {
+      const count = operation.rows.length;
+      rows = rows.map(row => (row >= operation.row ? row + count : row));
+      for (let i = 0; i < count; i++) {
+        rows.push(operation.row + i);
+      }
+    } else if (operation.op === 'delete') {
+      const end = operation.row + (operation.count || 1);
+      rows = rows
+        .filter(row => row < operation.row || row >= end)
+        .map(row => (row >= end ? row - (end - operation.row) : row));
+    }
+  });
+  return rows.filter((row, i) => rows.indexOf(row) === i);
+}
+
+function setCell(dataTable, row, column, value, formattedValue) {
+  const coerced = coerceValue(dataTable, column, value);
+  if (formattedValue === undefined || formattedValue === null) {
+    dataTable.setValue(row, column, coerced);
+  } else {
+    dataTable.setCell(row, column, coerced, formattedValue);
+  }
+}
+
+/**
+ * Convert "Date(y, m, d, ...)" strings into Dates for date and datetime
+ * columns, matching how they are interpreted in DataTable literals.
+ */
+function coerceValue(dataTable, column, value) {
+  const type = dataTable.getColumnType(column);
+  if (
+    (type === 'date' || type === 'datetime') &&
+    typeof value === 'string' &&
+    value.startsWith('Date(')
+  ) {
+    const parts = value.slice(5, -1).split(',').map(Number);
+    return new Date(...parts);
+  }
+  return value;
+}
+
+function addColumns(dataTable, cols) {
+  cols.forEach(col => {
+    const {id, label, type, role, p} = col;
+    const column = {id: id, label: label, type: type};
+    if (role) {
+      column.role = role;
+    }
+    if (p) {
+      column.p = p;
+    }
+    dataTable.addColumn(column);
+  });
+}
+
+/**
+ * Add the columns of source to dataTable.
+ */
+export function copyColumns(source, dataTable) {
+  const cols = [];
+  for (let j = 0; j < source.getNumberOfColumns(); j++) {
+    cols.push({
+      id: source.getColumnId(j),
+      label: source.getColumnLabel(j),
+      type: source.getColumnType(j),
+      role: source.getColumnRole(j),
+      p: source.getColumnProperties(j)
+    });
+  }
+  addColumns(dataTable, cols);
+}
+
+/**
+ * Copy the cells of source, with their formatted values and properties, to
+ * the given rows of dataTable, which has the same columns.
+ */
+export function copyRows(source, dataTable, rows) {
+  const numberOfColumns = source.getNumberOfColumns();
+  rows.forEach((row, i) => {
+    for (let j = 0; j < numberOfColumns; j++) {
+      dataTable.setCell(
+        row,
+        j,
+        source.getValue(i, j),
+        source.getFormattedValue(i, j),
+        source.getProperties(i, j)
+      );
+    }
+  });
+}
+
+function appendColumnar(dataTable, data) {
+  const offset = dataTable.getNumberOfRows();
+  const numberOfRows = data.length;
+  dataTable.addRows(numberOfRows);
+  data.cols.forEach((col, j) => {
+    const getValue = columnReader(col);
+    for (let i = 0; i < numberOfRows; i++) {
+      const value = getValue(i);
+      if (value !== null) {
+        dataTable.setValue(offset + i, j, value);
+      }
+    }
+    // formatted values and styles computed on the server
+    if (col.formatted) {
+      const getFormatted = dictionaryReader(col.formatted);
+      for (let i = 0; i < numberOfRows; i++) {
+        const formatted = getFormatted(i);
+        if (formatted !== null) {
+          dataTable.setFormattedValue(offset + i, j, formatted);
+        }
+      }
+    }
+    if (col.style) {
+      const getStyle = dictionaryReader(col.style);
+      for (let i = 0; i < numberOfRows; i++) {
+        const style = getStyle(i);
+        if (style !== null) {
+          dataTable.setProperty(offset + i, j, 'style', style);
+        }
+      }
+    }
+  });
+}
+
+function columnReader(col) {
+  const {encoding, type} = col;
+  if (encoding === 'float64' || encoding === 'int32') {
+    const values = decodeBuffer(
+      col.data,
+      encoding === 'float64' ? Float64Array : Int32Array
+    );
+    if (type === 'date' || type === 'datetime') {
+      return i => toDate(values[i], col.utc);
+    }
+    return i => (Number.isFinite(values[i]) ? values[i] : null);
+  }
+  if (encoding === 'dictionary') {
+    return dictionaryReader(col);
+  }
+  return i => {
+    const value = col.data[i];
+    return value === undefined ? null : value;
+  };
+}
+
+function dictionaryReader({data, dictionary}) {
+  const codes = decodeBuffer(data, Int32Array);
+  return i => (codes[i] < 0 ? null : dictionary[codes[i]]);
+}
+
+function decodeBuffer(encoded, ArrayType) {
+  if (encoded instanceof ArrayBuffer) {
+    // already decoded in the worker, see worker.js
+    return new ArrayType(encoded);
+  }
+  const binary = window.atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return new ArrayType(bytes.buffer);
+}
+
+function toDate(milliseconds, utc) {
+  if (!Number.isFinite(milliseconds)) {
+    return null;
+  }
+  if (utc) {
+    return new Date(milliseconds);
+  }
+  // naive timestamps are wall clock times, keep them in local time
+  const date = new Date(milliseconds);
+  return new Date(
+    date.getUTCFullYear(),
+    date.getUTCMonth(),
+    date.getUTCDate(),
+    date.getUTCHours(),
+    date.getUTCMinutes(),
+    date.getUTCSeconds(),
+    date.getUTCMilliseconds()
+  );
+}
+
+/**
+ * Find the index of a column given its index, id or label.
+ */
+export function columnIndex(dataTable, column) {
+  if (typeof column === 'number') {
+    return column;
+  }
+  const numberOfColumns = dataTable.getNumberOfColumns();
+  for (let i = 0; i < numberOfColumns; i++) {
+    if (
+      dataTable.getColumnId(i) === column ||
+      dataTable.getColumnLabel(i) === column
+    ) {
+      return i;
+    }
+  }
+  throw new Error(`Unknown column: ${column}`);
+}
+
+export function applyFormatters(google, dataTable, formatters) {
+  const formatterList = Array.isArray(formatters) ? formatters : [formatters];
+  formatterList.forEach(({type, column, options, ranges, sourceColumns}) => {
+    const formatter = new google.visualization[type](options);
+    if (type === 'ColorFormat' && ranges) {
+      ranges.forEach(range => formatter.addRange(...range));
+    }
+    if (type === 'PatternFormat') {
+      // without sourceColumns, column is the list of source columns, as it
+      // was when formatters were passed through react-google-charts
+      const sources = (sourceColumns || [].concat(column)).map(col =>
+        columnIndex(dataTable, col)
+      );
+      const hasDestination =
+        sourceColumns && column !== undefined && column !== null;
+      formatter.format(
+        dataTable,
+        sources,
+        hasDestination ? columnIndex(dataTable, column) : sources[0]
+      );
+    } else {
+      formatter.format(dataTable, columnIndex(dataTable, column));
+    }
+  });
+}
+
+export function loadSpreadSheet(google, url, queryParameters = {}) {
+  const {headers, gid, sheet, query, access_token} = queryParameters;
+  const params = [
+    ['headers', headers],
+    ['gid', gid],
+    ['sheet', sheet],
+    ['tq', query],
+    ['access_token', access_token]
+  ]
+    .filter(([, value]) => value !== undefined && value !== null)
+    .map(([key, value]) => `${key}=${encodeURIComponent(value)}`)
+    .join('&');
+  const separator = url.indexOf('?') === -1 ? '?' : '&';
+  return new Promise((resolve, reject) => {
+    const spreadSheetQuery = new google.visualization.Query(
+      params ? `${url}${separator}${params}` : url
+    );
+    spreadSheetQuery.send(response => {
+      if (response.isError()) {
+        reject(new Error(response.getMessage()));
+      } else {
+        resolve(response.getDataTable());
+      }
+    });
+  });
+}
+
+// operations available to calculated columns in a view
+const CALCULATIONS = {
+  sum: values => values.reduce((a, b) => a + b, 0),
+  difference: values => values[0] - values[1],
+  product: values => values.reduce((a, b) => a * b, 1),
+  ratio: values => values[0] / values[1]
+};
+
+/**
+ * Create a DataView of dataTable from a view specification with optional
+ * `columns`, `rows` and `filters` keys.
+ *
+ * Columns can be referred to by index, id or label, or defined as calculated
+ * columns with `{type, label, calc, sourceColumns}` where calc is one of
+ * 'stringify', 'sum', 'difference', 'product' or 'ratio'. Rows are a list of
+ * row indices, and filters are passed to DataTable.getFilteredRows.
+ */
+export function applyView(google, dataTable, view) {
+  const dataView = new google.visualization.DataView(dataTable);
+  const {columns, rows, filters} = view;
+  if (filters) {
+    dataView.setRows(
+      dataTable.getFilteredRows(
+        filters.map(filter =>
+          Object.assign({}, filter, {
+            column: columnIndex(dataTable, filter.column)
+          })
+        )
+      )
+    );
+  } else if (rows) {
+    dataView.setRows(rows);
+  }
+  if (columns) {
+    dataView.setColumns(
+      columns.map(column => viewColumn(dataTable, column))
+    );
+  }
+  return dataView;
+}
+
+function viewColumn(dataTable, column) {
+  if (typeof column !== 'object') {
+    return columnIndex(dataTable, column);
+  }
+  const {calc, sourceColumn, sourceColumns} = column;
+  if (calc === 'stringify') {
+    return Object.assign({}, column, {
+      sourceColumn: columnIndex(dataTable, sourceColumn)
+    });
+  }
+  if (!CALCULATIONS[calc]) {
+    throw new Error(`Unknown calculated column: ${calc}`);
+  }
+  const indices = sourceColumns.map(col => columnIndex(dataTable, col));
+  return {
+    type: column.type || 'number',
+    label: column.label,
+    id: column.id,
+    calc: (table, row) => {
+      const values = indices.map(index => table.getValue(row, index));
+      return values.some(value => value === null)
+        ? null
+        : CALCULATIONS[calc](values);
+    }
+  };
+}
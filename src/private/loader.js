@@ -0,0 +1,110 @@
+const LOADER_URL = 'https://www.gstatic.com/charts/loader.js';
+const VERSION = 'current';
+
+// set by a copy of the library served by the Dash app, see
+// dash_google_charts.use_local_library, with the URL it is served from and
+// the version that was downloaded
+function localLibrary() {
+  return window.dash_google_charts_library;
+}
+
+// the Google Charts package each chart type is defined in, by the chartType
+// of the components in src/components, see tests/js/test_loader.js
+export const PACKAGES = {
+  AreaChart: 'corechart',
+  BarChart: 'corechart',
+  BubbleChart: 'corechart',
+  Calendar: 'calendar',
+  CandlestickChart: 'corechart',
+  ColumnChart: 'corechart',
+  ComboChart: 'corechart',
+  Gantt: 'gantt',
+  Gauge: 'gauge',
+  GeoChart: 'geochart',
+  Histogram: 'corechart',
+  LineChart: 'corechart',
+  OrgChart: 'orgchart',
+  PieChart: 'corechart',
+  Sankey: 'sankey',
+  ScatterChart: 'corechart',
+  SteppedAreaChart: 'corechart',
+  Table: 'table',
+  Timeline: 'timeline',
+  TreeMap: 'treemap',
+  WordTree: 'wordtree'
+};
+
+let loaderScript = null;
+
+// promises for every package that has been requested so far
+const packages = {};
+
+// packages waiting to be loaded in the next call to google.charts.load
+let batch = null;
+
+const settings = {language: 'en'};
+
+function loadScript() {
+  if (!loaderScript) {
+    loaderScript = new Promise((resolve, reject) => {
+      if (window.google && window.google.charts) {
+        resolve();
+        return;
+      }
+      const script = document.createElement('script');
+      const library = localLibrary();
+      script.src = library ? `${library.url}loader.js` : LOADER_URL;
+      script.async = true;
+      script.onload = resolve;
+      script.onerror = reject;
+      document.head.appendChild(script);
+    });
+  }
+  return loaderScript;
+}
+
+function flushBatch() {
+  const {names, callbacks} = batch;
+  batch = null;
+  const library = localLibrary();
+  window.google.charts.load(
+    library ? library.version : VERSION,
+    Object.assign({packages: names}, settings)
+  );
+  window.google.charts.setOnLoadCallback(() =>
+    callbacks.forEach(({resolve}) => resolve(window.google))
+  );
+}
+
+function requestPackage(name) {
+  if (!packages[name]) {
+    packages[name] = new Promise((resolve, reject) => {
+      if (!batch) {
+        const current = {names: [], callbacks: []};
+        batch = current;
+        // every chart mounted in the same render requests its package before
+        // the batch is flushed, so they share a single google.charts.load
+        loadScript().then(flushBatch, error => {
+          batch = null;
+          current.callbacks.forEach(callback => callback.reject(error));
+        });
+      }
+      batch.names.push(name);
+      batch.callbacks.push({resolve: resolve, reject: reject});
+    });
+  }
+  return packages[name];
+}
+
+/**
+ * Load the Google Charts package needed to draw chartType, injecting the
+ * loader if necessary. Requests from all charts made at the same time are
+ * collected into one google.charts.load call. Resolves with the `google`
+ * namespace once the package is available.
+ */
+export function loadGoogleCharts({chartType, mapsApiKey}) {
+  if (mapsApiKey && !settings.mapsApiKey) {
+    settings.mapsApiKey = mapsApiKey;
+  }
+  return requestPackage(PACKAGES[chartType] || 'corechart');
+}
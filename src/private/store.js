@@ -0,0 +1,55 @@
+/**
+ * Registry of the data held by DataStore components, shared by every chart
+ * that uses a DataStore as its `source`.
+ */
+
+const stores = {};
+
+function getStore(id) {
+  if (!stores[id]) {
+    stores[id] = {data: undefined, dataTable: null, listeners: []};
+  }
+  return stores[id];
+}
+
+function notify(store) {
+  store.listeners.forEach(listener => listener());
+}
+
+export function setStoreData(id, data) {
+  const store = getStore(id);
+  store.data = data;
+  store.dataTable = null;
+  notify(store);
+}
+
+export function clearStoreData(id) {
+  setStoreData(id, undefined);
+}
+
+/**
+ * Get the DataTable for a store, building it with build the first time it is
+ * requested after the data changes. Returns null if the store has no data.
+ */
+export function getStoreDataTable(id, build) {
+  const store = getStore(id);
+  if (store.data === undefined || store.data === null) {
+    return null;
+  }
+  if (!store.dataTable) {
+    store.dataTable = build(store.data);
+  }
+  return store.dataTable;
+}
+
+/**
+ * Call listener whenever the data in a store changes. Returns a function that
+ * removes the listener.
+ */
+export function subscribe(id, listener) {
+  const store = getStore(id);
+  store.listeners.push(listener);
+  return () => {
+    store.listeners = store.listeners.filter(other => other !== listener);
+  };
+}
@@ -0,0 +1,33 @@
+/**
+ * Event bus shared by the charts in each `sync_group`, which lets linked
+ * charts follow each other's hover position, selection and view window in
+ * the browser, without a round trip to the server.
+ */
+
+const groups = {};
+
+/**
+ * Call listener with the name and payload of every event published to group
+ * by the other charts in it. Returns a function that leaves the group.
+ */
+export function joinGroup(group, listener) {
+  groups[group] = (groups[group] || []).concat([listener]);
+  return () => {
+    groups[group] = groups[group].filter(other => other !== listener);
+    if (groups[group].length === 0) {
+      delete groups[group];
+    }
+  };
+}
+
+/**
+ * Send an event to every chart in group except sender, the listener the
+ * publishing chart joined the group with.
+ */
+export function publish(group, sender, event, payload) {
+  (groups[group] || []).forEach(listener => {
+    if (listener !== sender) {
+      listener(event, payload);
+    }
+  });
+}
@@ -0,0 +1,82 @@
+/**
+ * Returns a function that delays calling func until wait milliseconds have
+ * passed since it was last called. The pending call can be dropped with the
+ * cancel method.
+ */
+export function debounce(func, wait) {
+  let timeout = null;
+  const debounced = (...args) => {
+    clearTimeout(timeout);
+    timeout = setTimeout(() => {
+      timeout = null;
+      func(...args);
+    }, wait);
+  };
+  debounced.cancel = () => {
+    clearTimeout(timeout);
+    timeout = null;
+  };
+  return debounced;
+}
+
+/**
+ * Returns a function that calls func at most once every wait milliseconds.
+ * The first call is made straight away, and the last call made during the
+ * wait is made when it ends, so the final arguments are never lost. The
+ * pending call can be dropped with the cancel method.
+ */
+export function throttle(func, wait) {
+  let timeout = null;
+  let pendingArgs = null;
+  let lastCall = 0;
+  const throttled = (...args) => {
+    const remaining = wait - (Date.now() - lastCall);
+    if (remaining <= 0 && !timeout) {
+      lastCall = Date.now();
+      func(...args);
+      return;
+    }
+    pendingArgs = args;
+    if (!timeout) {
+      timeout = setTimeout(() => {
+        const callArgs = pendingArgs;
+        timeout = null;
+        pendingArgs = null;
+        lastCall = Date.now();
+        func(...callArgs);
+      }, Math.max(remaining, 0));
+    }
+  };
+  throttled.cancel = () => {
+    clearTimeout(timeout);
+    timeout = null;
+    pendingArgs = null;
+  };
+  return throttled;
+}
+
+/**
+ * Start timing a span of work, recorded with performance.mark and
+ * performance.measure under name so that it shows up in browser profiles and
+ * PerformanceObservers. Returns a function that ends the span and returns its
+ * duration in milliseconds.
+ */
+export function startSpan(name) {
+  const {performance} = window;
+  const start = performance.now();
+  const startMark = `${name}:start`;
+  if (performance.mark) {
+    performance.mark(startMark);
+  }
+  return () => {
+    const duration = performance.now() - start;
+    if (performance.measure) {
+      performance.measure(name, startMark);
+      // observers have already been sent the entries, clearing them stops
+      // charts that redraw constantly from filling the timeline buffer
+      performance.clearMarks(startMark);
+      performance.clearMeasures(name);
+    }
+    return duration;
+  };
+}
@@ -0,0 +1,119 @@
+/**
+ * Transforms of the data evaluated in the browser, so that filtering,
+ * sorting and aggregating data the chart already has doesn't need a
+ * callback that sends the data again.
+ */
+
+import {applyView, columnIndex} from './data';
+
+const AGGREGATIONS = ['sum', 'count', 'avg', 'min', 'max'];
+
+// each kind of step, called with the DataTable or DataView produced by the
+// previous step, returning a new DataTable or DataView
+const TRANSFORMS = {
+  filter: filterRows,
+  columns: selectColumns,
+  sort: sortRows,
+  limit: limitRows,
+  group: groupRows
+};
+
+/**
+ * Apply a list of transform steps to dataTable in order. Each step is an
+ * object whose `type` is one of:
+ *
+ * - 'filter', keeping the rows that match every filter in `filters`, given
+ *   as `{column, value}`, `{column, values}` to match any of a list of
+ *   values, or `{column, minValue, maxValue}` with either bound optional;
+ * - 'columns', keeping the `columns` listed, which can include calculated
+ *   columns as in the `view` prop;
+ * - 'sort', sorting by the `columns` listed, each a column or
+ *   `{column, desc}`;
+ * - 'limit', keeping at most `limit` rows starting from row `offset`;
+ * - 'group', grouping by the `keys` columns and aggregating `columns`, given
+ *   as `{column, aggregation, label}` with aggregation one of 'sum',
+ *   'count', 'avg', 'min' or 'max'.
+ *
+ * dataTable itself is never modified.
+ */
+export function applyTransform(google, dataTable, transform) {
+  return transform.reduce((table, step) => {
+    const apply = TRANSFORMS[step.type];
+    if (!apply) {
+      throw new Error(`Unknown transform: ${step.type}`);
+    }
+    return apply(google, table, step);
+  }, dataTable);
+}
+
+function filterRows(google, table, {filters}) {
+  const dataView = new google.visualization.DataView(table);
+  dataView.setRows(
+    table.getFilteredRows(
+      filters.map(filter => {
+        const column = columnIndex(table, filter.column);
+        if (filter.values) {
+          const values = new Set(filter.values);
+          return {column: column, test: value => values.has(value)};
+        }
+        return Object.assign({}, filter, {column: column});
+      })
+    )
+  );
+  return dataView;
+}
+
+function selectColumns(google, table, {columns}) {
+  return applyView(google, table, {columns: columns});
+}
+
+function sortRows(google, table, {columns}) {
+  const dataView = new google.visualization.DataView(table);
+  dataView.setRows(
+    table.getSortedRows(
+      columns.map(column => {
+        if (column !== null && typeof column === 'object') {
+          return {
+            column: columnIndex(table, column.column),
+            desc: Boolean(column.desc)
+          };
+        }
+        return {column: columnIndex(table, column)};
+      })
+    )
+  );
+  return dataView;
+}
+
+function limitRows(google, table, {limit, offset = 0}) {
+  const numberOfRows = table.getNumberOfRows();
+  const end = Math.min(numberOfRows, offset + limit);
+  const rows = [];
+  for (let row = offset; row < end; row++) {
+    rows.push(row);
+  }
+  const dataView = new google.visualization.DataView(table);
+  dataView.setRows(rows);
+  return dataView;
+}
+
+function groupRows(google, table, {keys, columns = []}) {
+  const {data} = google.visualization;
+  return data.group(
+    table,
+    keys.map(key => columnIndex(table, key)),
+    columns.map(({column, aggregation = 'sum', label}) => {
+      if (!AGGREGATIONS.includes(aggregation)) {
+        throw new Error(`Unknown aggregation: ${aggregation}`);
+      }
+      const index = columnIndex(table, column);
+      const keepsType = aggregation === 'min' || aggregation === 'max';
+      return {
+        column: index,
+        aggregation: data[aggregation],
+        type: keepsType ? table.getColumnType(index) : 'number',
+        label: label || table.getColumnLabel(index)
+      };
+    })
+  );
+}
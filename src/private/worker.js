@@ -0,0 +1,321 @@
+/**
+ * Decoding of large `data` payloads in a Web Worker, so that parsing and
+ * converting them doesn't block the main thread.
+ *
+ * The worker turns JSON strings, DataTable literals, arrays of rows and the
+ * columnar encoding into the columnar encoding with every buffer already
+ * decoded into an ArrayBuffer, which are transferred back without copying.
+ * Only writing the values into a DataTable is left for the main thread.
+ */
+
+// payloads smaller than this are decoded on the main thread, where it is
+// quicker than the round trip to the worker
+const MIN_CHARACTERS = 1000000;
+const MIN_CELLS = 100000;
+
+let worker = null;
+
+// set if the worker failed to start, after which everything is decoded on
+// the main thread
+let workerFailed = false;
+
+let nextRequest = 0;
+
+// resolve and reject functions of the requests waiting for the worker
+const requests = {};
+
+/**
+ * Whether data is large enough to be worth decoding in a worker, and in a
+ * form that is cheap to send to it. Parsed arrays of rows and DataTable
+ * literals would have to be copied to the worker on the main thread, which
+ * costs about as much as converting them.
+ */
+export function shouldDecodeInWorker(data) {
+  if (workerFailed || !window.Worker || !window.Blob || !window.URL) {
+    return false;
+  }
+  if (typeof data === 'string') {
+    return data.length >= MIN_CHARACTERS;
+  }
+  return (
+    Boolean(data) &&
+    data.format === 'columnar' &&
+    data.length * data.cols.length >= MIN_CELLS
+  );
+}
+
+/**
+ * Decode data in the worker. Resolves with the columnar encoding of the data
+ * with decoded buffers, or rejects if the worker can't be used or the data
+ * is in a form it doesn't handle, in which case the data should be converted
+ * on the main thread instead.
+ */
+export function decodeInWorker(data) {
+  return new Promise((resolve, reject) => {
+    const id = nextRequest++;
+    requests[id] = {resolve: resolve, reject: reject};
+    try {
+      getWorker().postMessage({id: id, data: data});
+    } catch (error) {
+      delete requests[id];
+      reject(error);
+    }
+  });
+}
+
+function getWorker() {
+  if (!worker) {
+    const source = `(${decodeWorker.toString()})();`;
+    const url = window.URL.createObjectURL(
+      new window.Blob([source], {type: 'application/javascript'})
+    );
+    worker = new window.Worker(url);
+    window.URL.revokeObjectURL(url);
+    worker.onmessage = ({data}) => {
+      const request = requests[data.id];
+      delete requests[data.id];
+      if (data.error) {
+        request.reject(new Error(data.error));
+      } else {
+        request.resolve(data.result);
+      }
+    };
+    worker.onerror = event => {
+      // e.g. the Content-Security-Policy doesn't allow blob: workers, so
+      // reject every request and fall back to the main thread from now on
+      Object.keys(requests).forEach(id => {
+        requests[id].reject(new Error(event.message));
+        delete requests[id];
+      });
+      workerFailed = true;
+    };
+  }
+  return worker;
+}
+
+/**
+ * The body of the worker. It is converted to a string to create the worker,
+ * so it must not refer to anything outside of itself, or use syntax that is
+ * compiled into calls to shared helpers (array destructuring, spreads and
+ * typeof compared with 'object' or 'symbol').
+ */
+function decodeWorker() {
+  function isObject(value) {
+    return value instanceof Object;
+  }
+
+  function base64ToBuffer(encoded) {
+    const binary = self.atob(encoded);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes.buffer;
+  }
+
+  function dictionaryEncode(values) {
+    const codes = new Int32Array(values.length);
+    const dictionary = [];
+    const index = new Map();
+    for (let i = 0; i < values.length; i++) {
+      const value = values[i];
+      if (value === null || value === undefined) {
+        codes[i] = -1;
+      } else {
+        if (!index.has(value)) {
+          index.set(value, dictionary.length);
+          dictionary.push(value);
+        }
+        codes[i] = index.get(value);
+      }
+    }
+    return {dictionary: dictionary, data: codes.buffer};
+  }
+
+  // "Date(y, m, d, h, m, s, ms)" strings are local times, as in DataTable
+  // literals. They are converted to milliseconds since the epoch here, which
+  // the main thread turns back into the same Date
+  function toMilliseconds(value) {
+    if (value === null || value === undefined) {
+      return NaN;
+    }
+    if (typeof value === 'string' && value.indexOf('Date(') === 0) {
+      const parts = value.slice(5, -1).split(',').map(Number);
+      return new Date(
+        parts[0],
+        parts[1] || 0,
+        parts.length > 2 ? parts[2] : 1,
+        parts[3] || 0,
+        parts[4] || 0,
+        parts[5] || 0,
+        parts[6] || 0
+      ).getTime();
+    }
+    if (typeof value === 'number') {
+      return value;
+    }
+    throw new Error(`Invalid date value ${value}`);
+  }
+
+  function toNumber(value) {
+    if (value === null || value === undefined) {
+      return NaN;
+    }
+    if (typeof value !== 'number') {
+      throw new Error(`Invalid number value ${value}`);
+    }
+    return value;
+  }
+
+  function encodeColumn(col, values, formatted) {
+    const column = {
+      id: col.id,
+      label: col.label,
+      type: col.type,
+      role: col.role,
+      p: col.p
+    };
+    const length = values.length;
+    if (col.type === 'number') {
+      const numbers = new Float64Array(length);
+      for (let i = 0; i < length; i++) {
+        numbers[i] = toNumber(values[i]);
+      }
+      column.encoding = 'float64';
+      column.data = numbers.buffer;
+    } else if (col.type === 'date' || col.type === 'datetime') {
+      const dates = new Float64Array(length);
+      for (let i = 0; i < length; i++) {
+        dates[i] = toMilliseconds(values[i]);
+      }
+      column.encoding = 'float64';
+      column.data = dates.buffer;
+      column.utc = true;
+    } else if (col.type === 'string') {
+      for (let i = 0; i < length; i++) {
+        const value = values[i];
+        if (value !== null && value !== undefined) {
+          if (typeof value !== 'string') {
+            throw new Error(`Invalid string value ${value}`);
+          }
+        }
+      }
+      const encoded = dictionaryEncode(values);
+      column.encoding = 'dictionary';
+      column.dictionary = encoded.dictionary;
+      column.data = encoded.data;
+    } else {
+      column.encoding = 'values';
+      column.data = values;
+    }
+    if (formatted) {
+      column.formatted = dictionaryEncode(formatted);
+    }
+    return column;
+  }
+
+  // a DataTable literal with cols and rows of {c: [{v, f}]} cells
+  function encodeLiteral(data) {
+    if (data.p) {
+      throw new Error('Table properties are not supported');
+    }
+    const rows = data.rows || [];
+    const cols = data.cols.map((col, j) => {
+      const values = new Array(rows.length);
+      let formatted = null;
+      for (let i = 0; i < rows.length; i++) {
+        const cell = rows[i].c[j];
+        values[i] = cell ? cell.v : null;
+        if (cell && cell.p) {
+          throw new Error('Cell properties are not supported');
+        }
+        if (cell && cell.f !== undefined && cell.f !== null) {
+          if (!formatted) {
+            formatted = new Array(rows.length).fill(null);
+          }
+          formatted[i] = cell.f;
+        }
+      }
+      return encodeColumn(col, values, formatted);
+    });
+    return {format: 'columnar', length: rows.length, cols: cols};
+  }
+
+  // an array of rows with a header row, as accepted by arrayToDataTable.
+  // Types are inferred from the first value in each column that isn't null
+  function encodeRows(data) {
+    const header = data[0];
+    const rows = data.slice(1);
+    const cols = header.map((label, j) => {
+      const values = rows.map(row => {
+        const value = row[j];
+        if (isObject(value)) {
+          throw new Error('Cell objects are not supported');
+        }
+        return value === undefined ? null : value;
+      });
+      const col = isObject(label) ? label : {label: label, id: ''};
+      if (!col.type) {
+        const first = values.find(value => value !== null);
+        col.type = typeof first === 'number' ? 'number' : 'string';
+        if (typeof first === 'boolean') {
+          col.type = 'boolean';
+        }
+      }
+      return encodeColumn(col, values, null);
+    });
+    return {format: 'columnar', length: rows.length, cols: cols};
+  }
+
+  function decodeColumns(data) {
+    const cols = data.cols.map(col => {
+      const column = Object.assign({}, col);
+      if (typeof col.data === 'string') {
+        column.data = base64ToBuffer(col.data);
+      }
+      ['formatted', 'style'].forEach(key => {
+        if (col[key]) {
+          column[key] = {
+            dictionary: col[key].dictionary,
+            data: base64ToBuffer(col[key].data)
+          };
+        }
+      });
+      return column;
+    });
+    return {format: 'columnar', length: data.length, cols: cols};
+  }
+
+  function transferables(result) {
+    const buffers = [];
+    result.cols.forEach(col => {
+      [col, col.formatted, col.style].forEach(block => {
+        if (block && block.data instanceof ArrayBuffer) {
+          buffers.push(block.data);
+        }
+      });
+    });
+    return buffers;
+  }
+
+  self.onmessage = event => {
+    const id = event.data.id;
+    try {
+      let data = event.data.data;
+      if (typeof data === 'string') {
+        data = JSON.parse(data);
+      }
+      let result;
+      if (data && data.format === 'columnar') {
+        result = decodeColumns(data);
+      } else if (Array.isArray(data)) {
+        result = encodeRows(data);
+      } else {
+        result = encodeLiteral(data);
+      }
+      self.postMessage({id: id, result: result}, transferables(result));
+    } catch (error) {
+      self.postMessage({id: id, error: error.message});
+    }
+  };
+}
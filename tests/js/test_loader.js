@@ -0,0 +1,83 @@
+/**
+ * Tests of the loader in src/private/loader.js, compiled with the project's
+ * Babel config and run against a fake google.charts.
+ *
+ * Run with `npm test`.
+ */
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const babel = require('babel-core');
+
+const SRC_PATH = path.join(__dirname, '..', '..', 'src');
+
+/**
+ * Load the loader module with a window that already has google.charts,
+ * recording the packages passed to each google.charts.load call.
+ */
+function loadLoaderModule() {
+  const loads = [];
+  const google = {
+    charts: {
+      // copied, as arrays from the module's context aren't deepStrictEqual
+      load: (version, settings) => loads.push(Array.from(settings.packages)),
+      setOnLoadCallback: callback => setImmediate(callback)
+    }
+  };
+  const {code} = babel.transformFileSync(
+    path.join(SRC_PATH, 'private', 'loader.js')
+  );
+  const module = {exports: {}};
+  vm.runInNewContext(code, {
+    window: {google: google},
+    module: module,
+    exports: module.exports
+  });
+  return {loader: module.exports, loads: loads};
+}
+
+/**
+ * The chartType of each component in src/components.
+ */
+function componentChartTypes() {
+  const directory = path.join(SRC_PATH, 'components');
+  return fs
+    .readdirSync(directory)
+    .map(name => fs.readFileSync(path.join(directory, name), 'utf8'))
+    .map(source => /chartType="(\w+)"/.exec(source))
+    .filter(match => match)
+    .map(match => match[1]);
+}
+
+const tests = {
+  'every chart type has a package': () => {
+    const {loader} = loadLoaderModule();
+    const chartTypes = componentChartTypes();
+    assert(chartTypes.length > 0);
+    const missing = chartTypes.filter(
+      chartType => !loader.PACKAGES.hasOwnProperty(chartType)
+    );
+    assert.deepStrictEqual(missing, []);
+  },
+
+  'loads the package of the chart type': () => {
+    const {loader, loads} = loadLoaderModule();
+    return Promise.all([
+      loader.loadGoogleCharts({chartType: 'Gantt'}),
+      loader.loadGoogleCharts({chartType: 'LineChart'})
+    ]).then(() => assert.deepStrictEqual(loads, [['gantt', 'corechart']]));
+  }
+};
+
+Object.keys(tests).reduce(
+  (previous, name) =>
+    previous.then(tests[name]).then(
+      () => console.log(`ok - ${name}`),
+      error => {
+        console.log(`not ok - ${name}\n${error.stack}`);
+        process.exitCode = 1;
+      }
+    ),
+  Promise.resolve()
+);
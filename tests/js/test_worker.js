@@ -0,0 +1,191 @@
+/**
+ * Tests of the Web Worker in src/private/worker.js. The module is compiled
+ * with the project's Babel config, as it is in the bundle, and the worker's
+ * source is run in a context of its own, so the tests fail if the compiled
+ * worker refers to anything outside of itself, e.g. Babel's helpers.
+ *
+ * Run with `npm test`.
+ */
+const assert = require('assert');
+const path = require('path');
+const v8 = require('v8');
+const vm = require('vm');
+const babel = require('babel-core');
+
+const WORKER_PATH = path.join(
+  __dirname,
+  '..',
+  '..',
+  'src',
+  'private',
+  'worker.js'
+);
+
+/**
+ * A Worker that runs the source of a blob URL in a new context, with only
+ * the worker's `self` global. Messages are copied into the context that
+ * receives them, as they are by postMessage.
+ */
+function fakeWorker(blobs) {
+  return function Worker(url) {
+    const worker = this;
+    const self = {
+      atob: encoded => Buffer.from(encoded, 'base64').toString('binary'),
+      postMessage: message => {
+        const copy = v8.deserialize(v8.serialize(message));
+        setImmediate(() => worker.onmessage({data: copy}));
+      }
+    };
+    const context = vm.createContext({self: self});
+    vm.runInContext(blobs[url], context);
+    const parse = vm.runInContext('JSON.parse', context);
+    worker.postMessage = message => {
+      const copy = parse(JSON.stringify(message));
+      setImmediate(() => self.onmessage({data: copy}));
+    };
+  };
+}
+
+function loadWorkerModule() {
+  const blobs = {};
+  const window = {
+    Blob: function Blob(parts) {
+      this.source = parts.join('');
+    },
+    URL: {
+      createObjectURL: blob => {
+        const url = `blob:${Object.keys(blobs).length}`;
+        blobs[url] = blob.source;
+        return url;
+      },
+      revokeObjectURL: () => {}
+    }
+  };
+  window.Worker = fakeWorker(blobs);
+  const {code} = babel.transformFileSync(WORKER_PATH);
+  const module = {exports: {}};
+  vm.runInNewContext(code, {
+    window: window,
+    module: module,
+    exports: module.exports
+  });
+  return {worker: module.exports, blobs: blobs};
+}
+
+function toArray(ArrayType, buffer) {
+  return Array.from(new ArrayType(buffer));
+}
+
+const tests = {
+  'worker source has no typeof helper': () => {
+    const {worker, blobs} = loadWorkerModule();
+    return worker.decodeInWorker('[["x"], [1]]').then(() => {
+      const sources = Object.keys(blobs).map(url => blobs[url]);
+      assert.strictEqual(sources.length, 1);
+      // Babel compiles these comparisons into calls to its _typeof helper
+      const typeofObject = /typeof[^=;]*[=!]==?\s*['"](object|symbol)['"]/;
+      assert(!typeofObject.test(sources[0]));
+      assert(!/_typeof/.test(sources[0]));
+    });
+  },
+
+  'decodes arrays of rows': () => {
+    const {worker} = loadWorkerModule();
+    const data = JSON.stringify([
+      ['name', {label: 'value', type: 'number'}, 'flag'],
+      ['a', 1.5, true],
+      ['b', null, false],
+      [null, 3, null]
+    ]);
+    return worker.decodeInWorker(data).then(result => {
+      assert.strictEqual(result.format, 'columnar');
+      assert.strictEqual(result.length, 3);
+      const [name, value, flag] = result.cols;
+      assert.strictEqual(name.type, 'string');
+      assert.deepStrictEqual(name.dictionary, ['a', 'b']);
+      assert.deepStrictEqual(toArray(Int32Array, name.data), [0, 1, -1]);
+      assert.strictEqual(value.label, 'value');
+      assert.deepStrictEqual(toArray(Float64Array, value.data), [
+        1.5,
+        NaN,
+        3
+      ]);
+      assert.strictEqual(flag.type, 'boolean');
+      assert.deepStrictEqual(flag.data, [true, false, null]);
+    });
+  },
+
+  'rejects cell objects in arrays of rows': () => {
+    const {worker} = loadWorkerModule();
+    const data = JSON.stringify([['x'], [{v: 1, f: 'one'}]]);
+    return worker.decodeInWorker(data).then(
+      () => assert.fail('expected the worker to reject the data'),
+      error =>
+        assert.strictEqual(error.message, 'Cell objects are not supported')
+    );
+  },
+
+  'decodes DataTable literals': () => {
+    const {worker} = loadWorkerModule();
+    const data = JSON.stringify({
+      cols: [
+        {id: 't', label: 't', type: 'datetime'},
+        {id: 'v', label: 'v', type: 'number'}
+      ],
+      rows: [
+        {c: [{v: 'Date(2020, 0, 2, 3, 4, 5, 6)'}, {v: 1, f: 'one'}]},
+        {c: [null, {v: 2}]}
+      ]
+    });
+    return worker.decodeInWorker(data).then(result => {
+      const [time, value] = result.cols;
+      assert.strictEqual(time.utc, true);
+      assert.deepStrictEqual(toArray(Float64Array, time.data), [
+        new Date(2020, 0, 2, 3, 4, 5, 6).getTime(),
+        NaN
+      ]);
+      assert.deepStrictEqual(toArray(Float64Array, value.data), [1, 2]);
+      assert.deepStrictEqual(value.formatted.dictionary, ['one']);
+      assert.deepStrictEqual(toArray(Int32Array, value.formatted.data), [
+        0,
+        -1
+      ]);
+    });
+  },
+
+  'decodes the buffers of columnar data': () => {
+    const {worker} = loadWorkerModule();
+    const buffer = Buffer.from(new Float64Array([1, 2]).buffer);
+    const data = {
+      format: 'columnar',
+      length: 2,
+      cols: [
+        {
+          id: 'x',
+          label: 'x',
+          type: 'number',
+          encoding: 'float64',
+          data: buffer.toString('base64')
+        }
+      ]
+    };
+    return worker.decodeInWorker(data).then(result => {
+      assert.deepStrictEqual(toArray(Float64Array, result.cols[0].data), [
+        1,
+        2
+      ]);
+    });
+  }
+};
+
+Object.keys(tests).reduce(
+  (previous, name) =>
+    previous.then(tests[name]).then(
+      () => console.log(`ok - ${name}`),
+      error => {
+        console.log(`not ok - ${name}\n${error.stack}`);
+        process.exitCode = 1;
+      }
+    ),
+  Promise.resolve()
+);
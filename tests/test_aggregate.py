@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts.aggregate import group_sum, histogram, ohlc, treemap
+
+
+def test_histogram_series():
+    values = pd.Series([0, 1, 1, 2, 9, np.nan, np.inf], name="length")
+    result = histogram(values, bins=3)
+    assert list(result.columns) == ["bin", "length"]
+    assert result["bin"].tolist() == ["0 - 3", "3 - 6", "6 - 9"]
+    assert result["length"].tolist() == [4, 0, 1]
+
+
+def test_histogram_start_labels_and_range():
+    result = histogram([1, 2, 3, 20], bins=2, range=(0, 10), labels="start")
+    assert result["bin"].tolist() == [0.0, 5.0]
+    assert result["count"].tolist() == [3, 0]
+
+
+def test_histogram_weights_and_edges():
+    result = histogram([1, 2, 6], bins=[0, 5, 10], weights=[0.5, 1.5, 2])
+    assert result["count"].tolist() == [2.0, 2.0]
+
+
+def test_histogram_dataframe_shares_bins():
+    df = pd.DataFrame({"a": [0, 1, 2, 3], "b": [4, 4, 4, np.nan]})
+    result = histogram(df, bins=2)
+    assert list(result.columns) == ["bin", "a", "b"]
+    assert len(result) == 2
+    assert result["a"].tolist() == [2, 2]
+    assert result["b"].tolist() == [0, 3]
+
+
+def test_histogram_without_finite_values():
+    result = histogram([np.nan], bins=2)
+    assert result["count"].tolist() == [0, 0]
+
+
+def test_histogram_unknown_labels():
+    with pytest.raises(ValueError):
+        histogram([1], labels="end")
+
+
+def test_group_sum():
+    df = pd.DataFrame(
+        {"region": ["a", "b", "a", "c", "d"], "sales": [1, 5, 2, 2, 1]}
+    )
+    result = group_sum(df, "region", "sales")
+    assert result.values.tolist() == [["b", 5], ["a", 3], ["c", 2], ["d", 1]]
+    result = group_sum(df, "region", "sales", top=2, other="Rest")
+    assert result.values.tolist() == [["b", 5], ["a", 3], ["Rest", 3]]
+
+
+def test_group_sum_counts_rows():
+    df = pd.DataFrame({"region": pd.Categorical(["a", "b", "a"])})
+    result = group_sum(df, "region", top=1)
+    assert list(result.columns) == ["region", "count"]
+    assert result.values.tolist() == [["a", 2], ["Other", 1]]
+
+
+def test_treemap():
+    df = pd.DataFrame(
+        {
+            "region": ["Europe", "Europe", "Asia"],
+            "country": ["France", "Spain", "Japan"],
+            "sales": [1, 2, 3],
+            "growth": [0.1, 0.3, 0.5],
+        }
+    )
+    result = treemap(df, ["region", "country"], "sales", color="growth")
+    assert list(result.columns) == ["id", "parent", "size", "color"]
+    rows = {row[0]: row[1:] for row in result.values.tolist()}
+    assert rows["All"][:2] == [None, 6]
+    assert rows["Europe"][:2] == ["All", 3]
+    assert rows["Europe"][2] == pytest.approx(0.2)
+    assert rows["Spain"] == ["Europe", 2, 0.3]
+    assert len(result) == 6
+
+
+def test_treemap_duplicate_labels():
+    df = pd.DataFrame({"a": ["x", "y"], "b": ["z", "z"]})
+    with pytest.raises(ValueError):
+        treemap(df, ["a", "b"])
+    result = treemap(df, ["a", "b"], separator="/")
+    assert result["id"].tolist() == [
+        "All",
+        "All/x",
+        "All/y",
+        "All/x/z",
+        "All/y/z",
+    ]
+    assert result["parent"].tolist() == [None, "All", "All", "All/x", "All/y"]
+    assert result["size"].tolist() == [2, 1, 1, 1, 1]
+
+
+def test_ohlc():
+    df = pd.DataFrame(
+        {
+            "time": pd.to_datetime(
+                [
+                    "2020-01-01 00:00",
+                    "2020-01-01 00:30",
+                    "2020-01-01 00:45",
+                    "2020-01-01 02:10",
+                ]
+            ),
+            "price": [2, 5, 1, 3],
+        }
+    )
+    result = ohlc(df, "time", "price", "1h")
+    assert list(result.columns) == ["time", "low", "open", "close", "high"]
+    # the empty hour in between is dropped
+    assert result["time"].tolist() == [
+        pd.Timestamp("2020-01-01 00:00"),
+        pd.Timestamp("2020-01-01 02:00"),
+    ]
+    assert result[["low", "open", "close", "high"]].values.tolist() == [
+        [1, 2, 1, 5],
+        [3, 3, 3, 3],
+    ]
@@ -0,0 +1,102 @@
+import os
+
+from dash_google_charts.cache import (
+    DiskBackend,
+    MemoryBackend,
+    data_hash,
+    memoize,
+    skip_unchanged,
+)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_bytes=10)
+    backend.set("a", "A", 4)
+    backend.set("b", "B", 4)
+    assert backend.get("a") == "A"
+    backend.set("c", "C", 4)
+    assert backend.get("b") is None
+    assert backend.get("a") == "A"
+    assert backend.get("c") == "C"
+
+
+def test_memory_backend_replaces_and_skips_large_values():
+    backend = MemoryBackend(max_bytes=10)
+    backend.set("a", "A", 4)
+    backend.set("a", "AA", 8)
+    assert backend.get("a") == "AA"
+    backend.set("b", "B", 2)
+    assert backend.get("a") == "AA"
+    backend.set("large", "L", 11)
+    assert backend.get("large") is None
+    assert backend.get("a") == "AA"
+    backend.clear()
+    assert backend.get("a") is None
+
+
+def test_disk_backend_round_trip(tmp_path):
+    directory = str(tmp_path / "cache")
+    backend = DiskBackend(directory)
+    assert os.path.isdir(directory)
+    backend.set("key", {"cols": [1, 2]}, 0)
+    assert backend.get("key") == {"cols": [1, 2]}
+    assert backend.get("missing") is None
+    backend.clear()
+    assert backend.get("key") is None
+
+
+def test_disk_backend_evicts_least_recently_used(tmp_path):
+    backend = DiskBackend(str(tmp_path))
+    for i, key in enumerate("abc"):
+        backend.set(key, "x" * 1000, 0)
+        os.utime(backend._path(key), (1000 + i, 1000 + i))
+    # reading an entry marks it as recently used
+    backend.get("a")
+    size = os.path.getsize(backend._path("a"))
+    backend.max_bytes = 3 * size
+    backend.set("d", "x" * 1000, 0)
+    assert backend.get("b") is None
+    assert [backend.get(key) is not None for key in "acd"] == [True] * 3
+
+
+def test_memoize():
+    calls = []
+
+    @memoize(MemoryBackend())
+    def square(x, power=2):
+        calls.append(x)
+        return [x**power]
+
+    assert square(3) == [9]
+    assert square(3) == [9]
+    assert square(3, power=3) == [27]
+    assert calls == [3, 3]
+    data, hash_ = square.with_hash(3)
+    assert data == [9]
+    assert hash_ == data_hash([9])
+    assert isinstance(square.cache, MemoryBackend)
+
+
+def test_memoize_on_disk(tmp_path):
+    calls = []
+
+    @memoize(DiskBackend(str(tmp_path)))
+    def data(name):
+        calls.append(name)
+        return '{"cols":[],"rows":[]}'
+
+    assert data("a") == data("a")
+    assert calls == ["a"]
+
+
+def test_data_hash_ignores_key_order():
+    assert data_hash({"a": 1, "b": 2}) == data_hash({"b": 2, "a": 1})
+    assert data_hash("[1]") == data_hash(b"[1]")
+    assert data_hash([1]) != data_hash([2])
+
+
+def test_skip_unchanged():
+    from dash import no_update
+
+    assert skip_unchanged("data", "hash", "other") == ("data", "hash")
+    assert skip_unchanged("data", "hash", "hash") == (no_update, no_update)
@@ -0,0 +1,182 @@
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts._data import (
+    RawJSON,
+    dataframe_to_columnar,
+    dataframe_to_datatable,
+)
+
+
+def literal(df, **kwargs):
+    return json.loads(dataframe_to_datatable(df, **kwargs))
+
+
+def column_values(df):
+    """
+    The cell values of the single column of df in the literal encoding.
+    """
+    return [row["c"][0]["v"] for row in literal(df)["rows"]]
+
+
+def unpack(col, key="data"):
+    dtype = {"int32": "<i4", "float64": "<f8", "dictionary": "<i4"}
+    buffer = base64.b64decode(col[key])
+    return np.frombuffer(buffer, dtype=dtype[col["encoding"]]).tolist()
+
+
+def test_raw_json_accepts_bytes():
+    assert RawJSON(b'{"a": 1}') == '{"a": 1}'
+    assert isinstance(RawJSON(b"[]"), str)
+
+
+@pytest.mark.parametrize(
+    "values, expected_type, expected",
+    [
+        ([1, 2, None], "number", [1.0, 2.0, None]),
+        ([1.5, float("nan"), float("inf")], "number", [1.5, None, None]),
+        ([True, False], "boolean", [True, False]),
+        (["a", None, 'quote " \\ \n'], "string", ["a", None, 'quote " \\ \n']),
+    ],
+)
+def test_literal_basic_types(values, expected_type, expected):
+    df = pd.DataFrame({"x": values})
+    assert literal(df)["cols"] == [
+        {"id": "x", "label": "x", "type": expected_type}
+    ]
+    assert column_values(df) == expected
+
+
+@pytest.mark.parametrize(
+    "dtype", ["int8", "int16", "int32", "int64", "uint8", "uint32", "uint64"]
+)
+def test_literal_integers(dtype):
+    df = pd.DataFrame({"x": np.array([0, 1, 100], dtype=dtype)})
+    assert column_values(df) == [0, 1, 100]
+
+
+def test_literal_nullable_integers_and_booleans():
+    df = pd.DataFrame({"x": pd.array([1, None, 3], dtype="Int64")})
+    assert column_values(df) == [1, None, 3]
+    df = pd.DataFrame({"x": pd.array([True, None], dtype="boolean")})
+    assert column_values(df) == [True, None]
+
+
+def test_literal_large_unsigned_integers():
+    values = np.array([2**63, 2**64 - 1, 1], dtype="uint64")
+    df = pd.DataFrame({"x": values})
+    assert column_values(df) == [float(2**63), float(2**64 - 1), 1]
+
+
+def test_literal_categorical():
+    df = pd.DataFrame({"x": pd.Categorical(["b", None, "a", "b"])})
+    assert literal(df)["cols"][0]["type"] == "string"
+    assert column_values(df) == ["b", None, "a", "b"]
+
+
+def test_literal_datetimes():
+    df = pd.DataFrame({"x": pd.to_datetime(["2020-01-02 03:04:05.006", None])})
+    assert literal(df)["cols"][0]["type"] == "datetime"
+    assert column_values(df) == ["Date(2020, 0, 2, 3, 4, 5, 6)", None]
+
+
+def test_literal_timezone_aware_datetimes_are_wall_clock_times():
+    times = pd.to_datetime(["2020-01-01 12:00"]).tz_localize("US/Eastern")
+    df = pd.DataFrame({"x": times})
+    assert column_values(df) == ["Date(2020, 0, 1, 12, 0, 0, 0)"]
+
+
+def test_literal_timedeltas_are_milliseconds():
+    df = pd.DataFrame({"x": pd.to_timedelta(["1s", None])})
+    assert literal(df)["cols"][0]["type"] == "number"
+    assert column_values(df) == [1000.0, None]
+
+
+def test_literal_index_and_empty():
+    df = pd.DataFrame({"x": [1, 2]}, index=pd.Index([5, 6], name="i"))
+    result = literal(df, index=True)
+    assert [col["id"] for col in result["cols"]] == ["i", "x"]
+    assert result["rows"][1]["c"] == [{"v": 6}, {"v": 2}]
+    assert literal(df.iloc[:0])["rows"] == []
+
+
+def test_columnar_small_integers_are_int32():
+    df = pd.DataFrame({"x": np.array([1, -2, 3], dtype="int64")})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["type"] == "number"
+    assert col["encoding"] == "int32"
+    assert unpack(col) == [1, -2, 3]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([2**40, 1], dtype="int64"),
+        np.array([2**63, 1], dtype="uint64"),
+        pd.array([1, None], dtype="Int64"),
+        np.array([1.5, np.nan]),
+    ],
+)
+def test_columnar_other_numbers_are_float64(values):
+    df = pd.DataFrame({"x": values})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["encoding"] == "float64"
+    expected = pd.Series(values).to_numpy(dtype=float, na_value=np.nan)
+    np.testing.assert_array_equal(unpack(col), expected)
+
+
+def test_columnar_booleans():
+    df = pd.DataFrame({"x": pd.array([True, None, False], dtype="boolean")})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["type"] == "boolean"
+    assert col["encoding"] == "values"
+    assert col["data"] == [True, None, False]
+
+
+@pytest.mark.parametrize(
+    "values", [["b", None, "a", "b"], pd.Categorical(["b", None, "a", "b"])]
+)
+def test_columnar_strings_are_dictionary_encoded(values):
+    df = pd.DataFrame({"x": values})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["type"] == "string"
+    assert col["encoding"] == "dictionary"
+    decoded = [
+        col["dictionary"][code] if code >= 0 else None for code in unpack(col)
+    ]
+    assert decoded == ["b", None, "a", "b"]
+
+
+def test_columnar_datetimes_are_milliseconds():
+    df = pd.DataFrame({"x": pd.to_datetime(["2020-01-01", None])})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["type"] == "datetime"
+    assert "utc" not in col
+    np.testing.assert_array_equal(unpack(col), [1577836800000.0, np.nan])
+
+
+def test_columnar_timezone_aware_datetimes_match_literal():
+    times = pd.to_datetime(["2020-01-01 12:00"]).tz_localize("US/Eastern")
+    df = pd.DataFrame({"x": times})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert "utc" not in col
+    # the same wall clock time as the naive datetime
+    assert unpack(col) == [1577880000000.0]
+
+
+def test_columnar_timedeltas():
+    df = pd.DataFrame({"x": pd.to_timedelta(["1.5s"])})
+    (col,) = dataframe_to_columnar(df)["cols"]
+    assert col["type"] == "number"
+    assert unpack(col) == [1500.0]
+
+
+def test_columnar_length_and_index():
+    df = pd.DataFrame({"x": [1, 2]}, index=pd.Index([5, 6], name="i"))
+    result = dataframe_to_columnar(df, index=True)
+    assert result["format"] == "columnar"
+    assert result["length"] == 2
+    assert [col["id"] for col in result["cols"]] == ["i", "x"]
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts.downsample import (
+    Pyramid,
+    downsample_dataframe,
+    lttb,
+    max_points_for_width,
+    min_max,
+)
+
+
+def random_walk(n, seed=0):
+    return np.random.RandomState(seed).normal(size=n).cumsum()
+
+
+@pytest.mark.parametrize("n_out", [3, 10, 100, 999])
+def test_lttb_keeps_endpoints_and_point_count(n_out):
+    x = np.arange(1000, dtype=float)
+    indices = lttb(x, random_walk(1000), n_out)
+    assert len(indices) == n_out
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_spike():
+    y = np.zeros(1000)
+    y[500] = 100
+    assert 500 in lttb(np.arange(1000), y, 20)
+
+
+def test_lttb_small_inputs_unchanged():
+    assert lttb([0, 1, 2], [1, 2, 3], 10).tolist() == [0, 1, 2]
+    with pytest.raises(ValueError):
+        lttb(np.arange(10), np.arange(10), 2)
+
+
+@pytest.mark.parametrize("n_out", [2, 10, 100])
+def test_min_max_keeps_extremes_and_point_count(n_out):
+    y = random_walk(1000)
+    indices = min_max(np.arange(1000), y, n_out)
+    assert len(indices) <= n_out
+    assert np.all(np.diff(indices) > 0)
+    assert y.argmin() in indices
+    assert y.argmax() in indices
+
+
+def test_min_max_small_inputs_unchanged():
+    assert min_max([0, 1], [1, 2], 10).tolist() == [0, 1]
+
+
+def test_downsample_dataframe_per_series():
+    df = pd.DataFrame(
+        {
+            "x": np.arange(10000),
+            "a": random_walk(10000, 1),
+            "b": random_walk(10000, 2),
+            "label": ["a"] * 10000,
+        }
+    )
+    result = downsample_dataframe(df, 100)
+    assert 100 <= len(result) <= 200
+    assert result["x"].is_monotonic_increasing
+    assert list(result.columns) == list(df.columns)
+    assert result["x"].iloc[0] == 0
+    assert result["x"].iloc[-1] == 9999
+
+
+def test_downsample_dataframe_sorts_and_ignores_missing():
+    x = np.arange(1000)[::-1]
+    y = random_walk(1000)
+    y[::7] = np.nan
+    df = pd.DataFrame({"x": x, "y": y})
+    result = downsample_dataframe(df, 50, method="minmax")
+    assert result["x"].is_monotonic_increasing
+    assert result["y"].notna().all()
+    assert len(result) <= 50
+
+
+def test_downsample_dataframe_datetime_x():
+    df = pd.DataFrame(
+        {
+            "x": pd.date_range("2020-01-01", periods=1000, freq="min"),
+            "y": random_walk(1000),
+        }
+    )
+    assert len(downsample_dataframe(df, 100)) == 100
+
+
+@pytest.mark.parametrize(
+    "y", [["a", "b"] * 500, [np.nan] * 1000], ids=["strings", "missing"]
+)
+def test_downsample_dataframe_without_series(y):
+    df = pd.DataFrame({"x": np.arange(1000)[::-1], "y": y})
+    result = downsample_dataframe(df, 100)
+    assert len(result) == 100
+    assert result["x"].iloc[0] == 0
+    assert result["x"].iloc[-1] == 999
+    assert result["x"].is_monotonic_increasing
+
+
+def test_downsample_dataframe_unknown_method():
+    with pytest.raises(ValueError):
+        downsample_dataframe(pd.DataFrame({"x": [1]}), method="mean")
+
+
+def test_max_points_for_width():
+    assert max_points_for_width(800) == 1600
+    assert max_points_for_width("800px") == 1600
+    assert max_points_for_width("50%") is None
+
+
+def test_pyramid_single_series():
+    df = pd.DataFrame({"x": np.arange(100000), "y": random_walk(100000)})
+    pyramid = Pyramid(df, max_points=1000)
+    sizes = [len(level) for level in pyramid.levels]
+    assert sizes[0] == 100000
+    assert sizes[-1] <= 1000
+    assert all(a > b for a, b in zip(sizes, sizes[1:]))
+    assert len(pyramid.query()) <= 1000
+    # few enough rows in the window to return them all
+    window = pyramid.query({"min": 1000, "max": 1999})
+    assert window["x"].tolist() == list(range(1000, 2000))
+    window = pyramid.query({"min": 1000, "max": 5000})
+    assert len(window) <= 1000
+    assert window["x"].between(1000, 5000).all()
+
+
+def test_pyramid_several_series():
+    n = 10000
+    # series that don't share extremes, so the union of the rows each selects
+    # is larger than max_points
+    columns = {"x": np.arange(n)}
+    for i in range(4):
+        columns["s{}".format(i)] = random_walk(n, i)
+    df = pd.DataFrame(columns)
+    pyramid = Pyramid(df, max_points=100)
+    sizes = [len(level) for level in pyramid.levels]
+    assert sizes[-1] <= 4 * 100
+    assert all(a > b for a, b in zip(sizes, sizes[1:]))
+
+    assert len(pyramid.query()) <= 400
+    window = pyramid.query({"min": 0, "max": n})
+    assert len(window) <= 400
+    window = pyramid.query({"min": 5000, "max": 5050})
+    assert len(window) == 51
+
+
+def test_pyramid_datetime_query():
+    df = pd.DataFrame(
+        {
+            "x": pd.date_range("2020-01-01", periods=10000, freq="min"),
+            "y": random_walk(10000),
+        }
+    )
+    pyramid = Pyramid(df, max_points=100)
+    window = pyramid.query(
+        {"min": "2020-01-01T01:00:00", "max": "2020-01-01T02:00:00"}
+    )
+    assert len(window) == 61
+    assert window["x"].iloc[0] == pd.Timestamp("2020-01-01 01:00")
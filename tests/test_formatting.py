@@ -0,0 +1,213 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts.formatting import (
+    color_format,
+    date_format,
+    format_dataframe,
+    number_format,
+    pattern_format,
+)
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({}, ["1,234.50", "-0.13", "0.00", None]),
+        ({"fractionDigits": 0}, ["1,235", "-0", "0", None]),
+        (
+            {"prefix": "$", "negativeParens": True},
+            ["$1,234.50", "($0.13)", "$0.00", None],
+        ),
+        (
+            {"decimalSymbol": ",", "groupingSymbol": ".", "suffix": " €"},
+            ["1.234,50 €", "-0,13 €", "0,00 €", None],
+        ),
+        ({"groupingSymbol": ""}, ["1234.50", "-0.13", "0.00", None]),
+    ],
+)
+def test_number_format_options(options, expected):
+    series = pd.Series([1234.5, -0.125, 0, np.nan])
+    assert number_format(series, **options).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("#,##0.00", ["1,234.50", "-0.13", "0.00"]),
+        ("#,###", ["1,235", "-0", "0"]),
+        ("#.00", ["1234.50", "-.13", ".00"]),
+        ("0.#", ["1234.5", "-0.1", "0"]),
+        ("#%", ["123450%", "-13%", "0%"]),
+        ("$#,##0;($#,##0)", ["$1,235", "($0)", "$0"]),
+        ("000.0", ["1234.5", "-000.1", "000.0"]),
+        ("'#'0", ["#1235", "-#0", "#0"]),
+    ],
+)
+def test_number_format_patterns(pattern, expected):
+    series = pd.Series([1234.5, -0.125, 0])
+    assert number_format(series, pattern=pattern).tolist() == expected
+
+
+def test_number_format_rounds_halves_up():
+    series = pd.Series([0.125, 2.5, 1.005])
+    assert number_format(series, fractionDigits=2).tolist() == [
+        "0.13",
+        "2.50",
+        "1.00",
+    ]
+    assert number_format(series, fractionDigits=0).tolist() == [
+        "0",
+        "3",
+        "1",
+    ]
+
+
+def test_number_format_unsupported_pattern():
+    with pytest.raises(ValueError):
+        number_format(pd.Series([1.0]), pattern="0.###E0")
+
+
+DATES = pd.Series(pd.to_datetime(["2020-01-02 15:04:05.006", None]))
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({}, "1/2/20"),
+        ({"formatType": "medium"}, "Jan 2, 2020"),
+        ({"formatType": "long"}, "January 2, 2020"),
+        ({"pattern": "yyyy-MM-dd HH:mm:ss.SSS"}, "2020-01-02 15:04:05.006"),
+        ({"pattern": "EEE, MMM d, h:mm a"}, "Thu, Jan 2, 3:04 PM"),
+        ({"pattern": "EEEE d MMMM yy"}, "Thursday 2 January 20"),
+        ({"pattern": "K k H h"}, "3 15 15 3"),
+        ({"pattern": "'Day' d 'o''clock'"}, "Day 2 o'clock"),
+    ],
+)
+def test_date_format(options, expected):
+    assert date_format(DATES, **options).tolist() == [expected, None]
+
+
+def test_date_format_time_zone():
+    series = pd.Series(pd.to_datetime(["2020-01-01 12:00"])).dt.tz_localize(
+        "UTC"
+    )
+    assert date_format(series, pattern="HH:mm", timeZone=-5).tolist() == [
+        "07:00"
+    ]
+    # naive datetimes are formatted as they are
+    naive = pd.Series(pd.to_datetime(["2020-01-01 12:00"]))
+    assert date_format(naive, pattern="HH:mm", timeZone=-5).tolist() == [
+        "12:00"
+    ]
+
+
+def test_date_format_midnight_and_noon():
+    series = pd.Series(
+        pd.to_datetime(["2020-01-01 00:30", "2020-01-01 12:30"])
+    )
+    assert date_format(series, pattern="h:mm a k").tolist() == [
+        "12:30 AM 24",
+        "12:30 PM 12",
+    ]
+
+
+def test_pattern_format():
+    values = [
+        np.array(["a", "b"], dtype=object),
+        np.array(["1", "2"], dtype=object),
+    ]
+    assert pattern_format(values, "{0} ({1})").tolist() == ["a (1)", "b (2)"]
+    assert pattern_format(values, "{1}{1}").tolist() == ["11", "22"]
+
+
+def test_color_format():
+    series = pd.Series([-5, 0, 5, 50, np.nan])
+    styles = color_format(
+        series, [[None, 0, "red", None], [10, None, "white", "green"]]
+    )
+    assert styles.tolist() == [
+        "color:red;",
+        None,
+        None,
+        "color:white;background-color:green;",
+        None,
+    ]
+
+
+def test_later_color_ranges_take_precedence():
+    styles = color_format(
+        pd.Series([1, 5]), [[0, 10, "red", None], [5, 10, "blue", None]]
+    )
+    assert styles.tolist() == ["color:red;", "color:blue;"]
+
+
+def test_format_dataframe():
+    df = pd.DataFrame(
+        {"name": ["a", "b"], "price": [1.5, -2.0], "qty": [1.0, 2.5]}
+    )
+    results = format_dataframe(
+        df,
+        [
+            {
+                "type": "NumberFormat",
+                "column": "price",
+                "options": {"prefix": "$", "negativeColor": "red"},
+            },
+            {
+                "type": "ColorFormat",
+                "column": 1,
+                "ranges": [[None, None, None, "yellow"]],
+            },
+            {
+                "type": "PatternFormat",
+                "sourceColumns": ["name", "price", "qty"],
+                "options": "{0}: {1} x {2}",
+            },
+        ],
+    )
+    assert sorted(results) == [0, 1]
+    assert results[1]["formatted"].tolist() == ["$1.50", "-$2.00"]
+    assert results[1]["style"].tolist() == [
+        "background-color:yellow;",
+        "color:red;background-color:yellow;",
+    ]
+    # PatternFormat uses the formatted values of formatted columns, and
+    # JavaScript's String() for numbers
+    assert results[0]["formatted"].tolist() == [
+        "a: $1.50 x 1",
+        "b: -$2.00 x 2.5",
+    ]
+    assert results[0]["style"] is None
+
+
+def test_format_dataframe_pattern_source_columns_in_column():
+    df = pd.DataFrame({"name": ["a", "b"], "qty": [1, 2]})
+    results = format_dataframe(
+        df,
+        {
+            "type": "PatternFormat",
+            "column": [0, "qty"],
+            "options": "{0} ({1})",
+        },
+    )
+    assert results[0]["formatted"].tolist() == ["a (1)", "b (2)"]
+    results = format_dataframe(
+        df,
+        {
+            "type": "PatternFormat",
+            "sourceColumns": [0, 1],
+            "column": 1,
+            "options": "{0}{1}",
+        },
+    )
+    assert sorted(results) == [1]
+    assert results[1]["formatted"].tolist() == ["a1", "b2"]
+
+
+def test_format_dataframe_single_formatter_and_unsupported():
+    df = pd.DataFrame({"x": [1.0]})
+    results = format_dataframe(df, {"type": "NumberFormat", "column": 0})
+    assert results[0]["formatted"].tolist() == ["1.00"]
+    with pytest.raises(ValueError):
+        format_dataframe(df, [{"type": "ArrowFormat", "column": 0}])
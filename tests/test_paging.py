@@ -0,0 +1,104 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts.paging import DataFramePager, SQLPager
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "name": ["e", "b", "a", "d", "c", "f", "g"],
+            "value": [3.0, 1.0, np.nan, 3.0, 2.0, 1.0, 5.0],
+        }
+    )
+
+
+@pytest.fixture
+def sql_pager(df):
+    con = sqlite3.connect(":memory:")
+    df.to_sql("data", con, index=False)
+    yield SQLPager(con, "SELECT * FROM data")
+    con.close()
+
+
+def test_dataframe_pages(df):
+    pager = DataFramePager(df)
+    assert len(pager) == 7
+    assert pager.page(0, 3)["name"].tolist() == ["e", "b", "a"]
+    assert pager.page(2, 3)["name"].tolist() == ["g"]
+    assert pager.page(3, 3).empty
+    # None means the first page and the default page size
+    assert pager.page(None, None)["name"].tolist() == list("ebadcfg")
+
+
+def test_dataframe_sort_ascending(df):
+    pager = DataFramePager(df)
+    sort = {"column": "value", "ascending": True}
+    names = [pager.page(i, 3, sort)["name"].tolist() for i in range(3)]
+    # stable, with missing values last
+    assert names == [["b", "f", "c"], ["e", "d", "g"], ["a"]]
+
+
+def test_dataframe_sort_descending_is_stable(df):
+    pager = DataFramePager(df)
+    sort = {"column": "value", "ascending": False}
+    assert pager.page(0, 7, sort)["name"].tolist() == list("gedcbfa")
+
+
+def test_dataframe_sort_columns_by_position_and_id():
+    df = pd.DataFrame({1: [2, 1], "b": [1, 2]})
+    pager = DataFramePager(df)
+    assert pager.order({"column": "1"}).tolist() == [1, 0]
+    assert pager.order({"column": 1}).tolist() == [1, 0]
+    assert pager.order({"column": "b"}).tolist() == [0, 1]
+    with pytest.raises(KeyError):
+        pager.order({"column": "c"})
+
+
+def test_dataframe_sort_orders_are_cached(df):
+    pager = DataFramePager(df, max_sorts=2)
+    first = pager.order({"column": "value"})
+    assert pager.order({"column": "value", "ascending": None}) is first
+    pager.order({"column": "name"})
+    pager.order({"column": "name", "ascending": False})
+    assert pager.order({"column": "value"}) is not first
+    pager.clear()
+    assert not pager._orders
+
+
+def test_sql_pages(df, sql_pager):
+    assert len(sql_pager) == 7
+    assert sql_pager.columns == ["name", "value"]
+    assert sql_pager.page(0, 3)["name"].tolist() == ["e", "b", "a"]
+    assert sql_pager.page(2, 3)["name"].tolist() == ["g"]
+    assert sql_pager.page(None, None)["name"].tolist() == list("ebadcfg")
+
+
+@pytest.mark.parametrize("ascending", [True, None])
+def test_sql_sort_ascending(sql_pager, ascending):
+    sort = {"column": "name", "ascending": ascending}
+    assert sql_pager.page(0, 3, sort)["name"].tolist() == ["a", "b", "c"]
+    assert sql_pager.page(1, 3, sort)["name"].tolist() == ["d", "e", "f"]
+
+
+def test_sql_sort_descending_and_by_position(sql_pager):
+    sort = {"column": 0, "ascending": False}
+    assert sql_pager.page(0, 3, sort)["name"].tolist() == ["g", "f", "e"]
+
+
+def test_sql_and_dataframe_pagers_agree(df, sql_pager):
+    pager = DataFramePager(df)
+    for ascending in [True, False, None]:
+        sort = {"column": "name", "ascending": ascending}
+        assert (
+            sql_pager.page(1, 3, sort)["name"].tolist()
+            == pager.page(1, 3, sort)["name"].tolist()
+        )
+
+
+def test_sql_unknown_sort_column(sql_pager):
+    with pytest.raises(KeyError):
+        sql_pager.page(0, 3, {"column": "value; DROP TABLE data"})
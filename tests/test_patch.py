@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dash_google_charts._data import python_values
+from dash_google_charts._patch import compute_patch
+
+
+def apply_patch(rows, patch):
+    """
+    Apply a patch to a list of rows the way the browser applies it to a
+    DataTable.
+    """
+    rows = [list(row) for row in rows]
+    for operation in patch:
+        if isinstance(operation, list):
+            row, column, value = operation
+            rows[row][column] = value
+        elif operation["op"] == "replace":
+            rows[operation["row"]] = list(operation["values"])
+        elif operation["op"] == "insert":
+            row = operation["row"]
+            rows[row:row] = [list(new) for new in operation["rows"]]
+        elif operation["op"] == "delete":
+            del rows[operation["row"] : operation["row"] + operation["count"]]
+    return rows
+
+
+def dataframe_rows(df):
+    columns = [python_values(series) for _, series in df.items()]
+    return [list(row) for row in zip(*columns)]
+
+
+PREVIOUS = [["a", 1, 2.0], ["b", 2, 3.0], ["c", 3, 4.0]]
+
+
+@pytest.mark.parametrize(
+    "current",
+    [
+        PREVIOUS,
+        [["a", 1, 2.0], ["b", 5, 3.0], ["c", 3, 4.0]],
+        [["x", 9, 9.0], ["b", 2, 3.0], ["c", 3, 4.0]],
+        PREVIOUS + [["d", 4, 5.0], ["e", 5, 6.0]],
+        PREVIOUS[:1],
+        [],
+        [["a", None, 2.0], ["b", 2, 3.0], ["z", 3, 1.0], ["d", 4, 5.0]],
+    ],
+)
+def test_rows_round_trip(current):
+    patch = compute_patch(PREVIOUS, current)
+    assert apply_patch(PREVIOUS, patch) == current
+
+
+def test_rows_from_empty():
+    current = [["a", 1], ["b", 2]]
+    patch = compute_patch([], current)
+    assert patch == [{"op": "insert", "row": 0, "rows": current}]
+    assert apply_patch([], patch) == current
+
+
+def test_unchanged_table_has_empty_patch():
+    assert compute_patch(PREVIOUS, [list(row) for row in PREVIOUS]) == []
+
+
+def test_cell_updates_and_replacements():
+    current = [["a", 1, 2.0], ["b", 5, 3.0], ["x", 9, 9.0]]
+    assert compute_patch(PREVIOUS, current) == [
+        {"op": "replace", "row": 2, "values": ["x", 9, 9.0]},
+        [1, 1, 5],
+    ]
+
+
+def test_replace_threshold():
+    current = [["x", 9, 2.0], ["b", 2, 3.0], ["c", 3, 4.0]]
+    assert compute_patch(PREVIOUS, current, replace_threshold=0.5) == [
+        {"op": "replace", "row": 0, "values": ["x", 9, 2.0]}
+    ]
+    assert compute_patch(PREVIOUS, current, replace_threshold=1) == [
+        [0, 0, "x"],
+        [0, 1, 9],
+    ]
+
+
+def test_dataframes_round_trip():
+    previous = pd.DataFrame(
+        {
+            "name": ["a", "b", "c"],
+            "value": [1.0, np.nan, 3.0],
+            "time": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+        }
+    )
+    current = pd.DataFrame(
+        {
+            "name": ["a", "b", "c", "d"],
+            "value": [1.0, 2.0, np.nan, 4.0],
+            "time": pd.to_datetime(
+                ["2020-01-01", "2020-01-03", None, "2020-01-04"]
+            ),
+        }
+    )
+    patch = compute_patch(previous, current)
+    assert apply_patch(dataframe_rows(previous), patch) == dataframe_rows(
+        current
+    )
+    assert [2, 1, None] in patch
+
+
+def test_different_number_of_columns():
+    with pytest.raises(ValueError):
+        compute_patch([[1, 2]], [[1, 2, 3]])
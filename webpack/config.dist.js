@@ -6,6 +6,7 @@ var moduleDefinition = require('./moduleDefinition');
 var directories = require('./directories');
 
 var OccurrenceOrderPlugin = require('webpack').optimize.OccurrenceOrderPlugin;
+var WebpackDashDynamicImport = require('@plotly/webpack-dash-dynamic-import');
 
 var NODE_ENV = process.env.NODE_ENV || 'development';
 var environment = JSON.stringify(NODE_ENV);
@@ -26,7 +27,7 @@ module.exports = {
     'react-dom': 'ReactDOM',
   },
   module: moduleDefinition,
-  plugins: [new OccurrenceOrderPlugin(true)],
+  plugins: [new OccurrenceOrderPlugin(true), new WebpackDashDynamicImport()],
   optimization: {
     minimize: true
   },
@@ -37,6 +38,7 @@ module.exports = {
     library: LIBRARY_NAME + '/_components',
     libraryTarget: 'window',
     path: BUILD_PATH,
-    filename: LIBRARY_NAME + '.min.js'
+    filename: LIBRARY_NAME + '.min.js',
+    chunkFilename: LIBRARY_NAME + '-[name].js'
   }
 };
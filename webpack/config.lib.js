@@ -51,6 +51,7 @@ module.exports = {
     library: LIBRARY_NAME,
     libraryTarget: 'umd',
     path: path.join(directories.ROOT, 'lib/'),
-    filename: LIBRARY_NAME + '.min.js'
+    filename: LIBRARY_NAME + '.min.js',
+    chunkFilename: LIBRARY_NAME + '-[name].js'
   }
 };